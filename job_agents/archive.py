@@ -0,0 +1,75 @@
+"""
+Compressed, append-only archive of extracted job descriptions for re-screening without a browser.
+"""
+import gzip
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+from pydantic import BaseModel
+
+from .context import JobDescription
+
+
+DEFAULT_ARCHIVE_PATH = ".cache/descriptions.jsonl.gz"
+
+
+class ArchivedJob(BaseModel):
+    job_key: str
+    """The canonical job key"""
+
+    url: str
+    """The URL the description was extracted from"""
+
+    archived_at: str
+    """When the description was extracted"""
+
+    company: str
+    """The company name"""
+
+    title: str
+    """The job title"""
+
+    job_description: str
+    """The extracted job description"""
+
+    snapshot: str | None = None
+    """The page snapshot the description was extracted from, if archived"""
+
+    def to_job_description(self) -> JobDescription:
+        return JobDescription(company=self.company, title=self.title, job_description=self.job_description)
+
+
+class DescriptionArchive:
+    """
+    Gzip-compressed JSON lines of ArchivedJob records.
+    Each append writes its own gzip member, so the file is never rewritten and a crash
+    mid-run loses at most the record being written.
+    """
+    def __init__(self, path: str = DEFAULT_ARCHIVE_PATH):
+        self.path = Path(path)
+
+    def append(self, job_key: str, url: str, description: JobDescription, snapshot: str | None = None) -> None:
+        record = ArchivedJob(
+            job_key=job_key,
+            url=url,
+            archived_at=datetime.now().isoformat(timespec="seconds"),
+            company=description.company,
+            title=description.title,
+            job_description=description.job_description,
+            snapshot=snapshot,
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, "at", encoding="utf-8") as f:
+            f.write(record.model_dump_json() + "\n")
+
+    def latest(self) -> Dict[str, ArchivedJob]:
+        """Return the most recently archived record for each job key."""
+        records: Dict[str, ArchivedJob] = {}
+        if not self.path.exists():
+            return records
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = ArchivedJob.model_validate_json(line)
+                    records[record.job_key] = record
+        return records
@@ -0,0 +1,149 @@
+"""
+Batch screening: several extracted jobs scored together in one structured-output call.
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, List, Literal, Optional, Set, Tuple
+from pydantic import BaseModel
+
+from agents import Agent, Runner
+
+from .context import JobScreenContext, FitScore
+from .profile import CandidateProfile
+from .screener import screen_stats
+from .rate_limiter import limited_run_config
+from .metrics import TimingHooks
+from .snapshot import estimate_tokens
+
+
+class BatchFitScore(BaseModel):
+    job_id: int
+    """The id of the job in the batch"""
+
+    fit_score: Literal[1,2,3,4,5]
+    """The fit score of the job posting"""
+
+    reason: str
+    """The reason for the fit score"""
+
+
+class BatchFitScores(BaseModel):
+    scores: List[BatchFitScore]
+    """One fit score per job in the batch"""
+
+
+INSTRUCTIONS = (
+    "You are a job screening agent. You are given several job descriptions, each under a 'Job <id>' heading. \n"
+    "Score each job independently of the others: analyze how well it matches the candidate, "
+    "and rate its fit between 1 and 5 (1=poor fit, 5=excellent fit). "
+    "A job that hits a deal breaker or misses a must have is a poor fit. \n"
+    "Return exactly one score per job, with the job_id of its heading and a short reason. "
+)
+
+
+def get_batch_screen_agent(profile: Optional[CandidateProfile] = None, model: str = "gpt-4.1") -> Agent:
+    """With a candidate profile the instructions are a fixed prefix shared by every batch."""
+    instructions = INSTRUCTIONS
+    if profile is not None:
+        instructions += "\n\nCandidate profile:\n" + profile.to_prompt()
+    return Agent(
+        name="BatchJobScreen",
+        instructions=instructions,
+        output_type=BatchFitScores,
+        model=model,
+    )
+
+
+class BatchScreener:
+    """
+    Collects extracted jobs and scores them together in one BatchJobScreen call.
+
+    A batch is sent once its estimated description tokens reach max_tokens, it holds
+    max_jobs jobs, or max_wait seconds have passed since its first job arrived. Jobs the
+    batch output does not score come back as None so the caller can screen them singly.
+    """
+    def __init__(self,
+                 resume: str,
+                 preferences: str,
+                 profile: Optional[CandidateProfile] = None,
+                 max_tokens: int = 8000,
+                 max_wait: float = 3.0,
+                 max_jobs: int = 8,
+                 model: str = "gpt-4.1"):
+        self.agent = get_batch_screen_agent(profile, model=model)
+        self.resume = resume
+        self.preferences = preferences
+        self.profile = profile
+        self.max_tokens = max_tokens
+        self.max_wait = max_wait
+        self.max_jobs = max_jobs
+        self._pending: List[Tuple[JobScreenContext, asyncio.Future]] = []
+        self._pending_tokens = 0
+        self._timer: Optional[asyncio.Task] = None
+        self._batches: Set[asyncio.Task] = set()
+
+    async def score(self, context: JobScreenContext) -> Optional[FitScore]:
+        """Queue the job for the next batch and wait for its fit score, or None if the batch missed it."""
+        tokens = estimate_tokens(context.job_description)
+        if self._pending and self._pending_tokens + tokens > self.max_tokens:
+            self._flush()
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((context, future))
+        self._pending_tokens += tokens
+        if self._pending_tokens >= self.max_tokens or len(self._pending) >= self.max_jobs:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+        return await future
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.max_wait)
+        self._timer = None
+        self._flush()
+
+    def _flush(self) -> None:
+        """Send the pending jobs as one batch in its own task, so cancelling one job does not cancel the batch."""
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+        batch, self._pending, self._pending_tokens = self._pending, [], 0
+        if batch:
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    def _batch_input(self, contexts: List[JobScreenContext]) -> str:
+        parts = []
+        if self.profile is None:
+            parts.append(f"Resume:\n{self.resume}\n\nPreferences:\n{self.preferences}")
+        for job_id, context in enumerate(contexts):
+            parts.append(f"Job {job_id}\nCompany: {context.company}\nTitle: {context.title}\n{context.job_description}")
+        return "\n\n".join(parts)
+
+    async def _run_batch(self, batch: List[Tuple[JobScreenContext, asyncio.Future]]) -> None:
+        batch = [(context, future) for context, future in batch if not future.done()]
+        if not batch:
+            return
+        start = time.monotonic()
+        scores: Dict[int, BatchFitScore] = {}
+        tokens = 0
+        try:
+            result = await Runner.run(
+                self.agent,
+                input=self._batch_input([context for context, _ in batch]),
+                run_config=limited_run_config(workflow_name=f"batch screen of {len(batch)} jobs"),
+                hooks=TimingHooks(),
+            )
+            tokens = sum(r.usage.total_tokens for r in result.raw_responses)
+            for score in result.final_output.scores:
+                if 0 <= score.job_id < len(batch) and score.job_id not in scores:
+                    scores[score.job_id] = score
+        except Exception as e:
+            logging.warning(f"Batch screen of {len(batch)} jobs failed: {e}")
+        screen_stats.record("batch", self.agent.model, len(scores), time.monotonic() - start, tokens)
+        logging.info(f"Batch screened {len(scores)} of {len(batch)} jobs in {time.monotonic() - start:.1f}s")
+        for job_id, (_, future) in enumerate(batch):
+            score = scores.get(job_id)
+            if not future.done():
+                future.set_result(FitScore(fit_score=score.fit_score, reason=score.reason) if score else None)
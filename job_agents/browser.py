@@ -0,0 +1,417 @@
+"""
+Playwright MCP server and a pool of long-lived browser sessions shared across job screens.
+"""
+import asyncio
+import logging
+import re
+import time
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlparse
+
+from agents.mcp.server import MCPServerStdio
+
+from .domains import get_domain_limiter
+from .metrics import run_metrics
+from .snapshot import shrink_snapshot, estimate_tokens, snapshot_stats, MAX_SNAPSHOT_CHARS
+from .stages import backoff_delay
+
+
+PLAYWRIGHT_PARAMS = {
+    "command": "npx",
+    "args": ["@playwright/mcp@latest", "--config", "playwright_config/config.json"],
+}
+
+
+READY_POLL_SECONDS = 0.5
+
+READY_STABLE_POLLS = 3
+"""Identical snapshots in a row after which a page without job markers counts as settled"""
+
+READY_MIN_FRACTION = 0.5
+"""Share of the requested wait a page without job markers must be given, so a static loading shell is not taken as the page"""
+
+JOB_MARKERS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r"responsibilities", r"qualifications", r"requirements", r"what you.ll do",
+        r"about (the|this) (role|position|job)", r"apply (now|for this job)",
+    )
+]
+"""Section headings that show a job description has rendered"""
+
+
+def tool_result_text(result) -> str:
+    """Join the text content blocks of an MCP tool result."""
+    return "\n".join(c.text for c in result.content if getattr(c, "text", None))
+
+
+def has_job_markers(text: str, required: int = 2) -> bool:
+    """Whether the page text contains enough job description section markers."""
+    return sum(1 for marker in JOB_MARKERS if marker.search(text)) >= required
+
+
+class ReadinessStats:
+    """Per-domain record of how long pages took to become ready and why the wait ended."""
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the per-domain waits and outcomes, so the readiness summary covers only the new run."""
+        self.waits: Dict[str, List[float]] = defaultdict(list)
+        self.outcomes: Dict[str, Counter] = defaultdict(Counter)
+
+    def record(self, domain: str, seconds: float, outcome: str) -> None:
+        self.waits[domain].append(seconds)
+        self.outcomes[domain][outcome] += 1
+
+    def summary(self) -> Dict[str, dict]:
+        """Return the count, mean and max readiness time and wait outcomes per domain."""
+        return {
+            domain: {
+                "count": len(waits),
+                "mean_seconds": round(sum(waits) / len(waits), 2),
+                "max_seconds": round(max(waits), 2),
+                "outcomes": dict(self.outcomes[domain]),
+            }
+            for domain, waits in self.waits.items()
+        }
+
+    def log_summary(self) -> None:
+        for domain, stats in sorted(self.summary().items()):
+            logging.info(f"Page readiness for {domain}: {stats}")
+
+
+readiness_stats = ReadinessStats()
+
+
+class PlaywrightServer(MCPServerStdio):
+    """Sub-class MCPServerStdio so only specified tools are available."""
+    last_snapshot: str | None = None
+    """Text of the most recent page snapshot returned to the agents"""
+
+    current_url: str | None = None
+    """The URL of the most recent browser_navigate call"""
+
+    async def list_tools(self, *args, **kwargs):
+        all_tools = await super().list_tools(*args, **kwargs)
+        return [t for t in all_tools if (t.name in ["browser_wait_for","browser_navigate"])]
+
+    shrink_snapshots: bool = True
+    """Whether page snapshots are pruned before they reach the model"""
+
+    max_snapshot_chars: int = MAX_SNAPSHOT_CHARS
+    """Cap on the size of a pruned snapshot"""
+
+    async def call_tool(self, tool_name, arguments, *args, **kwargs):
+        if tool_name == "browser_navigate":
+            self.current_url = (arguments or {}).get("url")
+        if tool_name == "browser_wait_for" and set(arguments or {}) == {"time"}:
+            # A plain timed wait is treated as an upper bound rather than a fixed delay
+            result = await self._wait_until_ready(float(arguments["time"]), *args, **kwargs)
+        elif tool_name == "browser_navigate":
+            result = await self._navigate(arguments, *args, **kwargs)
+        else:
+            result = await super().call_tool(tool_name, arguments, *args, **kwargs)
+        if tool_name in ["browser_wait_for","browser_navigate"]:
+            if self.shrink_snapshots:
+                result = self._shrink_result(tool_name, result)
+            self.last_snapshot = tool_result_text(result)
+        return result
+
+    async def _navigate(self, arguments, *args, **kwargs):
+        """Navigate within the domain limiter's per-host limits, recording the latency and outcome."""
+        limiter = get_domain_limiter()
+        url = self.current_url or ""
+        async with limiter.slot(url):
+            start = time.monotonic()
+            try:
+                result = await super().call_tool("browser_navigate", arguments, *args, **kwargs)
+            except Exception:
+                limiter.record(url, time.monotonic() - start, True)
+                raise
+            limiter.record(url, time.monotonic() - start, bool(getattr(result, "isError", False)))
+            return result
+
+    def _shrink_result(self, tool_name: str, result):
+        """Return a copy of a tool result with every text block passed through the snapshot shrinker."""
+        before = after = 0
+        content = []
+        for block in result.content:
+            text = getattr(block, "text", None)
+            if text:
+                shrunk = shrink_snapshot(text, self.max_snapshot_chars)
+                before += estimate_tokens(text)
+                after += estimate_tokens(shrunk)
+                block = block.model_copy(update={"text": shrunk})
+            content.append(block)
+        snapshot_stats.record(tool_name, before, after)
+        return result.model_copy(update={"content": content})
+
+    async def _wait_until_ready(self, max_seconds: float, *args, **kwargs):
+        """
+        Poll page snapshots until job description markers appear, or the content has stopped
+        changing and a minimum share of the wait has passed, for at most max_seconds, and
+        return the last snapshot.
+        """
+        start = time.monotonic()
+        previous = None
+        unchanged = 0
+        while True:
+            result = await super().call_tool("browser_snapshot", {}, *args, **kwargs)
+            text = tool_result_text(result)
+            elapsed = time.monotonic() - start
+            unchanged = unchanged + 1 if text == previous else 0
+            outcome = None
+            if has_job_markers(text):
+                outcome = "markers"
+            elif elapsed >= max_seconds:
+                outcome = "timeout"
+            elif unchanged >= READY_STABLE_POLLS - 1 and elapsed >= max_seconds * READY_MIN_FRACTION:
+                outcome = "stable"
+            if outcome:
+                domain = urlparse(self.current_url or "").netloc.replace("www.", "") or "unknown"
+                readiness_stats.record(domain, elapsed, outcome)
+                return result
+            previous = text
+            await asyncio.sleep(min(READY_POLL_SECONDS, max(max_seconds - elapsed, 0)))
+
+
+class _PooledSession:
+    """A warm Playwright MCP server together with its recycle bookkeeping."""
+    def __init__(self, server: PlaywrightServer, slot: int):
+        self.server = server
+        self.slot = slot
+        self.uses = 0
+        self.created_at = time.monotonic()
+        self.retired = asyncio.Event()
+
+
+class PlaywrightPool:
+    """
+    Keeps warm Playwright MCP sessions and checks them out one job at a time.
+
+    Each session is owned by a keeper task that opens the server, waits until the
+    session is retired and then closes it, so the MCP stdio client is always entered
+    and exited from the same task. Retired sessions are replaced until the pool closes.
+    resize() changes how many of the size slots are kept, e.g. to follow the concurrency limit.
+    A server that fails to launch is retried with exponential backoff; after max_launch_failures
+    failures in a row, checkouts fail at once with the launch error until a launch succeeds.
+    """
+    def __init__(self,
+                 size: int = 5,
+                 max_uses: int = 20,
+                 max_age_seconds: float = 600,
+                 client_session_timeout_seconds: float = 60,
+                 health_check_timeout: float = 10,
+                 checkout_timeout: float = 300,
+                 max_launch_failures: int = 3,
+                 params: Optional[dict] = None):
+        self.size = size
+        self.target = size
+        """Slots currently kept, at most size"""
+        self.params = params or PLAYWRIGHT_PARAMS
+        """Stdio parameters of the MCP server each session launches"""
+        self.max_uses = max_uses
+        self.max_age_seconds = max_age_seconds
+        self.client_session_timeout_seconds = client_session_timeout_seconds
+        self.health_check_timeout = health_check_timeout
+        self.checkout_timeout = checkout_timeout
+        self.max_launch_failures = max_launch_failures
+        self._launch_failures = 0
+        self._launch_error: Optional[Exception] = None
+        # None in the queue wakes a waiting checkout to fail with the launch error
+        self._idle: asyncio.Queue[Optional[_PooledSession]] = asyncio.Queue()
+        self._live: Set[_PooledSession] = set()
+        self._keepers: Dict[int, asyncio.Task] = {}
+        self._launched = False
+        self._closed = False
+        self._closing = asyncio.Event()
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.recycled = 0
+
+    async def __aenter__(self) -> "PlaywrightPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Open the pool. Browser sessions are launched on the first checkout, so a run that never browses launches none."""
+        self._closed = False
+        self._closing.clear()
+        logging.info(f"Started Playwright pool with up to {self.size} sessions")
+
+    def _launch_keepers(self) -> None:
+        """Launch a keeper task, which warms up one browser session, for every kept slot without one."""
+        if self._closed:
+            return
+        self._launched = True
+        for slot in range(self.target):
+            if slot not in self._keepers or self._keepers[slot].done():
+                self._keepers[slot] = asyncio.create_task(self._keep(slot))
+
+    def resize(self, size: int) -> None:
+        """
+        Keep size sessions, between 1 and the pool size. Growing launches sessions for the new slots
+        once the pool is in use; shrinking retires idle sessions above it now and busy ones on release.
+        """
+        target = max(1, min(self.size, size))
+        if target == self.target:
+            return
+        logging.info(f"Resizing Playwright pool from {self.target} to {target} sessions")
+        self.target = target
+        if self._launched:
+            self._launch_keepers()
+        idle = []
+        while not self._idle.empty():
+            idle.append(self._idle.get_nowait())
+        for session in idle:
+            if session is None:
+                continue
+            if session.slot >= self.target:
+                self._retire(session, "pool shrunk")
+            else:
+                self._idle.put_nowait(session)
+
+    async def close(self) -> None:
+        """Retire every session and wait for the keepers to shut their servers down."""
+        self._closed = True
+        self._closing.set()
+        for session in list(self._live):
+            session.retired.set()
+        await asyncio.gather(*self._keepers.values(), return_exceptions=True)
+        self._keepers = {}
+        self._launched = False
+        logging.info(f"Closed Playwright pool: {self.stats()}")
+
+    async def _keep(self, slot: int) -> None:
+        """Own one pool slot: open a server, lend it out until retired, then replace it while the slot is kept."""
+        while not self._closed and slot < self.target:
+            started = time.monotonic()
+            try:
+                async with PlaywrightServer(
+                    params=self.params,
+                    client_session_timeout_seconds=self.client_session_timeout_seconds,
+                ) as server:
+                    run_metrics.record("browser", "playwright startup", time.monotonic() - started)
+                    self._launch_failures, self._launch_error = 0, None
+                    if self._closed:
+                        # The pool closed while this server was starting, so nobody will retire it
+                        break
+                    session = _PooledSession(server, slot)
+                    self._live.add(session)
+                    self._idle.put_nowait(session)
+                    await session.retired.wait()
+                    self._live.discard(session)
+            except Exception as e:
+                self._launch_failures += 1
+                delay = backoff_delay(self._launch_failures - 1, base=1.0, maximum=60.0)
+                logging.error(f"Playwright pool session {slot} failed, relaunching in {delay:.1f}s: {e}")
+                if self._launch_failures >= self.max_launch_failures and self._launch_error is None:
+                    self._launch_error = e
+                    self._idle.put_nowait(None)
+                try:
+                    # Cut the backoff short if the pool closes
+                    await asyncio.wait_for(self._closing.wait(), timeout=delay)
+                except TimeoutError:
+                    pass
+
+    def _retire(self, session: _PooledSession, reason: str) -> None:
+        """Mark a session for shutdown; its keeper replaces it unless the pool is closing."""
+        if not session.retired.is_set():
+            self.recycled += 1
+            logging.info(f"Recycling Playwright session after {session.uses} uses ({reason})")
+            session.retired.set()
+
+    def _expired(self, session: _PooledSession) -> str | None:
+        """Return the recycle reason if the session has hit its use or age limit or its slot is no longer kept."""
+        if session.slot >= self.target:
+            return "pool shrunk"
+        if session.uses >= self.max_uses:
+            return "max uses"
+        if time.monotonic() - session.created_at >= self.max_age_seconds:
+            return "max age"
+        return None
+
+    async def _healthy(self, session: _PooledSession) -> bool:
+        """Check that the MCP server still answers and exposes the navigation tool."""
+        try:
+            tools = await asyncio.wait_for(session.server.list_tools(), timeout=self.health_check_timeout)
+            return any(t.name == "browser_navigate" for t in tools)
+        except Exception as e:
+            logging.warning(f"Playwright session failed health check: {e}")
+            return False
+
+    async def _acquire(self) -> _PooledSession:
+        """Wait for an idle session, skipping any that are expired or unhealthy."""
+        self._launch_keepers()
+        while True:
+            if self._launch_error is not None:
+                raise RuntimeError(f"Playwright sessions failed to launch: {self._launch_error}")
+            session = await asyncio.wait_for(self._idle.get(), timeout=self.checkout_timeout)
+            if session is None:
+                if self._launch_error is not None:
+                    # Pass the wake-up on to the next waiting checkout
+                    self._idle.put_nowait(None)
+                continue
+            reason = self._expired(session)
+            if reason:
+                self._retire(session, reason)
+                continue
+            if not await self._healthy(session):
+                self._retire(session, "failed health check")
+                continue
+            return session
+
+    async def _release(self, session: _PooledSession) -> None:
+        """Reset the browser to a fresh isolated context and return the session to the pool."""
+        reason = self._expired(session)
+        if reason:
+            self._retire(session, reason)
+            return
+        try:
+            # With "isolated": true, closing the page drops the browser context so the
+            # next browser_navigate starts from a clean profile.
+            await asyncio.wait_for(session.server.call_tool("browser_close", {}), timeout=self.health_check_timeout)
+        except Exception as e:
+            self._retire(session, f"reset failed: {e}")
+            return
+        self._idle.put_nowait(session)
+
+    @asynccontextmanager
+    async def session(self):
+        """Check out a warm Playwright server for one job."""
+        start = time.monotonic()
+        session = await self._acquire()
+        wait = time.monotonic() - start
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        run_metrics.record("browser", "session checkout", wait)
+        if wait > 1:
+            logging.info(f"Waited {wait:.1f}s for a Playwright session")
+        session.server.last_snapshot = None
+        session.server.current_url = None
+        try:
+            yield session.server
+        except BaseException:
+            # The browser may be stuck mid-navigation, so never hand it to another job
+            session.uses += 1
+            self._retire(session, "job error")
+            raise
+        session.uses += 1
+        await self._release(session)
+
+    def stats(self) -> dict:
+        """Return checkout wait times and recycle counts."""
+        avg_wait = self.total_wait / self.checkouts if self.checkouts else 0
+        return {
+            "checkouts": self.checkouts,
+            "avg_wait_seconds": round(avg_wait, 2),
+            "max_wait_seconds": round(self.max_wait, 2),
+            "recycled": self.recycled,
+        }
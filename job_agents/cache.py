@@ -0,0 +1,122 @@
+"""
+Persistent SQLite cache of screening results, so unchanged jobs are not screened again.
+"""
+import hashlib
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+from .context import SummaryAgentOutput
+
+
+DEFAULT_CACHE_PATH = ".cache/results.sqlite"
+
+
+def content_hash(text: Optional[str]) -> str:
+    """Return a short stable hash of a piece of text."""
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()[:16]
+
+
+class ResultCache:
+    """
+    SQLite cache of SummaryAgentOutput results.
+
+    Entries are keyed by canonical job key plus the hashes of the resume and preferences
+    they were screened against and of the screener configuration (pre-screen, screen mode,
+    cascade), so a changed resume, preferences file or screener misses the cache.
+    The job description hash is stored with each entry; a lookup that passes a different
+    description hash treats the entry as stale. Entries expire after ttl_seconds and the
+    least recently used ones are evicted beyond max_entries.
+    """
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_seconds: float = 7 * 24 * 3600, max_entries: int = 5000):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(results)")}
+        if columns and "screener_hash" not in columns:
+            # Entries written before the screener configuration was part of the key may be pre-screen verdicts
+            logging.info("Clearing result cache written without screener configuration")
+            self._db.execute("DROP TABLE results")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " job_key TEXT NOT NULL,"
+            " resume_hash TEXT NOT NULL,"
+            " preferences_hash TEXT NOT NULL,"
+            " screener_hash TEXT NOT NULL,"
+            " description_hash TEXT NOT NULL,"
+            " result TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL,"
+            " PRIMARY KEY (job_key, resume_hash, preferences_hash, screener_hash))"
+        )
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def get(self,
+            job_key: str,
+            resume_hash: str,
+            preferences_hash: str,
+            screener_hash: str,
+            description_hash: Optional[str] = None) -> Optional[SummaryAgentOutput]:
+        """Return the cached result, or None if missing, expired or screened against another description."""
+        key = (job_key, resume_hash, preferences_hash, screener_hash)
+        row = self._db.execute(
+            "SELECT description_hash, result, created_at FROM results"
+            " WHERE job_key = ? AND resume_hash = ? AND preferences_hash = ? AND screener_hash = ?", key
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        stored_description_hash, result, created_at = row
+        now = time.time()
+        if now - created_at > self.ttl_seconds:
+            self._db.execute("DELETE FROM results"
+                             " WHERE job_key = ? AND resume_hash = ? AND preferences_hash = ? AND screener_hash = ?", key)
+            self._db.commit()
+            self.misses += 1
+            return None
+        if description_hash is not None and description_hash != stored_description_hash:
+            self.misses += 1
+            return None
+        self._db.execute(
+            "UPDATE results SET accessed_at = ?"
+            " WHERE job_key = ? AND resume_hash = ? AND preferences_hash = ? AND screener_hash = ?",
+            (now, *key)
+        )
+        self._db.commit()
+        self.hits += 1
+        return SummaryAgentOutput.model_validate_json(result)
+
+    def put(self,
+            job_key: str,
+            resume_hash: str,
+            preferences_hash: str,
+            screener_hash: str,
+            description_hash: str,
+            result: SummaryAgentOutput) -> None:
+        """Store a result and evict the least recently used entries beyond max_entries."""
+        now = time.time()
+        self._db.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (job_key, resume_hash, preferences_hash, screener_hash, description_hash, result.model_dump_json(), now, now)
+        )
+        self._db.execute(
+            "DELETE FROM results WHERE rowid IN ("
+            " SELECT rowid FROM results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        self._db.commit()
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def log_stats(self) -> None:
+        logging.info(f"Result cache: {self.hits} hits, {self.misses} misses")
@@ -1,7 +1,12 @@
 from agents import Agent, function_tool, ModelSettings
 from pydantic import BaseModel
-import requests
+from typing import Dict, List, Tuple
+import asyncio
+import time
+import httpx
 from .context import JobScreenContext
+from .domains import get_domain_limiter
+from .stages import is_transient
 
 
 class UrlVetterOutput(BaseModel):
@@ -18,37 +23,133 @@ class UrlVetterOutput(BaseModel):
     """The error message if the url is not reachable"""
 
 
+class ReachabilityChecker:
+    """
+    Non-blocking URL reachability checks over one shared keep-alive HTTP client.
+
+    Each check tries a HEAD request first and confirms any failure with a ranged GET,
+    since many career sites reject HEAD. Requests go through the shared domain limiter,
+    so bulk checks do not burst a single site. Recent results are remembered so a URL checked
+    in bulk is not fetched again by the UrlChecker agent, unless the failure was transient.
+    """
+    def __init__(self,
+                 timeout: float = 15,
+                 connect_timeout: float = 5,
+                 max_connections: int = 50,
+                 result_ttl: float = 300):
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.max_connections = max_connections
+        self.result_ttl = result_ttl
+        self._client: httpx.AsyncClient | None = None
+        self._results: Dict[str, Tuple[float, UrlVetterOutput]] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared HTTP client, created on first use inside the running event loop."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections),
+                headers={"User-Agent": "Mozilla/5.0"},
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _request(self, url: str) -> httpx.Response:
+        """HEAD the URL, falling back to a ranged GET when HEAD fails or is rejected."""
+        try:
+            resp = await self.client.head(url)
+            if resp.is_success or resp.is_redirect:
+                return resp
+        except httpx.HTTPError:
+            pass
+        async with self.client.stream("GET", url, headers={"Range": "bytes=0-1023"}) as resp:
+            return resp
+
+    async def check(self, url: str) -> UrlVetterOutput:
+        """Check if the given URL is reachable and return the final URL and status code."""
+        cached = self._results.get(url)
+        if cached and time.monotonic() - cached[0] < self.result_ttl:
+            return cached[1]
+        limiter = get_domain_limiter()
+        async with limiter.slot(url):
+            start = time.monotonic()
+            try:
+                resp = await self._request(url)
+                result = UrlVetterOutput(
+                    url=str(resp.url),              # final URL after redirects
+                    status_code=resp.status_code,
+                    reachable=resp.status_code < 400,
+                    error_message=None,
+                )
+            except httpx.HTTPError as e:
+                result = UrlVetterOutput(
+                    url=url,
+                    status_code=-1,
+                    reachable=False,
+                    error_message=str(e) or type(e).__name__,
+                )
+            limiter.record(url, time.monotonic() - start, not result.reachable)
+        if result.reachable or not is_transient(result.error_message or f"Status code: {result.status_code}"):
+            # Transient failures are not remembered, so a retry checks again
+            self._results[url] = (time.monotonic(), result)
+        return result
+
+    async def fetch(self, url: str) -> httpx.Response:
+        """GET a page body over the shared client, within the domain limiter's per-host limits."""
+        limiter = get_domain_limiter()
+        async with limiter.slot(url):
+            start = time.monotonic()
+            try:
+                resp = await self.client.get(url)
+            except httpx.HTTPError:
+                limiter.record(url, time.monotonic() - start, True)
+                raise
+            limiter.record(url, time.monotonic() - start, resp.status_code >= 400)
+            return resp
+
+    async def check_many(self, urls: List[str]) -> Dict[str, UrlVetterOutput]:
+        """Check a whole list of URLs concurrently, keyed by the requested URL."""
+        results = await asyncio.gather(*(self.check(url) for url in urls))
+        return dict(zip(urls, results))
+
+
+_checker = ReachabilityChecker()
+
+
+def get_reachability_checker() -> ReachabilityChecker:
+    """Return the process-wide reachability checker."""
+    return _checker
+
+
+def configure_reachability_checker(**kwargs) -> ReachabilityChecker:
+    """Replace the process-wide reachability checker with new timeouts and limits."""
+    global _checker
+    _checker = ReachabilityChecker(**kwargs)
+    return _checker
+
+
 @function_tool
-def check_url_reachability(url: str) -> dict:
+async def check_url_reachability(url: str) -> dict:
     """
-    Check if the given URL is reachable with a GET request and return the status code.
+    Check if the given URL is reachable with an HTTP request and return the status code.
 
     Args:
-        url: The URL to check  
+        url: The URL to check
 
     Returns:
         A dictionary containing the URL, status code, and error message
     """
-    try:
-        resp = requests.get(
-            url,
-            allow_redirects=True,
-            timeout=15,
-            headers={"User-Agent": "Mozilla/5.0"}
-        )
-        return {
-            "url": resp.url,        # final URL after redirects
-            "status_code": resp.status_code,
-            "reachable": resp.ok,   # True if 200 ≤ status < 400
-            "error_message": None,
-        }
-    except requests.RequestException as e:
-        return {
-            "url": url,
-            "status_code": -1,
-            "reachable": False,
-            "error_message": str(e),
-        }
+    result = await get_reachability_checker().check(url)
+    return result.model_dump()
 
 
 INSTRUCTIONS = (
@@ -67,4 +168,4 @@ def get_url_checker_agent():
         model_settings=ModelSettings(tool_choice='required'),
         output_type=UrlVetterOutput,
         model="gpt-4o-mini",
-    ) 
\ No newline at end of file
+    )
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""
+Adaptive limit on in-flight job screens: additive increase while screens are healthy,
+multiplicative decrease on timeouts, rate limiting or memory pressure.
+"""
+import logging
+import re
+import time
+from typing import List, Optional, Tuple
+
+
+CONGESTION_CAUSES: List[Tuple[str, re.Pattern]] = [
+    ("rate limited (429)", re.compile(r"\b429\b|rate.?limit", re.IGNORECASE)),
+    # MCP request timeouts and browser session checkout timeouts, not slow job sites
+    ("MCP timeout", re.compile(r"timed out while waiting|TimeoutError", re.IGNORECASE)),
+    # Browser stages past their deadline, usually a navigation stuck behind an overloaded browser
+    ("browser stage timeout", re.compile(r"\b(?:inspect|extract) stage timed out", re.IGNORECASE)),
+]
+"""Error message patterns that mean the pipeline is overloaded rather than the job being bad"""
+
+
+def congestion_cause(error_message: Optional[str]) -> Optional[str]:
+    """Return the congestion signal in a failed screen's error message, if any."""
+    for cause, pattern in CONGESTION_CAUSES:
+        if error_message and pattern.search(error_message):
+            return cause
+    return None
+
+
+def memory_used_fraction() -> Optional[float]:
+    """Fraction of host memory in use from /proc/meminfo, or None where that is unavailable."""
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as f:
+            info = {line.split(":")[0]: int(line.split()[1]) for line in f if line.split()[1:]}
+        return 1 - info["MemAvailable"] / info["MemTotal"]
+    except (OSError, KeyError, ValueError, ZeroDivisionError):
+        return None
+
+
+class ConcurrencyController:
+    """
+    AIMD controller for the number of in-flight screens, kept between minimum and maximum.
+
+    After limit healthy screens in a row the limit grows by one. A screen is healthy
+    if it succeeded within latency_factor times the running average latency. A timeout,
+    a 429 or host memory above memory_threshold, including on an attempt that is then
+    retried, cuts the limit by decrease_factor, at
+    most once per cooldown so one burst of failures counts once. Other failures, such as
+    unreachable pages, leave the limit alone.
+    """
+    def __init__(self,
+                 initial: int = 5,
+                 minimum: int = 1,
+                 maximum: int = 10,
+                 latency_factor: float = 2.0,
+                 decrease_factor: float = 0.5,
+                 memory_threshold: float = 0.9,
+                 cooldown: float = 30):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = max(minimum, min(maximum, initial))
+        self.latency_factor = latency_factor
+        self.decrease_factor = decrease_factor
+        self.memory_threshold = memory_threshold
+        self.cooldown = cooldown
+        self.changes: List[Tuple[int, int, str]] = []
+        """Every change as (old limit, new limit, cause)"""
+        self._streak = 0
+        self._avg_latency: Optional[float] = None
+        self._last_decrease = float("-inf")
+
+    @property
+    def adaptive(self) -> bool:
+        return self.minimum < self.maximum
+
+    def _set(self, limit: int, cause: str) -> None:
+        limit = max(self.minimum, min(self.maximum, limit))
+        if limit != self.limit:
+            logging.info(f"Concurrency {self.limit} -> {limit}: {cause}")
+            self.changes.append((self.limit, limit, cause))
+            self.limit = limit
+
+    def _decrease(self, cause: str) -> None:
+        self._streak = 0
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self._set(int(self.limit * self.decrease_factor), cause)
+
+    def record(self, latency: float, failed: bool, error_message: Optional[str] = None) -> None:
+        """Update the limit with the outcome of one finished screen or failed screening attempt."""
+        if not self.adaptive:
+            return
+        cause = congestion_cause(error_message) if failed else None
+        if cause:
+            self._decrease(cause)
+            return
+        if failed:
+            return
+        if latency < 1:
+            # Cache hits and other instant results say nothing about load
+            return
+        healthy = self._avg_latency is None or latency <= self.latency_factor * self._avg_latency
+        self._avg_latency = latency if self._avg_latency is None else 0.8 * self._avg_latency + 0.2 * latency
+        if not healthy:
+            self._streak = 0
+            return
+        self._streak += 1
+        if self._streak >= self.limit:
+            self._streak = 0
+            self._set(self.limit + 1, f"{self.limit} healthy screens in a row (avg latency {self._avg_latency:.1f}s)")
+
+    def check_memory(self) -> None:
+        """Back off if the host is running low on memory, e.g. from too many Chromium instances."""
+        if not self.adaptive:
+            return
+        used = memory_used_fraction()
+        if used is not None and used >= self.memory_threshold:
+            self._decrease(f"host memory {used:.0%} used")
+
+    def log_summary(self) -> None:
+        if self.changes:
+            logging.info(f"Concurrency changed {len(self.changes)} times, ending at {self.limit}: {self.changes}")
@@ -35,6 +35,12 @@ class JobScreenContext(BaseModel):
     reason: str = None
     """A short explanation of the fit score"""
 
+    tier: str = None
+    """The screening tier (model, or prescreen) that produced the fit score"""
+
+    stage: str = None
+    """The pipeline stage running now, or the one that last ran if the chain failed"""
+
     failed: bool = False
     """The status of the job screening agent."""
 
@@ -52,6 +58,7 @@ class SummaryAgentOutput(BaseModel):
     title: str | None = None
     fit_score: Literal[0,1,2,3,4,5] | None = None
     reason: str | None = None
+    tier: str | None = None
     failed: bool | None = False
     error_message: str | None = None
 
@@ -76,6 +83,8 @@ class SummaryAgentOutput(BaseModel):
                 lines.append(f"    {wr}")
         else:
             lines.append("    ")
+        if self.tier:
+            lines.append(f"tier:           {self.tier}")
         lines.append(f"failed:         {failed}")
         lines.append("error_message:")
         if error_message:
@@ -98,17 +107,31 @@ async def fetch_job_and_user_info(ctx: RunContextWrapper[JobScreenContext]) -> d
             "preferences": ctx.context.preferences}
 
 
+@function_tool
+async def fetch_job_description(ctx: RunContextWrapper[JobScreenContext]) -> dict:
+    """Fetch the company, job title and job description from the context"""
+    return {"company": ctx.context.company,
+            "title": ctx.context.title,
+            "job_description": ctx.context.job_description}
+
+
+def summarize_context(context: JobScreenContext) -> SummaryAgentOutput:
+    """Build the job screening result from the context"""
+    return SummaryAgentOutput(
+        url=context.url,
+        company=context.company,
+        title=context.title,
+        fit_score=context.fit_score,
+        reason=context.reason,
+        tier=context.tier,
+        failed=context.failed,
+        error_message=context.error_message)
+
+
 @function_tool
 async def fetch_job_screen_result(ctx: RunContextWrapper[JobScreenContext]) -> SummaryAgentOutput:
     """Fetch the job screening result from the context"""
-    return SummaryAgentOutput(
-        url=ctx.context.url,
-        company=ctx.context.company,
-        title=ctx.context.title,
-        fit_score=ctx.context.fit_score,
-        reason=ctx.context.reason,
-        failed=ctx.context.failed,
-        error_message=ctx.context.error_message)
+    return summarize_context(ctx.context)
 
 
 # Handoff functions and handoff input types
@@ -127,6 +150,11 @@ class FitScore(BaseModel):
     """The reason for the fit score"""
 
 
+class ConfidentFitScore(FitScore):
+    confidence: float
+    """How confident the screener is in the fit score, from 0 to 1"""
+
+
 class JobDescription(BaseModel):
     company: str
     """The company name"""
@@ -156,6 +184,13 @@ async def record_inspection(ctx: RunContextWrapper[JobScreenContext], inspection
     # print(f"\nPassed inspection result:\n\n{repr(inspection)}")
 
 
+async def record_rejection(ctx: RunContextWrapper[JobScreenContext], inspection: InspectionResult):
+    """Record a page that is not a single job description as a failed screen"""
+    ctx.context.error_message = inspection.inspection_reason
+    ctx.context.failed = True
+    logging.warning(f"Unable to screen job posting: {repr(inspection)}")
+
+
 async def record_url(ctx: RunContextWrapper[JobScreenContext], url: UrlResult):
     """Record the URL in the context"""
     ctx.context.url = url.url
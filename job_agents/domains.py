@@ -0,0 +1,95 @@
+"""
+Per-domain politeness: concurrent request caps, minimum spacing between requests and
+latency and failure counters, shared by the reachability checks and browser navigation.
+"""
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Dict, List
+from urllib.parse import urlparse
+
+
+def url_host(url: str) -> str:
+    """Host of a URL without a leading www., used as the politeness key."""
+    return urlparse(url or "").netloc.lower().removeprefix("www.") or "unknown"
+
+
+class DomainLimiter:
+    """
+    At most max_per_host requests in flight per host, each starting at least min_interval
+    seconds after the previous one to the same host.
+
+    Callers wrap each request in slot() and report its outcome with record(), which keeps
+    per-host request, failure and latency counters for the run.
+    """
+    def __init__(self, max_per_host: int = 2, min_interval: float = 0.5):
+        self.max_per_host = max_per_host
+        self.min_interval = min_interval
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._spacing: Dict[str, asyncio.Lock] = {}
+        self._next_start: Dict[str, float] = {}
+        self.active: Dict[str, int] = defaultdict(int)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the per-host counters, at the start of a run; the limits themselves carry on."""
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.failures: Dict[str, int] = defaultdict(int)
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Wait for a free slot and the spacing interval on the URL's host."""
+        host = url_host(url)
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.max_per_host)
+            self._spacing[host] = asyncio.Lock()
+        async with self._semaphores[host]:
+            async with self._spacing[host]:
+                delay = self._next_start.get(host, 0) - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._next_start[host] = time.monotonic() + self.min_interval
+            self.active[host] += 1
+            try:
+                yield
+            finally:
+                self.active[host] -= 1
+
+    def record(self, url: str, seconds: float, failed: bool) -> None:
+        host = url_host(url)
+        self.latencies[host].append(seconds)
+        if failed:
+            self.failures[host] += 1
+
+    def summary(self) -> Dict[str, dict]:
+        """Return the request count, failures and mean and max latency per host."""
+        return {
+            host: {
+                "requests": len(latencies),
+                "failures": self.failures[host],
+                "mean_seconds": round(sum(latencies) / len(latencies), 2),
+                "max_seconds": round(max(latencies), 2),
+            }
+            for host, latencies in self.latencies.items()
+        }
+
+    def log_summary(self) -> None:
+        for host, stats in sorted(self.summary().items()):
+            logging.info(f"Requests to {host}: {stats}")
+
+
+_limiter = DomainLimiter()
+
+
+def get_domain_limiter() -> DomainLimiter:
+    """Return the process-wide domain limiter."""
+    return _limiter
+
+
+def configure_domain_limiter(**kwargs) -> DomainLimiter:
+    """Replace the process-wide domain limiter with new per-host limits."""
+    global _limiter
+    _limiter = DomainLimiter(**kwargs)
+    return _limiter
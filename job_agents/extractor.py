@@ -3,7 +3,8 @@ from .context import JobScreenContext
 
 
 INSTRUCTIONS = (
-    "ALWAYS call browser_wait_for to wait 10 seconds for the page to load. \n"
+    "ALWAYS call browser_wait_for with time=10 to wait for the page to load. "
+    "It returns as soon as the page is ready, so 10 seconds is only the upper bound. \n"
     "NEVER call browser_navigate, the page is already loaded. \n"
     "Extract the following information if available: \n"
     "- company \n"
@@ -0,0 +1,211 @@
+"""
+HTML-first extraction of job descriptions from known ATS pages, without a browser or model call.
+"""
+import html
+import json
+import logging
+import re
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from .context import JobDescription
+from .checker import get_reachability_checker
+
+
+MIN_DESCRIPTION_CHARS = 300
+MAX_DESCRIPTION_CHARS = 12000
+
+BOILERPLATE = re.compile(
+    r"equal (employment )?opportunity|reasonable accommodation|protected veteran|"
+    r"sexual orientation|gender identity|cookie|privacy (policy|notice)|e-verify",
+    re.IGNORECASE,
+)
+"""Paragraphs matching this are dropped from extracted descriptions"""
+
+CONTAINERS: Dict[str, List[Tuple[str, str]]] = {
+    "greenhouse": [("class", "job__description"), ("id", "content"), ("class", "job-post")],
+    "lever": [("class", "section-wrapper page-full-width"), ("class", "posting-page")],
+    "ashby": [("class", "ashby-job-posting-description")],
+}
+"""Elements holding the job description for each ATS layout, as (attribute, value) pairs"""
+
+BLOCK_TAGS = {"p", "div", "br", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6", "section", "tr"}
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+def ats_layout(url: str) -> Optional[str]:
+    """Return the known ATS layout for a URL, or None if it is not a supported ATS page."""
+    host = urlparse(url).netloc.lower()
+    if host.endswith("greenhouse.io"):
+        return "greenhouse"
+    if host == "jobs.lever.co":
+        return "lever"
+    if host == "jobs.ashbyhq.com":
+        return "ashby"
+    return None
+
+
+class _PageParser(HTMLParser):
+    """
+    Single pass over a page collecting JSON-LD blocks, meta tags, the title, the first h1
+    and the text of the first element matching any of the container selectors.
+    """
+    def __init__(self, containers: List[Tuple[str, str]], capture_all: bool = False):
+        super().__init__(convert_charrefs=True)
+        self.containers = containers
+        self.json_ld: List[str] = []
+        self.meta: Dict[str, str] = {}
+        self.title = ""
+        self.h1 = ""
+        self.container_text: List[str] = []
+        self._stack: List[str] = []
+        self._capture_depth: Optional[int] = 0 if capture_all else None
+        self._captured = False
+        self._in: Optional[str] = None
+        self._script_is_json_ld = False
+
+    def _matches(self, attrs: Dict[str, str]) -> bool:
+        for attr, value in self.containers:
+            if attr == "class" and value in attrs.get("class", ""):
+                return True
+            if attr == "id" and attrs.get("id") == value:
+                return True
+        return False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {k: v or "" for k, v in attrs}
+        if tag == "meta":
+            name = attrs.get("property") or attrs.get("name")
+            if name:
+                self.meta[name.lower()] = attrs.get("content", "")
+        if tag in ("script", "style", "title", "h1"):
+            self._in = tag
+            self._script_is_json_ld = tag == "script" and attrs.get("type") == "application/ld+json"
+        if tag in VOID_TAGS:
+            if tag == "br" and self._capture_depth is not None:
+                self.container_text.append("\n")
+            return
+        self._stack.append(tag)
+        if self._capture_depth is None and not self._captured and self._matches(attrs):
+            self._capture_depth = len(self._stack)
+        if self._capture_depth is not None and tag in BLOCK_TAGS:
+            self.container_text.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in VOID_TAGS or tag not in self._stack:
+            return
+        while self._stack:
+            if self._capture_depth is not None and len(self._stack) == self._capture_depth:
+                self._capture_depth = None
+                self._captured = True
+            if self._stack.pop() == tag:
+                break
+        if tag == self._in:
+            self._in = None
+        if tag in BLOCK_TAGS and self._capture_depth is not None:
+            self.container_text.append("\n")
+
+    def handle_data(self, data):
+        if self._in == "script":
+            if self._script_is_json_ld:
+                self.json_ld.append(data)
+            return
+        if self._in == "style":
+            return
+        if self._in == "title":
+            self.title += data
+        if self._in == "h1" and not self.h1:
+            self.h1 = data.strip()
+        if self._capture_depth is not None:
+            self.container_text.append(data)
+
+
+def html_to_text(markup: str) -> str:
+    """Convert an HTML fragment to plain text with one paragraph per line."""
+    parser = _PageParser([], capture_all=True)
+    parser.feed(markup)
+    return clean_text("".join(parser.container_text))
+
+
+def clean_text(text: str) -> str:
+    """Collapse whitespace, drop boilerplate paragraphs and cap the length."""
+    lines = [re.sub(r"\s+", " ", line).strip() for line in text.splitlines()]
+    lines = [line for line in lines if line and not BOILERPLATE.search(line)]
+    return "\n".join(lines)[:MAX_DESCRIPTION_CHARS]
+
+
+def _is_job_posting(item) -> bool:
+    """Whether a JSON-LD item is a JobPosting, whose @type may be a single type or a list of types."""
+    if not isinstance(item, dict):
+        return False
+    types = item.get("@type")
+    return types == "JobPosting" or (isinstance(types, list) and "JobPosting" in types)
+
+
+def _job_posting_from_json_ld(blocks: List[str]) -> Optional[dict]:
+    """Return the first schema.org JobPosting object among the JSON-LD blocks."""
+    for block in blocks:
+        try:
+            data = json.loads(block)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(data, list):
+            candidates = data
+        elif isinstance(data, dict):
+            candidates = data.get("@graph", [data])
+        else:
+            continue
+        for item in candidates if isinstance(candidates, list) else [candidates]:
+            if _is_job_posting(item):
+                return item
+    return None
+
+
+def _company_from_title(page_title: str) -> str:
+    """Pull the company out of titles like 'Job Application for X at Acme' or 'Acme - X'."""
+    page_title = html.unescape(page_title).strip()
+    match = re.search(r" at (.+)$", page_title)
+    if match:
+        return match.group(1).strip()
+    return page_title.split(" - ")[0].strip() if " - " in page_title else ""
+
+
+def parse_job_html(markup: str, url: str) -> Optional[JobDescription]:
+    """
+    Extract a JobDescription from page HTML using schema.org JobPosting data or the known
+    ATS layout. Returns None when the page does not hold a parseable job description,
+    e.g. when it is rendered by JavaScript.
+    """
+    layout = ats_layout(url)
+    parser = _PageParser(CONTAINERS.get(layout, []))
+    parser.feed(markup)
+
+    posting = _job_posting_from_json_ld(parser.json_ld)
+    if posting:
+        organization = posting.get("hiringOrganization") or {}
+        company = organization.get("name", "") if isinstance(organization, dict) else str(organization)
+        title = posting.get("title", "")
+        description = html_to_text(html.unescape(posting.get("description", "")))
+    else:
+        title = parser.h1 or parser.meta.get("og:title", "")
+        company = parser.meta.get("og:site_name", "") or _company_from_title(parser.title)
+        description = clean_text("".join(parser.container_text))
+
+    if not title or len(description) < MIN_DESCRIPTION_CHARS:
+        return None
+    if not company and layout:
+        company = urlparse(url).path.strip("/").split("/")[0]
+    return JobDescription(company=company, title=title.strip(), job_description=description)
+
+
+async def extract_job_html(url: str) -> Optional[JobDescription]:
+    """Fetch a page over plain HTTP and parse it, returning None if the browser is needed."""
+    try:
+        resp = await get_reachability_checker().fetch(url)
+        if resp.status_code >= 400 or "html" not in resp.headers.get("content-type", "html"):
+            return None
+        return parse_job_html(resp.text, str(resp.url))
+    except Exception as e:
+        logging.info(f"HTML extraction failed for {url}, falling back to the browser: {e}")
+        return None
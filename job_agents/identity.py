@@ -0,0 +1,109 @@
+"""
+Canonical job identity derived from posting URLs, and a persistent index of jobs already screened.
+"""
+from pydantic import BaseModel
+from pathlib import Path
+from typing import Set
+from urllib.parse import urlsplit, parse_qsl, urlencode
+import re
+
+
+TRACKING_PARAMS = ("utm_", "gh_src", "source", "ref", "lever-source", "lever-origin")
+
+
+class JobIdentity(BaseModel):
+    ats: str
+    """The applicant tracking system, or 'url' when the posting is not recognized"""
+
+    company: str
+    """The board or company slug"""
+
+    job_id: str
+    """The ATS job id, or the normalized URL for unrecognized postings"""
+
+    @property
+    def key(self) -> str:
+        """Stable key shared by every URL of the same posting"""
+        if self.ats == "greenhouse":
+            # gh_jid values are unique across all Greenhouse boards, and a company's careers
+            # site and its job-boards.greenhouse.io board often use different slugs
+            return f"greenhouse:{self.job_id}"
+        if self.ats == "url":
+            return f"url:{self.job_id}"
+        return f"{self.ats}:{self.company}:{self.job_id}"
+
+
+def _host(url: str) -> str:
+    host = urlsplit(url).netloc.lower().split(":")[0]
+    return host[4:] if host.startswith("www.") else host
+
+
+def _company_from_host(host: str) -> str:
+    """Return the domain label before the TLD, e.g. roblox for careers.roblox.com."""
+    labels = host.split(".")
+    return labels[-2] if len(labels) >= 2 else host
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL for comparison: no scheme, www, fragment, trailing slash or tracking params."""
+    parts = urlsplit(url.strip())
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if not k.lower().startswith(TRACKING_PARAMS))
+    path = parts.path.rstrip("/")
+    normalized = f"{_host(url)}{path}"
+    return f"{normalized}?{urlencode(query)}" if query else normalized
+
+
+def job_identity(url: str) -> JobIdentity:
+    """Derive the canonical identity of a job posting from its URL."""
+    parts = urlsplit(url.strip())
+    host = _host(url)
+    segments = [s for s in parts.path.split("/") if s]
+    params = dict(parse_qsl(parts.query))
+
+    if params.get("gh_jid", "").isdigit():
+        company = segments[0] if "greenhouse.io" in host and segments else _company_from_host(host)
+        return JobIdentity(ats="greenhouse", company=company.lower(), job_id=params["gh_jid"])
+    if host.endswith("greenhouse.io") and len(segments) >= 3 and segments[1] == "jobs" and segments[2].isdigit():
+        return JobIdentity(ats="greenhouse", company=segments[0].lower(), job_id=segments[2])
+    if host == "jobs.lever.co" and len(segments) >= 2:
+        return JobIdentity(ats="lever", company=segments[0].lower(), job_id=segments[1].lower())
+    if host == "jobs.ashbyhq.com" and len(segments) >= 2:
+        return JobIdentity(ats="ashby", company=segments[0].lower(), job_id=segments[1].lower())
+    if host.endswith("myworkdayjobs.com") and "job" in segments:
+        match = re.search(r"_([A-Za-z0-9-]+)$", segments[-1])
+        if match:
+            return JobIdentity(ats="workday", company=host.split(".")[0], job_id=match.group(1).upper())
+    return JobIdentity(ats="url", company=_company_from_host(host), job_id=normalize_url(url))
+
+
+def job_key(url: str) -> str:
+    """Return the stable dedup key for a job posting URL."""
+    return job_identity(url).key
+
+
+class SeenIndex:
+    """
+    Persistent set of job keys that were screened in earlier runs.
+    Keys are stored one per line in an append-only text file.
+    """
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._keys: Set[str] = set()
+        if self.path.exists():
+            self._keys = {line.strip() for line in self.path.read_text(encoding="utf-8").splitlines() if line.strip()}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: str) -> None:
+        """Record a key, appending it to the index file if it is new."""
+        if key in self._keys:
+            return
+        self._keys.add(key)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(key + "\n")
@@ -0,0 +1,192 @@
+"""
+Run metrics: latency of every stage, agent turn, tool call and handoff, tokens and cost per model,
+and screening throughput, collected through run hooks and written as JSON at the end of a run.
+"""
+import json
+import logging
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from agents import Agent, RunHooks
+
+
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4o-mini": (0.15, 0.60),
+}
+"""USD per million input and output tokens, for the cost estimates; models not listed are not costed"""
+
+KINDS = ("stage", "turn", "model", "tool", "handoff", "browser")
+"""What is timed: pipeline stages, agent turns, model calls, tool calls, handoffs and browser session work"""
+
+
+def percentiles(seconds: List[float]) -> dict:
+    """Count, total and p50/p95/p99 of a list of durations."""
+    p50, p95, p99 = np.percentile(seconds, [50, 95, 99])
+    return {
+        "count": len(seconds),
+        "total_seconds": round(float(sum(seconds)), 2),
+        "p50": round(float(p50), 3),
+        "p95": round(float(p95), 3),
+        "p99": round(float(p99), 3),
+    }
+
+
+class RunMetrics:
+    """Durations by kind and name, token usage by model and the outcome of each job screen."""
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop the stage, tool and token records and the screen outcomes, and restart the clock screens per minute is measured from."""
+        self.started = time.monotonic()
+        self.timings: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+        self.tokens: Dict[str, Dict[str, int]] = defaultdict(lambda: {"calls": 0, "input_tokens": 0, "output_tokens": 0})
+        self.screens: List[Tuple[float, bool]] = []
+
+    def record(self, kind: str, name: str, seconds: float) -> None:
+        self.timings[(kind, name)].append(seconds)
+
+    def record_usage(self, model: str, input_tokens: int, output_tokens: int) -> None:
+        usage = self.tokens[model]
+        usage["calls"] += 1
+        usage["input_tokens"] += input_tokens
+        usage["output_tokens"] += output_tokens
+
+    def record_screen(self, seconds: float, failed: bool) -> None:
+        self.screens.append((seconds, failed))
+
+    def cost(self, model: str) -> Optional[float]:
+        """Estimated USD spent on a model, or None if its price is unknown."""
+        if model not in MODEL_PRICES:
+            return None
+        input_price, output_price = MODEL_PRICES[model]
+        usage = self.tokens[model]
+        return (usage["input_tokens"] * input_price + usage["output_tokens"] * output_price) / 1_000_000
+
+    def summary(self) -> dict:
+        wall = time.monotonic() - self.started
+        costs = {model: self.cost(model) for model in self.tokens}
+        total_cost = sum(cost for cost in costs.values() if cost is not None)
+        summary = {
+            "wall_seconds": round(wall, 2),
+            "screens": len(self.screens),
+            "failed_screens": sum(1 for _, failed in self.screens if failed),
+            "screens_per_minute": round(len(self.screens) / wall * 60, 2) if wall else 0,
+            "screen_latency": percentiles([s for s, _ in self.screens]) if self.screens else None,
+            "estimated_cost_usd": round(total_cost, 4),
+            "cost_per_screen_usd": round(total_cost / len(self.screens), 5) if self.screens else None,
+            "models": {
+                model: {**usage, "estimated_cost_usd": None if costs[model] is None else round(costs[model], 4)}
+                for model, usage in self.tokens.items()
+            },
+        }
+        for kind in KINDS:
+            summary[kind] = {name: percentiles(seconds)
+                             for (k, name), seconds in sorted(self.timings.items()) if k == kind}
+        return summary
+
+    def write(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(self.summary(), indent=2), encoding="utf-8")
+        logging.info(f"Wrote run metrics to {path}")
+
+    def report_lines(self) -> List[str]:
+        """Short summary for the top of the screening report: throughput, cost and the slowest stages."""
+        summary = self.summary()
+        lines = [
+            f"Wall time:               {summary['wall_seconds']:.0f}s",
+            f"Throughput:              {summary['screens_per_minute']} screens/min",
+            f"Estimated cost:          ${summary['estimated_cost_usd']:.4f}"
+            + (f" (${summary['cost_per_screen_usd']:.5f}/screen)" if summary["cost_per_screen_usd"] is not None else ""),
+        ]
+        if summary["screen_latency"]:
+            latency = summary["screen_latency"]
+            lines.append(f"Screen latency:          p50 {latency['p50']:.1f}s, p95 {latency['p95']:.1f}s, p99 {latency['p99']:.1f}s")
+        for stage, stats in sorted(summary["stage"].items(), key=lambda item: -item[1]["total_seconds"]):
+            lines.append(f"{'Stage ' + stage + ':':<25}p50 {stats['p50']:.1f}s, p95 {stats['p95']:.1f}s, p99 {stats['p99']:.1f}s"
+                         f" ({stats['total_seconds']:.0f}s total)")
+        for model, usage in summary["models"].items():
+            lines.append(f"{'Tokens ' + model + ':':<25}{usage['input_tokens']} in / {usage['output_tokens']} out"
+                         f" over {usage['calls']} calls")
+        return lines
+
+
+run_metrics = RunMetrics()
+
+
+class TimingHooks(RunHooks):
+    """
+    Run hooks recording one Runner.run chain into run_metrics: each agent's span as its stage,
+    each turn (model call plus the tools it ran), each model call with its tokens, each tool
+    call including MCP tools, and each handoff from the handing-off model call to the next agent's start.
+    """
+    def __init__(self, stages: Optional[Dict[int, str]] = None):
+        self.stages = stages or {}
+        """Stage of each agent, keyed by id(agent); agents not listed are timed under their name"""
+        self._agent: Optional[Tuple[str, float]] = None
+        self._turn: Optional[Tuple[str, float]] = None
+        self._llm_start: Dict[int, float] = {}
+        self._tools: Dict[Tuple[int, str], float] = {}
+        self._last_llm_end = time.monotonic()
+        self._handoff: Optional[Tuple[str, float]] = None
+
+    def _stage(self, agent: Agent) -> str:
+        return self.stages.get(id(agent), agent.name)
+
+    def _end_turn(self, now: float) -> None:
+        if self._turn is not None:
+            run_metrics.record("turn", self._turn[0], now - self._turn[1])
+            self._turn = None
+
+    def _end_agent(self, now: float) -> None:
+        self._end_turn(now)
+        if self._agent is not None:
+            run_metrics.record("stage", self._agent[0], now - self._agent[1])
+            self._agent = None
+
+    def finish(self) -> None:
+        """Close the running agent's span, for a run that ended by an exception rather than an output."""
+        self._end_agent(time.monotonic())
+
+    async def on_agent_start(self, context, agent: Agent) -> None:
+        now = time.monotonic()
+        if self._handoff is not None:
+            run_metrics.record("handoff", self._handoff[0], now - self._handoff[1])
+            self._handoff = None
+        if self._agent is None:
+            self._agent = (self._stage(agent), now)
+
+    async def on_agent_end(self, context, agent: Agent, output) -> None:
+        self._end_agent(time.monotonic())
+
+    async def on_handoff(self, context, from_agent: Agent, to_agent: Agent) -> None:
+        self._end_agent(time.monotonic())
+        self._handoff = (f"{from_agent.name} -> {to_agent.name}", self._last_llm_end)
+
+    async def on_llm_start(self, context, agent: Agent, *args, **kwargs) -> None:
+        now = time.monotonic()
+        self._end_turn(now)
+        self._turn = (agent.name, now)
+        self._llm_start[id(agent)] = now
+
+    async def on_llm_end(self, context, agent: Agent, response) -> None:
+        now = time.monotonic()
+        model = agent.model if isinstance(agent.model, str) else getattr(agent.model, "model", "default")
+        if id(agent) in self._llm_start:
+            run_metrics.record("model", model, now - self._llm_start.pop(id(agent)))
+        run_metrics.record_usage(model, response.usage.input_tokens, response.usage.output_tokens)
+        self._last_llm_end = now
+
+    async def on_tool_start(self, context, agent: Agent, tool) -> None:
+        self._tools[(id(agent), tool.name)] = time.monotonic()
+
+    async def on_tool_end(self, context, agent: Agent, tool, result) -> None:
+        started = self._tools.pop((id(agent), tool.name), None)
+        if started is not None:
+            run_metrics.record("tool", tool.name, time.monotonic() - started)
@@ -0,0 +1,32 @@
+from agents import Agent, ModelSettings
+from .context import JobScreenContext
+
+
+INSTRUCTIONS = (
+    "Navigate to the URL with browser_navigate. NEVER navigate more than once. \n"
+    "If the page snapshot does not show the job details yet, call browser_wait_for with time=10 once. \n"
+    "ALWAYS perform EXACTLY one of the following actions: \n"
+    "1. If the page is not a single job description, handoff to the summarizer with the inspection result. \n"
+    "2. If the page contains a single job description, hand off to the screener with the following "
+    "information if available: \n"
+    "- company \n"
+    "- job title \n"
+    "- location, hybrid, or remote \n"
+    "- type of role (full-time, part-time, contract, internship, etc.) \n"
+    "- work experience needed, or fresh grad role \n"
+    "- responsibilities \n"
+    "- education or degree requirements \n"
+    "- any software and tools mentioned \n\n"
+    "Do not include irrelevant text such as equal opportunity statements or company descriptions. \n"
+)
+
+
+def get_page_extractor_agent(mcp_server):
+    """Single-turn alternative to the PageInspector and ExtractJobDescription pair."""
+    return Agent[JobScreenContext](
+        name="PageExtractor",
+        instructions=INSTRUCTIONS,
+        mcp_servers=[mcp_server],
+        model_settings=ModelSettings(tool_choice='required'),
+        model="gpt-4.1-mini",
+    )
@@ -0,0 +1,361 @@
+"""
+The job screening pipeline: agents and handoffs built once per run and executed per job.
+
+The pipeline is as follows:
+
+1. URL Checker agent: Checks if the URL is reachable.
+2. Page Inspector agent: Verifies if the page is a single job posting.
+3. Extractor agent: Extracts the job description from the URL.
+4. Screener agent: Rates the fit of the job posting.
+5. Summary agent: Summarizes the job screening results.
+
+With combined_extract, a single PageExtractor agent replaces steps 2 and 3.
+Each stage runs under its own deadline, restarted as the next stage's agent takes over.
+"""
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+from agents import Agent, Runner, handoff, HandoffInputData, RunContextWrapper
+from agents.extensions import handoff_filters
+from agents.mcp import MCPServer
+
+from .checker import get_url_checker_agent
+from .inspector import get_page_inspector_agent
+from .extractor import get_extract_description_agent
+from .page_extractor import get_page_extractor_agent
+from .screener import get_job_screen_agent, screen_stats
+from .summarizer import get_summary_agent
+from .profile import CandidateProfile
+from .prescreen import PreScreener
+from .identity import job_key
+from .batch_screener import BatchScreener
+from .rate_limiter import limited_run_config
+from .metrics import run_metrics
+from .stages import StageDeadlines, StageTimeout, DEFAULT_STAGE_TIMEOUTS
+from .context import (JobScreenContext,
+                      ErrorMessage,
+                      UrlResult,
+                      InspectionResult,
+                      JobDescription,
+                      FitScore,
+                      ConfidentFitScore,
+                      SummaryAgentOutput,
+                      record_error_on_handoff,
+                      record_rejection,
+                      record_url,
+                      record_inspection,
+                      record_job_description,
+                      record_fit_score,
+                      summarize_context)
+
+
+_job_session: ContextVar[Optional[MCPServer]] = ContextVar("job_session", default=None)
+"""The Playwright MCP session bound to the job running in the current task"""
+
+
+class SessionProxy(MCPServer):
+    """
+    MCP server the browser agents are built with. Every call is forwarded to the Playwright
+    session bound to the current job, so one agent graph can serve concurrent jobs.
+    """
+    def __init__(self):
+        super().__init__()
+
+    @property
+    def name(self) -> str:
+        return "playwright"
+
+    async def connect(self):
+        pass
+
+    async def cleanup(self):
+        pass
+
+    def _session(self) -> MCPServer:
+        session = _job_session.get()
+        if session is None:
+            raise RuntimeError("No Playwright session is bound to this job")
+        return session
+
+    async def list_tools(self, *args, **kwargs):
+        return await self._session().list_tools(*args, **kwargs)
+
+    async def call_tool(self, tool_name, arguments, *args, **kwargs):
+        return await self._session().call_tool(tool_name, arguments, *args, **kwargs)
+
+    async def list_prompts(self, *args, **kwargs):
+        return await self._session().list_prompts(*args, **kwargs)
+
+    async def get_prompt(self, *args, **kwargs):
+        return await self._session().get_prompt(*args, **kwargs)
+
+
+class PreScreenRejected(Exception):
+    """Raised at the screener handoff to end the chain without a screener model call."""
+
+
+class ScreenDeferred(Exception):
+    """Raised at the screener handoff to leave the chain and score the job in a batch."""
+
+
+class ScreenEscalated(Exception):
+    """Raised at a screener tier's handoff to re-score a borderline result with the next tier."""
+    def __init__(self, tier: int):
+        super().__init__(f"escalated from tier {tier}")
+        self.tier = tier
+
+
+def message_filter(handoff_message_data: HandoffInputData) -> HandoffInputData:
+    """Filter handoff messages to remove tool content and keep only recent history."""
+    handoff_message_data = handoff_filters.remove_all_tools(handoff_message_data)
+
+    history = (
+        tuple(handoff_message_data.input_history[-1:])
+        if isinstance(handoff_message_data.input_history, tuple)
+        else handoff_message_data.input_history
+    )
+
+    return HandoffInputData(
+        input_history=history,
+        pre_handoff_items=tuple(handoff_message_data.pre_handoff_items),
+        new_items=tuple(handoff_message_data.new_items),
+    )
+
+
+class ScreeningPipeline:
+    """
+    The screening handoff graph, built once and reused for every job.
+    Per-job state lives in the JobScreenContext and the Playwright session passed to run().
+    """
+    def __init__(self,
+                 resume: str,
+                 preferences: str,
+                 profile: Optional[CandidateProfile] = None,
+                 prescreener: Optional[PreScreener] = None,
+                 batcher: Optional[BatchScreener] = None,
+                 screen_models: Sequence[str] = ("gpt-4.1",),
+                 escalate_scores: Sequence[int] = (2, 3, 4),
+                 escalate_confidence: float = 0.7,
+                 combined_extract: bool = False,
+                 stage_timeouts: Optional[Dict[str, float]] = None,
+                 on_description: Optional[Callable[[JobScreenContext, Optional[str]], None]] = None):
+        self.resume = resume
+        self.preferences = preferences
+        self.profile = profile
+        self.prescreener = prescreener
+        self.batcher = batcher
+        self.screen_models = list(screen_models)
+        self.escalate_scores = set(escalate_scores)
+        self.escalate_confidence = escalate_confidence
+        self.combined_extract = combined_extract
+        self.stage_timeouts = {**DEFAULT_STAGE_TIMEOUTS, **(stage_timeouts or {})}
+        self.on_description = on_description
+        """Called with the context and the page snapshot as soon as a job description is extracted"""
+        self.session = SessionProxy()
+        self._screen_started: Dict[int, Tuple[float, int]] = {}
+
+        # Create the agents
+        self.url_checker_agent = get_url_checker_agent()
+        # One screener per tier; every tier but the last reports a confidence for escalation
+        self.screener_agents = [
+            get_job_screen_agent(profile, model=model, confidence=tier < len(self.screen_models) - 1)
+            for tier, model in enumerate(self.screen_models)
+        ]
+        self.screener_agent = self.screener_agents[0]
+        self.summary_agent = get_summary_agent()
+
+        # Define handoffs between agents
+        failed_summary_handoff = handoff(agent=self.summary_agent, on_handoff=record_error_on_handoff, input_type=ErrorMessage)
+        extractor_handoff = handoff(agent=self.screener_agent, on_handoff=self._record_job_description, input_type=JobDescription)
+
+        if combined_extract:
+            # One navigation turn that either rejects the page or extracts the description
+            self.page_agent = get_page_extractor_agent(self.session)
+            rejection_handoff = handoff(agent=self.summary_agent, on_handoff=record_rejection, input_type=InspectionResult)
+            self.page_agent.handoffs = [extractor_handoff, rejection_handoff]
+            page_stages = {id(self.page_agent): "extract"}
+        else:
+            self.page_agent = get_page_inspector_agent(self.session)
+            job_extractor_agent = get_extract_description_agent(self.session)
+            page_inspector_handoff = handoff(agent=job_extractor_agent, on_handoff=record_inspection, input_type=InspectionResult)
+            self.page_agent.handoffs = [page_inspector_handoff, failed_summary_handoff]
+            job_extractor_agent.handoffs = [extractor_handoff]
+            page_stages = {id(self.page_agent): "inspect", id(job_extractor_agent): "extract"}
+
+        # Add handoffs to agents
+        url_checker_handoff = handoff(agent=self.page_agent, on_handoff=record_url, input_type=UrlResult)
+        self.url_checker_agent.handoffs = [url_checker_handoff, failed_summary_handoff]
+        for tier, screener_agent in enumerate(self.screener_agents):
+            last = tier == len(self.screener_agents) - 1
+            screener_agent.handoffs = [handoff(agent=self.summary_agent,
+                                               on_handoff=self._fit_score_recorder(tier),
+                                               input_type=FitScore if last else ConfidentFitScore)]
+
+        # Stage of each agent, for the per-stage deadlines
+        self._stages: Dict[int, str] = {
+            id(self.url_checker_agent): "check",
+            **page_stages,
+            **{id(agent): "screen" for agent in self.screener_agents},
+            id(self.summary_agent): "summarize",
+        }
+
+    @classmethod
+    def from_files(cls, resume_path: str, preferences_path: str, **kwargs) -> "ScreeningPipeline":
+        """Build the pipeline with the resume and preferences read from disk once."""
+        return cls(
+            resume=Path(resume_path).read_text(encoding='utf-8'),
+            preferences=Path(preferences_path).read_text(encoding='utf-8'),
+            **kwargs,
+        )
+
+    def new_context(self) -> JobScreenContext:
+        """Create the context for one job with the resume and preferences loaded."""
+        return JobScreenContext(resume=self.resume, preferences=self.preferences)
+
+    async def _record_job_description(self, ctx: RunContextWrapper[JobScreenContext], job_description: JobDescription):
+        """Record the extracted job description and pre-screen it before the screener runs."""
+        await record_job_description(ctx, job_description)
+        if self.on_description is not None:
+            # Before screening, so a later stage failing does not lose the extracted description
+            session = _job_session.get()
+            self.on_description(ctx.context, getattr(session, "last_snapshot", None))
+        await self._prescreen(ctx)
+        if self.batcher is not None:
+            raise ScreenDeferred()
+        self._start_screen(ctx)
+
+    def _start_screen(self, ctx: RunContextWrapper[JobScreenContext]):
+        """Note the time and tokens used so far as the single screener takes over."""
+        self._screen_started[id(ctx.context)] = (time.monotonic(), ctx.usage.total_tokens)
+
+    def _fit_score_recorder(self, tier: int):
+        """Return the screener handoff callback for a tier, which escalates borderline scores."""
+        async def record_tier_fit_score(ctx: RunContextWrapper[JobScreenContext], fit_score: FitScore):
+            model = self.screen_models[tier]
+            started = self._screen_started.pop(id(ctx.context), None)
+            if started is not None:
+                screen_stats.record("single", model, 1, time.monotonic() - started[0], ctx.usage.total_tokens - started[1])
+            if isinstance(fit_score, ConfidentFitScore) and (
+                    fit_score.fit_score in self.escalate_scores or fit_score.confidence < self.escalate_confidence):
+                logging.info(f"Escalating {ctx.context.url} from {model} "
+                             f"(score {fit_score.fit_score}, confidence {fit_score.confidence:.2f})")
+                raise ScreenEscalated(tier)
+            await record_fit_score(ctx, FitScore(fit_score=fit_score.fit_score, reason=fit_score.reason))
+            ctx.context.tier = model
+        return record_tier_fit_score
+
+    async def batch_screen(self, url: str, context: JobScreenContext) -> SummaryAgentOutput:
+        """
+        Score a job deferred by run() in a batch, under the screen stage deadline, screening it
+        alone if the batch did not return its score. The batch runs on the first screener tier, so
+        with a cascade a borderline batch score is re-scored by the next tier. Called once the
+        job's browser session is released.
+        """
+        context.stage = "screen"
+        seconds = self.stage_timeouts["screen"]
+        start = time.monotonic()
+        try:
+            async with asyncio.timeout(seconds):
+                fit_score = await self.batcher.score(context)
+        except TimeoutError:
+            logging.warning(f"The batched screen of {url} ran past its {seconds}s deadline")
+            raise StageTimeout("screen", seconds) from None
+        finally:
+            run_metrics.record("stage", "screen", time.monotonic() - start)
+        if fit_score is None:
+            logging.info(f"Batch did not score {url}, falling back to a single screen")
+            try:
+                return await self._run_agent(self.screener_agent, url, context)
+            except ScreenEscalated as e:
+                # Raised outside run(), so its escalation handler never sees it
+                return await self._escalate(url, context, e.tier + 1)
+        if len(self.screener_agents) > 1 and fit_score.fit_score in self.escalate_scores:
+            # Batch scores carry no confidence, so only the score decides
+            logging.info(f"Escalating {url} from batch {self.batcher.agent.model} (score {fit_score.fit_score})")
+            return await self._escalate(url, context, 1)
+        await record_fit_score(RunContextWrapper(context), fit_score)
+        context.tier = f"batch {self.batcher.agent.model}"
+        return summarize_context(context)
+
+    async def _escalate(self, url: str, context: JobScreenContext, tier: int) -> SummaryAgentOutput:
+        """Re-score the job with each following tier until one is sure or the last tier answers."""
+        while True:
+            try:
+                return await self._run_agent(self.screener_agents[tier], url, context)
+            except ScreenEscalated as e:
+                tier = e.tier + 1
+
+    async def _prescreen(self, ctx: RunContextWrapper[JobScreenContext]):
+        """Record a low fit score and stop the chain if the job fails the local pre-screen."""
+        if self.prescreener is None:
+            return
+        result = self.prescreener.screen(ctx.context.job_description, job_key(ctx.context.url))
+        self.prescreener.log_result(ctx.context.url, result)
+        if not result.passed:
+            await record_fit_score(ctx, result.to_fit_score())
+            ctx.context.tier = "prescreen"
+            raise PreScreenRejected(result.reason)
+
+    def start_agent(self, context: JobScreenContext) -> Agent[JobScreenContext]:
+        """
+        Return the first agent for the stages the context has not completed: the screener if a
+        job description is recorded, the page agent if the URL is recorded, otherwise the UrlChecker.
+        """
+        if context.job_description:
+            return self.screener_agent
+        if context.url:
+            return self.page_agent
+        return self.url_checker_agent
+
+    async def _run_agent(self, agent: Agent[JobScreenContext], url: str, context: JobScreenContext) -> SummaryAgentOutput:
+        domain_name = urlparse(url).netloc.replace("www.", "").split(".")[-2] # domain name before .com/org/etc
+        workflow_name = f"{domain_name} job screen"
+        logging.info(f"Starting handoff chain for {workflow_name} at {agent.name}...")
+        if agent in self.screener_agents:
+            self._start_screen(RunContextWrapper(context))
+        run_config = limited_run_config(handoff_input_filter=message_filter, workflow_name=workflow_name)
+        try:
+            async with asyncio.timeout(None) as timeout:
+                hooks = StageDeadlines(self._stages, self.stage_timeouts, timeout)
+                result = await Runner.run(agent, input=url, context=context, run_config=run_config, hooks=hooks)
+        except TimeoutError:
+            if not timeout.expired():
+                raise
+            logging.warning(f"The {hooks.stage} stage of {url} ran past its {self.stage_timeouts[hooks.stage]}s deadline")
+            raise StageTimeout(hooks.stage, self.stage_timeouts[hooks.stage]) from None
+        finally:
+            hooks.finish()
+        return result.final_output
+
+    async def run(self, url: str, context: JobScreenContext, session: Optional[MCPServer] = None) -> SummaryAgentOutput:
+        """
+        Run the handoff chain for one job with its Playwright session bound to the browser agents,
+        starting from the first stage the context has not completed.
+
+        With a batcher, ScreenDeferred is raised once the job is ready to screen, so the caller
+        can release the browser session before waiting on batch_screen().
+        """
+        if context.fit_score is not None:
+            # Only the summary was left, and it is built from the context
+            return summarize_context(context)
+        start_agent = self.start_agent(context)
+        if start_agent is not self.screener_agent and session is None:
+            raise ValueError("A Playwright session is required to browse the job page")
+        token = _job_session.set(session)
+        try:
+            if start_agent is self.screener_agent:
+                await self._prescreen(RunContextWrapper(context))
+                if self.batcher is not None:
+                    raise ScreenDeferred()
+            return await self._run_agent(start_agent, url, context)
+        except PreScreenRejected:
+            return summarize_context(context)
+        except ScreenEscalated as e:
+            return await self._escalate(url, context, e.tier + 1)
+        finally:
+            _job_session.reset(token)
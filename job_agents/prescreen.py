@@ -0,0 +1,189 @@
+"""
+Local pre-screen of extracted job descriptions against the resume and preferences, without a model call.
+"""
+import logging
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from .context import FitScore
+
+
+DEFAULT_THRESHOLD = 0.15
+
+TOKEN = re.compile(r"[a-z][a-z0-9+#]*")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the their this to "
+    "we will with you your who what which about into other such than then them they these those "
+    "all any can may more most also our us not but if so do does".split()
+)
+
+YEARS = re.compile(r"(\d{1,2})\+?\s*(?:-|to)?\s*(?:\d{1,2}\s*)?\+?\s*years?", re.IGNORECASE)
+
+MIN_YEARS = re.compile(r"(?:minimum|at least|min\.?)\s*(?:of\s*)?(\d{1,2})\+?\s*years?", re.IGNORECASE)
+MAX_YEARS = re.compile(r"(?:maximum|at most|max\.?|no more than)\s*(?:of\s*)?(\d{1,2})\s*years?", re.IGNORECASE)
+DEAL_BREAKER = re.compile(r"^\s*(?:no|not|avoid|exclude)\s+(?:(?:jobs?|roles?|positions?)\s+(?:for|in|at|with|that)\s+)?(.+?)\s*\.?$",
+                          re.IGNORECASE)
+REMOTE_ONLY = re.compile(r"\bremote\b.*\bonly\b|\bonly\b.*\bremote\b|\bmust be remote\b", re.IGNORECASE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords."""
+    return [t for t in TOKEN.findall(text.lower()) if t not in STOPWORDS and len(t) > 1]
+
+
+def _phrase_pattern(phrase: str) -> re.Pattern:
+    """Match a preference phrase with any word endings, so 'new grads' also matches 'new graduate'."""
+    words = [re.escape(w.rstrip("s") if len(w) > 3 else w) + r"\w*" for w in phrase.lower().split()]
+    return re.compile(r"\b" + r"\s+".join(words) + r"\b", re.IGNORECASE)
+
+
+@dataclass
+class PreferenceRules:
+    """Hard filters parsed from the preferences text, one rule per recognised line."""
+    deal_breakers: Dict[str, re.Pattern]
+    keywords: List[str]
+    """Preference lines that are not hard rules, matched as extra candidate terms"""
+    min_years: Optional[int] = None
+    max_years: Optional[int] = None
+    remote_only: bool = False
+
+    @classmethod
+    def parse(cls, preferences: str) -> "PreferenceRules":
+        rules = cls(deal_breakers={}, keywords=[])
+        for line in preferences.splitlines():
+            if match := MIN_YEARS.search(line):
+                rules.min_years = int(match.group(1))
+            elif match := MAX_YEARS.search(line):
+                rules.max_years = int(match.group(1))
+            elif REMOTE_ONLY.search(line):
+                rules.remote_only = True
+            elif match := DEAL_BREAKER.match(line):
+                rules.deal_breakers[match.group(1)] = _phrase_pattern(match.group(1))
+            elif line.strip():
+                rules.keywords.append(line.strip())
+        return rules
+
+    def violation(self, description: str) -> Optional[str]:
+        """Return why the description breaks a rule, or None if it passes them all."""
+        for phrase, pattern in self.deal_breakers.items():
+            if pattern.search(description):
+                return f"mentions '{phrase}', which the preferences rule out"
+        years = [int(y) for y in YEARS.findall(description) if 0 < int(y) <= 20]
+        if years and self.min_years is not None and max(years) < self.min_years:
+            return f"asks for {max(years)} years of experience, below the preferred minimum of {self.min_years}"
+        if years and self.max_years is not None and min(years) > self.max_years:
+            return f"asks for {min(years)} years of experience, above the preferred maximum of {self.max_years}"
+        if self.remote_only and not re.search(r"\bremote\b", description, re.IGNORECASE):
+            return "is not listed as remote"
+        return None
+
+
+@dataclass
+class PreScreenResult:
+    passed: bool
+    score: float
+    reason: str
+
+    def to_fit_score(self) -> FitScore:
+        return FitScore(fit_score=1, reason=f"Pre-screen: {self.reason}")
+
+
+class PreScreener:
+    """
+    Scores a job description against the resume and soft preferences with BM25 term weights
+    and applies the hard rules parsed from the preferences.
+
+    Document frequencies are accumulated over every job description scored so far (plus any
+    passed to fit()), so term weights sharpen as the run sees more jobs. The resume is not
+    part of the corpus, and a description scored again under the same key is counted once.
+    """
+    def __init__(self, resume: str, preferences: str, threshold: float = DEFAULT_THRESHOLD, k1: float = 1.2, b: float = 0.75):
+        self.threshold = threshold
+        self.k1 = k1
+        self.b = b
+        self.rules = PreferenceRules.parse(preferences)
+        self.vocab: Dict[str, int] = {}
+        self.df = np.zeros(0)
+        self.docs = 0
+        self.total_length = 0
+        self.observed: Set[str] = set()
+        """Keys of the documents already counted in the corpus"""
+        self.resume_ids = np.unique(self._ids(tokenize("\n".join([resume, *self.rules.keywords]))))
+
+    def _ids(self, tokens: List[str]) -> np.ndarray:
+        for token in tokens:
+            if token not in self.vocab:
+                self.vocab[token] = len(self.vocab)
+        if len(self.vocab) > len(self.df):
+            self.df = np.concatenate([self.df, np.zeros(len(self.vocab) - len(self.df))])
+        return np.fromiter((self.vocab[t] for t in tokens), dtype=np.int64, count=len(tokens))
+
+    def _observe(self, tokens: List[str], key: Optional[str] = None):
+        """
+        Add a document to the corpus statistics, unless its key was already counted, and
+        return its unique term ids and counts.
+        """
+        ids, counts = np.unique(self._ids(tokens), return_counts=True)
+        if key is not None:
+            if key in self.observed:
+                return ids, counts
+            self.observed.add(key)
+        self.df[ids] += 1
+        self.docs += 1
+        self.total_length += len(tokens)
+        return ids, counts
+
+    def fit(self, descriptions: Iterable[str]) -> None:
+        """Seed the document frequencies with previously seen job descriptions."""
+        for description in descriptions:
+            self._observe(tokenize(description))
+
+    def _weights(self, ids: np.ndarray, counts: np.ndarray, length: int) -> np.ndarray:
+        idf = np.log1p((self.docs - self.df[ids] + 0.5) / (self.df[ids] + 0.5))
+        avg_length = self.total_length / self.docs
+        tf = counts * (self.k1 + 1) / (counts + self.k1 * (1 - self.b + self.b * length / avg_length))
+        return tf * idf
+
+    def similarity(self, description: str, key: Optional[str] = None) -> float:
+        """
+        Share of the description's BM25 term weight carried by terms that also appear in the resume,
+        so a long resume is not penalised for everything the job does not ask for.
+        """
+        tokens = tokenize(description)
+        if not tokens:
+            return 0.0
+        ids, counts = self._observe(tokens, key)
+        weights = self._weights(ids, counts, len(tokens))
+        total = weights.sum()
+        return float(weights[np.isin(ids, self.resume_ids)].sum() / total) if total else 0.0
+
+    def screen(self, description: str, key: Optional[str] = None) -> PreScreenResult:
+        """
+        Reject the description on a broken preference rule or a resume similarity below the threshold.
+        Pass the job's key so a retried screen does not count the description twice.
+        """
+        score = self.similarity(description, key)
+        violation = self.rules.violation(description)
+        if violation:
+            return PreScreenResult(passed=False, score=score, reason=f"the job {violation}")
+        if score < self.threshold:
+            return PreScreenResult(
+                passed=False, score=score,
+                reason=f"resume similarity {score:.3f} is below the threshold of {self.threshold}")
+        return PreScreenResult(passed=True, score=score, reason=f"resume similarity {score:.3f}")
+
+    def priority(self, text: str, key: Optional[str] = None) -> float:
+        """Rank a search result title and snippet: its similarity, or zero if it breaks a preference rule."""
+        if self.rules.violation(text):
+            return 0.0
+        return self.similarity(text, key)
+
+    def log_result(self, url: str, result: PreScreenResult) -> None:
+        if result.passed:
+            logging.info(f"Pre-screen passed {url}: {result.reason}")
+        else:
+            logging.info(f"Pre-screen rejected {url}: {result.reason}")
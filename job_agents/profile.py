@@ -0,0 +1,117 @@
+"""
+One-time condensed candidate profile built from the resume and preferences and cached on disk.
+"""
+import logging
+from pathlib import Path
+from typing import List, Optional
+from pydantic import BaseModel
+
+from agents import Agent, Runner
+
+from .cache import content_hash
+from .rate_limiter import limited_run_config
+from .metrics import TimingHooks
+
+
+DEFAULT_PROFILE_DIR = ".cache/profiles"
+
+
+class CandidateProfile(BaseModel):
+    summary: str
+    """Two or three sentences on who the candidate is"""
+
+    years_experience: int
+    """Total years of professional experience"""
+
+    skills: List[str]
+    """Languages, frameworks, tools and domains the candidate has used"""
+
+    experience: List[str]
+    """One line per role: title, company, dates and the most relevant achievements"""
+
+    education: List[str]
+    """Degrees and certifications"""
+
+    must_haves: List[str]
+    """Requirements from the preferences that a job must meet"""
+
+    deal_breakers: List[str]
+    """Job properties the preferences rule out"""
+
+    nice_to_haves: List[str]
+    """Preferences that make a job a better fit but are not required"""
+
+    def to_prompt(self) -> str:
+        """Render the profile as compact, deterministic text for the screener instructions."""
+        sections = [
+            ("Summary", [self.summary]),
+            ("Years of experience", [str(self.years_experience)]),
+            ("Skills", [", ".join(self.skills)]),
+            ("Experience", self.experience),
+            ("Education", self.education),
+            ("Must haves", self.must_haves),
+            ("Deal breakers", self.deal_breakers),
+            ("Nice to haves", self.nice_to_haves),
+        ]
+        lines = []
+        for heading, items in sections:
+            lines.append(f"{heading}:")
+            lines.extend(f"- {item}" for item in items if item)
+        return "\n".join(lines)
+
+
+INSTRUCTIONS = (
+    "Condense the resume and job preferences into a candidate profile for screening job postings. \n"
+    "Keep every skill, tool and domain from the resume, and keep each role to one line. \n"
+    "Sort each preference into must haves, deal breakers or nice to haves, keeping its wording. \n"
+    "Do not invent anything that is not in the resume or preferences. "
+)
+
+
+def get_profile_agent() -> Agent:
+    return Agent(
+        name="CandidateProfiler",
+        instructions=INSTRUCTIONS,
+        output_type=CandidateProfile,
+        model="gpt-4.1-mini",
+    )
+
+
+class ProfileCache:
+    """Profiles stored as JSON files named by the hashes of the resume and preferences they came from."""
+    def __init__(self, directory: str = DEFAULT_PROFILE_DIR):
+        self.directory = Path(directory)
+
+    def _path(self, resume: str, preferences: str) -> Path:
+        return self.directory / f"{content_hash(resume)}-{content_hash(preferences)}.json"
+
+    def get(self, resume: str, preferences: str) -> Optional[CandidateProfile]:
+        path = self._path(resume, preferences)
+        if not path.exists():
+            return None
+        return CandidateProfile.model_validate_json(path.read_text(encoding="utf-8"))
+
+    def put(self, resume: str, preferences: str, profile: CandidateProfile) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._path(resume, preferences).write_text(profile.model_dump_json(indent=2), encoding="utf-8")
+
+
+async def load_candidate_profile(resume: str, preferences: str, cache_dir: Optional[str] = DEFAULT_PROFILE_DIR) -> CandidateProfile:
+    """Return the cached profile for this resume and preferences, building it with one model call if needed."""
+    cache = ProfileCache(cache_dir) if cache_dir else None
+    if cache is not None:
+        profile = cache.get(resume, preferences)
+        if profile is not None:
+            logging.info("Using cached candidate profile")
+            return profile
+    logging.info("Building candidate profile from the resume and preferences...")
+    result = await Runner.run(
+        get_profile_agent(),
+        input=f"Resume:\n{resume}\n\nPreferences:\n{preferences}",
+        run_config=limited_run_config(workflow_name="candidate profile"),
+        hooks=TimingHooks(),
+    )
+    profile = result.final_output
+    if cache is not None:
+        cache.put(resume, preferences, profile)
+    return profile
@@ -0,0 +1,198 @@
+"""
+Process-wide per-model request and token budgets shared by every agent call.
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Dict, Optional, Tuple
+
+from agents import RunConfig
+from agents.models.interface import Model, ModelProvider
+from agents.models.multi_provider import MultiProvider
+from openai.types.responses import ResponseCompletedEvent
+
+from .snapshot import estimate_tokens
+
+
+DEFAULT_LIMITS: Dict[str, Tuple[int, int]] = {
+    "gpt-4o-mini": (500, 200_000),
+    "gpt-4.1-nano": (500, 200_000),
+    "gpt-4.1-mini": (500, 200_000),
+    "gpt-4.1": (500, 30_000),
+}
+"""Requests and tokens per minute for each model; models not listed are not limited"""
+
+DEFAULT_OUTPUT_TOKENS = 500
+"""Output tokens reserved for a call that does not set max_tokens, settled once the usage is known"""
+
+
+class TokenBucket:
+    """Continuously refilled bucket holding up to one minute's budget."""
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until the bucket holds the amount, capped at its capacity."""
+        self._refill()
+        return max(0.0, (min(amount, self.capacity) - self.level) / self.rate)
+
+    def take(self, amount: float) -> None:
+        """Remove the amount; the level may go negative when usage is settled above the estimate."""
+        self._refill()
+        self.level -= min(amount, self.capacity)
+
+
+class ModelBudget:
+    """
+    Requests-per-minute and tokens-per-minute buckets for one model.
+    Calls queue in arrival order and wait until both buckets can cover them.
+    """
+    def __init__(self, model: str, rpm: int, tpm: int):
+        self.model = model
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.queued = 0
+        self.peak_queued = 0
+        self.calls = 0
+        self.waits = []
+        self.estimated_tokens = 0
+        self.actual_tokens = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> float:
+        """Wait for a request slot and the estimated tokens, returning the seconds waited."""
+        start = time.monotonic()
+        self.queued += 1
+        self.peak_queued = max(self.peak_queued, self.queued)
+        try:
+            async with self._lock:
+                while (wait := max(self.requests.wait_time(1), self.tokens.wait_time(tokens))) > 0:
+                    await asyncio.sleep(wait)
+                self.requests.take(1)
+                self.tokens.take(tokens)
+        finally:
+            self.queued -= 1
+        waited = time.monotonic() - start
+        self.calls += 1
+        self.waits.append(waited)
+        self.estimated_tokens += tokens
+        if waited > 1:
+            logging.info(f"Rate limit: waited {waited:.1f}s for {self.model} ({self.queued} still queued)")
+        return waited
+
+    def settle(self, estimated: int, actual: int) -> None:
+        """Charge or refund the difference between the estimated and the reported tokens."""
+        self.actual_tokens += actual
+        self.tokens.take(actual - estimated)
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "queued": self.queued,
+            "peak_queued": self.peak_queued,
+            "avg_wait": round(sum(self.waits) / len(self.waits), 2) if self.waits else 0,
+            "max_wait": round(max(self.waits), 2) if self.waits else 0,
+            "estimated_tokens": self.estimated_tokens,
+            "actual_tokens": self.actual_tokens,
+        }
+
+
+def estimate_call_tokens(system_instructions: Optional[str], input, model_settings, tools) -> int:
+    """Estimate the tokens a model call will use from its prompt, tool schemas and output allowance."""
+    prompt = (system_instructions or "") + (input if isinstance(input, str) else json.dumps(input, default=str))
+    schemas = "".join(json.dumps(getattr(tool, "params_json_schema", {})) for tool in tools or [])
+    max_tokens = getattr(model_settings, "max_tokens", None) or DEFAULT_OUTPUT_TOKENS
+    return estimate_tokens(prompt) + estimate_tokens(schemas) + max_tokens
+
+
+class RateLimitedModel(Model):
+    """Model wrapper that waits on its model's budget before every call."""
+    def __init__(self, model: Model, budget: ModelBudget):
+        self.model = model
+        self.budget = budget
+
+    def __getattr__(self, name):
+        return getattr(self.model, name)
+
+    async def get_response(self, system_instructions, input, model_settings, tools, output_schema, handoffs, tracing,
+                           *args, **kwargs):
+        estimated = estimate_call_tokens(system_instructions, input, model_settings, tools)
+        await self.budget.acquire(estimated)
+        response = await self.model.get_response(
+            system_instructions, input, model_settings, tools, output_schema, handoffs, tracing, *args, **kwargs)
+        self.budget.settle(estimated, response.usage.total_tokens)
+        return response
+
+    async def stream_response(self, system_instructions, input, model_settings, tools, output_schema, handoffs, tracing,
+                              *args, **kwargs):
+        """Stream the call, settling the estimate against the usage on the final completed event."""
+        estimated = estimate_call_tokens(system_instructions, input, model_settings, tools)
+        await self.budget.acquire(estimated)
+        async for event in self.model.stream_response(
+                system_instructions, input, model_settings, tools, output_schema, handoffs, tracing, *args, **kwargs):
+            # A stream that ends early never reports its usage, so its estimate stays charged
+            if isinstance(event, ResponseCompletedEvent) and event.response.usage is not None:
+                self.budget.settle(estimated, event.response.usage.total_tokens)
+            yield event
+
+
+class RateLimiter(ModelProvider):
+    """
+    Model provider that hands out rate-limited models, with one budget per model name
+    shared by every Runner.run call in the process.
+    """
+    def __init__(self, limits: Optional[Dict[str, Tuple[int, int]]] = None, provider: Optional[ModelProvider] = None):
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self.provider = provider or MultiProvider()
+        self.budgets: Dict[str, ModelBudget] = {}
+
+    def __getattr__(self, name):
+        return getattr(self.provider, name)
+
+    def get_model(self, model_name: Optional[str]) -> Model:
+        model = self.provider.get_model(model_name)
+        if model_name not in self.limits:
+            return model
+        if model_name not in self.budgets:
+            self.budgets[model_name] = ModelBudget(model_name, *self.limits[model_name])
+        return RateLimitedModel(model, self.budgets[model_name])
+
+    def queue_depth(self) -> int:
+        """Calls currently waiting on any model's budget."""
+        return sum(budget.queued for budget in self.budgets.values())
+
+    def stats(self) -> Dict[str, dict]:
+        return {name: budget.stats() for name, budget in self.budgets.items()}
+
+    def log_stats(self) -> None:
+        if self.budgets:
+            logging.info(f"Rate limiter: {self.stats()}")
+
+
+_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter."""
+    return _limiter
+
+
+def configure_rate_limiter(limits: Optional[Dict[str, Tuple[int, int]]] = None, **kwargs) -> RateLimiter:
+    """Replace the process-wide rate limiter, e.g. with the limits of a higher usage tier."""
+    global _limiter
+    _limiter = RateLimiter(limits, **kwargs)
+    return _limiter
+
+
+def limited_run_config(**kwargs) -> RunConfig:
+    """A RunConfig whose model calls go through the process-wide rate limiter."""
+    return RunConfig(model_provider=get_rate_limiter(), **kwargs)
@@ -1,5 +1,8 @@
+import logging
+from typing import List, Optional, Tuple
 from agents import Agent, ModelSettings
-from .context import JobScreenContext, fetch_job_and_user_info
+from .context import JobScreenContext, fetch_job_and_user_info, fetch_job_description
+from .profile import CandidateProfile
 
 
 INSTRUCTIONS = (
@@ -10,12 +13,79 @@ INSTRUCTIONS = (
     "4. Always hand off the result to the summary agent. "
 )
 
+CONFIDENCE_INSTRUCTIONS = (
+    "\nAlso report your confidence in the fit score between 0 and 1. "
+    "Use a low confidence when the job description is vague or the match is unclear. "
+)
+
+PROFILE_INSTRUCTIONS = (
+    "You are a job screening agent. Your task is to: \n"
+    "1. Fetch the job description from the context. \n"
+    "2. Analyze how well the job description matches the candidate profile below. \n"
+    "3. Rate the fit of the job between 1 and 5 (1=poor fit, 5=excellent fit). \n"
+    "   A job that hits a deal breaker or misses a must have is a poor fit. \n"
+    "4. Always hand off the result to the summary agent. "
+)
 
-def get_job_screen_agent() -> Agent[JobScreenContext]:
+
+def get_job_screen_agent(profile: Optional[CandidateProfile] = None,
+                         model: str = "gpt-4.1",
+                         confidence: bool = False) -> Agent[JobScreenContext]:
+    """
+    With a candidate profile, the instructions hold the fixed task text followed by the profile,
+    so every screen in a run starts with the same prompt prefix and only the fetched job varies.
+    With confidence, the screener also reports how sure it is, for deciding on escalation.
+    """
+    instructions = INSTRUCTIONS if profile is None else PROFILE_INSTRUCTIONS
+    if confidence:
+        instructions += CONFIDENCE_INSTRUCTIONS
+    if profile is None:
+        tools = [fetch_job_and_user_info]
+    else:
+        instructions += "\n\nCandidate profile:\n" + profile.to_prompt()
+        tools = [fetch_job_description]
     return Agent[JobScreenContext](
         name="JobScreen",
-        instructions=INSTRUCTIONS,
-        tools=[fetch_job_and_user_info],
+        instructions=instructions,
+        tools=tools,
         model_settings=ModelSettings(tool_choice='required'),
-        model="gpt-4.1"
-    ) 
\ No newline at end of file
+        model=model
+    )
+
+
+class ScreenStats:
+    """Jobs, latency and tokens of every screening call, by single or batch mode and model."""
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop the recorded screening calls, so tokens and seconds per job, and the cascade savings built on them, cover only the new run."""
+        self.calls: List[Tuple[str, int, float, int]] = []
+
+    def record(self, mode: str, model: str, jobs: int, seconds: float, tokens: int) -> None:
+        self.calls.append((f"{mode} {model}", jobs, seconds, tokens))
+
+    def summary(self) -> dict:
+        summary = {}
+        for mode in sorted({c[0] for c in self.calls}):
+            calls = [c for c in self.calls if c[0] == mode]
+            jobs = sum(c[1] for c in calls)
+            seconds = sum(c[2] for c in calls)
+            tokens = sum(c[3] for c in calls)
+            summary[mode] = {
+                "calls": len(calls),
+                "jobs": jobs,
+                "tokens": tokens,
+                "seconds": round(seconds, 2),
+                "tokens_per_job": round(tokens / jobs) if jobs else 0,
+                "seconds_per_job": round(seconds / jobs, 2) if jobs else 0,
+                "jobs_per_call_second": round(jobs / seconds, 3) if seconds else 0,
+            }
+        return summary
+
+    def log_summary(self) -> None:
+        if self.calls:
+            logging.info(f"Screening calls: {self.summary()}")
+
+
+screen_stats = ScreenStats()
@@ -1,24 +1,152 @@
 from agents import Agent
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional, Sequence
+from datetime import date
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import asyncio
+import logging
+import re
+import httpx
+
+
+SEARXNG_URL = "http://localhost:8080/"
+
+
+class SearchHit(BaseModel):
+    url: str
+    """The URL of the job posting"""
+
+    title: str
+    """The title of the search result"""
+
+    snippet: str
+    """The text snippet of the search result"""
 
 
 class SearchResults(BaseModel):
     retrieved_date: str
     """The date the search results were retrieved"""
-    
+
     pageno: int
     """The page number of the search results"""
 
     query: str
     """The query used to search for job postings"""
-    
+
     job_urls: List[str]
     """The URLs of the job postings"""
 
+    hits: List[SearchHit] = Field(default_factory=list)
+    """The title and snippet of each job posting, used to rank jobs before screening"""
+
+
+class JobUrlPattern(BaseModel):
+    name: str
+    """The applicant tracking system the pattern recognizes"""
+
+    pattern: str
+    """Regex matched against a search result URL to recognize a single job posting"""
+
+    query_term: str
+    """Term appended to the search query to bias results towards this ATS"""
+
+
+JOB_URL_PATTERNS: Dict[str, JobUrlPattern] = {
+    "greenhouse": JobUrlPattern(
+        name="greenhouse",
+        pattern=r"[?&]gh_jid=\d+",
+        query_term="gh_jid"),
+    "lever": JobUrlPattern(
+        name="lever",
+        pattern=r"^https?://jobs\.lever\.co/[^/]+/[0-9a-f-]{36}",
+        query_term="site:jobs.lever.co"),
+    "ashby": JobUrlPattern(
+        name="ashby",
+        pattern=r"^https?://jobs\.ashbyhq\.com/[^/]+/[0-9a-f-]{36}",
+        query_term="site:jobs.ashbyhq.com"),
+    "workday": JobUrlPattern(
+        name="workday",
+        pattern=r"^https?://[^/]+\.myworkdayjobs\.com/.+/job/",
+        query_term="site:myworkdayjobs.com"),
+}
+"""URL patterns for supported applicant tracking systems, keyed by name"""
+
+
+TRACKING_PARAMS = {"gh_src", "lever-source", "lever-origin", "source", "src", "ref"}
+"""Query parameters job boards add to record where a visitor came from"""
+
+
+def normalize_job_url(url: str) -> str:
+    """Drop the fragment and tracking parameters from a job URL."""
+    parts = urlsplit(url.strip())
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+def filter_job_urls(urls: Sequence[str], patterns: Sequence[JobUrlPattern]) -> List[str]:
+    """Keep normalized URLs that match any of the patterns, without duplicates and in order."""
+    compiled = [re.compile(p.pattern) for p in patterns]
+    job_urls: List[str] = []
+    for url in urls:
+        url = normalize_job_url(url)
+        if url not in job_urls and any(c.search(url) for c in compiled):
+            job_urls.append(url)
+    return job_urls
+
+
+class SearxngSearcher:
+    """
+    Search backend that calls the SearxNG JSON API directly and filters job URLs in code,
+    returning the same SearchResults as the search agent without a model call.
+    """
+    def __init__(self,
+                 base_url: str = SEARXNG_URL,
+                 patterns: Sequence[str] = ("greenhouse",),
+                 timeout: float = 30,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.base_url = base_url.rstrip("/")
+        self.patterns = [JOB_URL_PATTERNS[name] for name in patterns]
+        self._client = httpx.AsyncClient(timeout=timeout, transport=transport)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _search_pattern(self, query: str, pattern: JobUrlPattern, pageno: int) -> List[dict]:
+        """Fetch one page of raw SearxNG results for the query biased towards one ATS."""
+        resp = await self._client.get(
+            f"{self.base_url}/search",
+            params={"q": f"{query} {pattern.query_term}", "format": "json",
+                    "pageno": pageno, "language": "en"},
+        )
+        resp.raise_for_status()
+        return resp.json().get("results", [])
+
+    async def search(self, query: str, pageno: int = 1) -> SearchResults:
+        """Search every configured ATS for the query and return the matching job URLs."""
+        pages = await asyncio.gather(*(self._search_pattern(query, p, pageno) for p in self.patterns))
+        raw = [r for results in pages for r in results if r.get("url")]
+        job_urls = filter_job_urls([r["url"] for r in raw], self.patterns)
+        logging.info(f"Kept {len(job_urls)} of {len(raw)} search results as job URLs")
+        hits: Dict[str, SearchHit] = {}
+        for r in raw:
+            url = normalize_job_url(r["url"])
+            if url in job_urls and url not in hits:
+                hits[url] = SearchHit(url=url, title=r.get("title") or "", snippet=r.get("content") or "")
+        return SearchResults(
+            retrieved_date=date.today().isoformat(),
+            pageno=pageno,
+            query=query,
+            job_urls=job_urls,
+            hits=list(hits.values()),
+        )
+
 
-def build_job_searcher_agent(query: str, pageno: int = 1):
-    """Build the job searcher agent for the given query and page number."""
+def build_job_searcher_agent(query: str, pageno: int = 1, hits: bool = False):
+    """
+    Build the job searcher agent for the given query and page number. With hits, the agent
+    also copies each result's title and snippet, used to prioritize jobs before screening.
+    """
     INSTRUCTIONS = (
         f"You job is to search for {query} jobs. "
         "When searching, use the web_search tool and ALWAYS use the exact query "
@@ -26,6 +154,8 @@ def build_job_searcher_agent(query: str, pageno: int = 1):
         "Extract a list of URLs from the search results and store in the SearchResults.job_urls field. "
         "Only include URLs with a job id parameter like 'gh_jid' in the URL. "
     )
+    if hits:
+        INSTRUCTIONS += "For each of those URLs, also store the result title and snippet text unchanged in SearchResults.hits. "
     return Agent(
         name="Job Search Agent",
         instructions=INSTRUCTIONS,
@@ -0,0 +1,100 @@
+"""
+Shrinks Playwright MCP page snapshots before they reach the model.
+"""
+import logging
+import re
+from typing import List, Set, Tuple, Union
+
+from .html_extractor import BOILERPLATE
+
+
+MAX_SNAPSHOT_CHARS = 24000
+
+PRUNED_ROLES = re.compile(r"^- (banner|navigation|contentinfo|complementary|img|button|combobox|searchbox|textbox|checkbox)\b")
+"""Accessibility roles whose whole subtree never carries job description text"""
+
+REF = re.compile(r"\s*\[(ref|cursor)=[^\]]*\]")
+
+HAS_TEXT = re.compile(r'^- .*("[^"]+"|:\s+\S)')
+
+LINK_ROLES = re.compile(r"^- (link|menuitem|tab|option)\b")
+"""Roles repeated across a page as menus and "Apply" links, which are deduplicated page-wide"""
+
+HEADING = re.compile(r"^- heading\b")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for English text at about four characters per token."""
+    return (len(text) + 3) // 4
+
+
+def shrink_snapshot(text: str, max_chars: int = MAX_SNAPSHOT_CHARS) -> str:
+    """
+    Prune an accessibility snapshot down to the content the agents need.
+
+    Drops the subtrees of navigation, banner, footer and form-control nodes and of any
+    node matching cookie or EEO boilerplate, strips element refs (the agents cannot
+    click), removes repeated links anywhere and repeated text within a heading's section,
+    and caps the result at max_chars. The same bullet under two headings is kept.
+    """
+    kept: List[str] = []
+    seen: Set[Union[str, Tuple[str, str]]] = set()
+    section = ""
+    skip_indent = None
+    for line in text.splitlines():
+        stripped = line.lstrip(" ")
+        indent = len(line) - len(stripped)
+        if skip_indent is not None:
+            if indent > skip_indent and stripped:
+                continue
+            skip_indent = None
+        if PRUNED_ROLES.match(stripped) or (stripped.startswith("- ") and BOILERPLATE.search(stripped)):
+            skip_indent = indent
+            continue
+        line = REF.sub("", line)
+        key = line.strip()
+        if HEADING.match(key):
+            section = key
+        if HAS_TEXT.search(key):
+            # Repeated links (menus, "Apply" blocks) and text repeated within a section are dropped with their subtree
+            seen_key = key if LINK_ROLES.match(key) else (section, key)
+            if seen_key in seen:
+                skip_indent = indent
+                continue
+            seen.add(seen_key)
+        kept.append(line)
+    shrunk = "\n".join(kept)
+    if len(shrunk) > max_chars:
+        shrunk = shrunk[:max_chars] + "\n[snapshot truncated]"
+    return shrunk
+
+
+class SnapshotStats:
+    """Before/after token estimates for every snapshot passed through the shrinker."""
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop the recorded snapshot sizes, so the token reduction in the summary covers only the new run."""
+        self.calls: List[Tuple[str, int, int]] = []
+
+    def record(self, tool_name: str, before: int, after: int) -> None:
+        self.calls.append((tool_name, before, after))
+        logging.info(f"Shrank {tool_name} snapshot from ~{before} to ~{after} tokens")
+
+    def summary(self) -> dict:
+        before = sum(c[1] for c in self.calls)
+        after = sum(c[2] for c in self.calls)
+        return {
+            "calls": len(self.calls),
+            "tokens_before": before,
+            "tokens_after": after,
+            "reduction": round(1 - after / before, 3) if before else 0,
+        }
+
+    def log_summary(self) -> None:
+        if self.calls:
+            logging.info(f"Snapshot shrinking: {self.summary()}")
+
+
+snapshot_stats = SnapshotStats()
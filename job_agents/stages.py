@@ -0,0 +1,103 @@
+"""
+Pipeline stages: per-stage deadlines, transient versus permanent error classification and retry backoff.
+"""
+import asyncio
+import random
+import re
+from typing import Dict, List, Optional, Union
+
+from agents import Agent
+
+from .metrics import TimingHooks
+
+
+STAGES = ("check", "inspect", "extract", "screen", "summarize")
+
+DEFAULT_STAGE_TIMEOUTS: Dict[str, float] = {
+    "check": 30,
+    "inspect": 45,
+    "extract": 60,
+    "screen": 60,
+    "summarize": 30,
+}
+"""Seconds each stage may run, from its agent's first turn until the handoff to the next stage"""
+
+
+def _status(codes: str) -> str:
+    """
+    Match HTTP status codes after a status context ("Status code: 503", "status_code=503",
+    "HTTP 503") or standing alone, but not inside a URL or id such as /jobs/512/ or gh_jid=503.
+    """
+    return (rf"(?:status[ _]?code|http|error code)\W{{0,3}}(?:{codes})\b"
+            rf"|(?<![/\w=.-])(?:{codes})\b(?![/.\w-])")
+
+
+TRANSIENT = re.compile(
+    _status(r"408|429|5\d\d") + r"|rate.?limit|timed? ?out|timeout|overloaded"
+    r"|connection (?:reset|refused|closed|error)|server disconnected",
+    re.IGNORECASE)
+PERMANENT = re.compile(_status(r"404|410") + r"|not (?:a )?single job", re.IGNORECASE)
+
+
+def parse_stage_timeouts(specs: Optional[List[str]]) -> Dict[str, float]:
+    """Parse STAGE=SECONDS overrides of the default stage deadlines, raising ValueError on a bad one."""
+    timeouts = {}
+    for spec in specs or []:
+        stage, _, seconds = spec.partition("=")
+        if stage not in STAGES:
+            raise ValueError(f"Unknown stage '{stage}' in --stage-timeout, expected one of {', '.join(STAGES)}")
+        timeouts[stage] = float(seconds)
+    return timeouts
+
+
+class StageTimeout(Exception):
+    """Raised when a stage runs past its deadline."""
+    def __init__(self, stage: str, seconds: float):
+        super().__init__(f"{stage} stage timed out after {seconds:g}s")
+        self.stage = stage
+        self.seconds = seconds
+
+
+def is_transient(error: Union[BaseException, str, None]) -> bool:
+    """
+    Whether a failure is worth retrying: timeouts, rate limits, 5xx responses and dropped
+    connections. 404/410s, pages that are not a single job and anything unrecognised are permanent.
+    """
+    if error is None:
+        return False
+    if isinstance(error, (StageTimeout, TimeoutError)):
+        return True
+    status = getattr(error, "status_code", None)
+    if isinstance(status, int):
+        return status in (408, 429) or status >= 500
+    message = str(error) or type(error).__name__
+    return not PERMANENT.search(message) and bool(TRANSIENT.search(message))
+
+
+def backoff_delay(attempt: int, base: float = 2.0, maximum: float = 30.0) -> float:
+    """Exponential backoff for the given retry attempt (0 for the first), with jitter of plus or minus half."""
+    return min(maximum, base * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+class StageDeadlines(TimingHooks):
+    """
+    Timing hooks that also restart the deadline whenever a new stage's agent starts, through
+    the asyncio.timeout the run is wrapped in, and note the running stage on the context.
+    """
+    def __init__(self, stages: Dict[int, str], timeouts: Dict[str, float], timeout: asyncio.Timeout):
+        super().__init__(stages)
+        self.timeouts = timeouts
+        self.timeout = timeout
+        self.stage: Optional[str] = None
+
+    async def on_agent_start(self, context, agent: Agent) -> None:
+        await super().on_agent_start(context, agent)
+        stage = self.stages.get(id(agent))
+        if stage is None or stage == self.stage:
+            return
+        self.stage = stage
+        if not context.context.failed:
+            # A failure handed to the summary agent keeps the stage it happened in
+            context.context.stage = stage
+        seconds = self.timeouts.get(stage)
+        self.timeout.reschedule(asyncio.get_running_loop().time() + seconds if seconds else None)
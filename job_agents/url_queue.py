@@ -0,0 +1,99 @@
+"""
+Bounded queue of job URLs shared between the search producer and the screening workers.
+"""
+import asyncio
+import heapq
+import itertools
+from typing import Callable, Iterable, List, Optional, Tuple
+
+
+class UrlQueue:
+    """
+    Bounded priority queue of URLs waiting to be screened. Higher priority URLs are
+    screened first, and URLs of equal priority in the order they were put.
+
+    The search task puts URLs and blocks while the queue is full. It asks for another
+    search page only once the queue drains to the low-water mark and the screeners
+    still want more URLs, so search never pages further ahead than needed.
+    """
+    def __init__(self, maxsize: int = 50, low_water: int = 10):
+        self.maxsize = maxsize
+        self.low_water = low_water
+        self.wanted: Optional[int] = None
+        """How many more URLs the screeners could use, or None if unbounded"""
+        self.closed = False
+        """Set once no more URLs will be added"""
+        self._urls: List[Tuple[float, int, str]] = []
+        self._order = itertools.count()
+        self._changed = asyncio.Condition()
+
+    @classmethod
+    async def from_urls(cls, urls: Iterable[str]) -> "UrlQueue":
+        """Build a closed queue holding a fixed list of URLs."""
+        urls = list(urls)
+        queue = cls(maxsize=max(len(urls), 1))
+        for url in urls:
+            await queue.put(url)
+        await queue.close()
+        return queue
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    async def put(self, url: str, priority: float = 0.0) -> None:
+        """Add a URL, waiting while the queue is full. URLs put after close are dropped."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.closed or len(self._urls) < self.maxsize)
+            if self.closed:
+                return
+            heapq.heappush(self._urls, (-priority, next(self._order), url))
+            self._changed.notify_all()
+
+    async def get(self, busy: Optional[Callable[[str], bool]] = None) -> Optional[str]:
+        """
+        Return the next URL, or None once the queue is closed and drained.
+
+        With busy, the best URL for which busy(url) is false is taken first, so screens
+        interleave across domains; if every queued URL is busy the best one is taken anyway.
+        """
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.closed or self._urls)
+            if not self._urls:
+                return None
+            skipped = []
+            entry = heapq.heappop(self._urls)
+            while busy is not None and busy(entry[2]) and self._urls:
+                skipped.append(entry)
+                entry = heapq.heappop(self._urls)
+            if busy is not None and busy(entry[2]) and skipped:
+                skipped.append(entry)
+                entry = min(skipped)
+                skipped.remove(entry)
+            for other in skipped:
+                heapq.heappush(self._urls, other)
+            self._changed.notify_all()
+            return entry[2]
+
+    async def close(self) -> None:
+        """Mark the queue as complete and wake everyone waiting on it."""
+        async with self._changed:
+            self.closed = True
+            self._changed.notify_all()
+
+    async def set_wanted(self, wanted: Optional[int]) -> None:
+        """Update how many more URLs the screeners could use."""
+        async with self._changed:
+            self.wanted = wanted
+            self._changed.notify_all()
+
+    def _needs_more(self) -> bool:
+        if self.closed:
+            return True
+        if len(self._urls) > self.low_water:
+            return False
+        return self.wanted is None or len(self._urls) < self.wanted
+
+    async def wait_for_demand(self) -> None:
+        """Wait until the queue is at or below the low-water mark and more URLs are wanted."""
+        async with self._changed:
+            await self._changed.wait_for(self._needs_more)
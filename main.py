@@ -6,6 +6,13 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from manager import JobSearchManager
+from job_agents.searcher import SEARXNG_URL, JOB_URL_PATTERNS
+from job_agents.cache import DEFAULT_CACHE_PATH
+from job_agents.archive import DEFAULT_ARCHIVE_PATH
+from job_agents.profile import DEFAULT_PROFILE_DIR
+from job_agents.prescreen import DEFAULT_THRESHOLD
+from job_agents.rate_limiter import DEFAULT_LIMITS
+from job_agents.stages import STAGES, DEFAULT_STAGE_TIMEOUTS, parse_stage_timeouts
 
 load_dotenv()
 
@@ -39,11 +46,209 @@ def parse_args() -> argparse.Namespace:
         "-o", "--output", dest="output_path", required=True,
         help="File path to write TSV results for screening outputs"
     )
+    parser.add_argument(
+        "--metrics", dest="metrics_path",
+        help="File path to write run metrics as JSON (defaults to the output path with a .metrics.json suffix)"
+    )
     parser.add_argument(
         "-l", "--log", dest="log_path",
         help="File path to write logs"
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--batch-size", dest="batch_size", type=int, default=5,
+        help="Number of job screens in flight at once (the starting number with --adaptive-concurrency)"
+    )
+    parser.add_argument(
+        "--adaptive-concurrency", dest="adaptive_concurrency", action="store_true",
+        help="Raise the number of in-flight screens while they are healthy and halve it on MCP timeouts, "
+             "rate limiting or host memory pressure"
+    )
+    parser.add_argument(
+        "--min-concurrency", dest="min_concurrency", type=int, default=1,
+        help="Lower bound on in-flight screens with --adaptive-concurrency"
+    )
+    parser.add_argument(
+        "--max-concurrency", dest="max_concurrency", type=int,
+        help="Upper bound on in-flight screens with --adaptive-concurrency (defaults to twice the batch size)"
+    )
+    parser.add_argument(
+        "--domain-max-per-host", dest="domain_max_per_host", type=int, default=2,
+        help="Maximum concurrent reachability checks or browser navigations per domain"
+    )
+    parser.add_argument(
+        "--domain-min-interval", dest="domain_min_interval", type=float, default=0.5,
+        help="Minimum seconds between the starts of two requests to the same domain"
+    )
+    parser.add_argument(
+        "--pool-size", dest="pool_size", type=int,
+        help="Number of warm Playwright browser sessions (defaults to the maximum number of in-flight screens)"
+    )
+    parser.add_argument(
+        "--pool-max-uses", dest="pool_max_uses", type=int, default=20,
+        help="Recycle a browser session after this many job screens"
+    )
+    parser.add_argument(
+        "--pool-max-age", dest="pool_max_age", type=float, default=600,
+        help="Recycle a browser session after this many seconds"
+    )
+    parser.add_argument(
+        "--queue-size", dest="queue_size", type=int, default=50,
+        help="Maximum number of searched URLs buffered ahead of screening"
+    )
+    parser.add_argument(
+        "--queue-low-water", dest="queue_low_water", type=int, default=10,
+        help="Fetch the next search page once this few URLs remain queued"
+    )
+    parser.add_argument(
+        "--no-precheck", dest="precheck_urls", action="store_false",
+        help="Skip the concurrent reachability check of each URL batch before screening"
+    )
+    parser.add_argument(
+        "--check-mode", dest="check_mode", choices=["agent", "direct"], default="agent",
+        help="Check URL reachability with the UrlChecker agent, or directly in Python without a model call"
+    )
+    parser.add_argument(
+        "--search-backend", dest="search_backend", choices=["agent", "direct"], default="agent",
+        help="Search with the LLM search agent over mcp-searxng, or call the SearxNG JSON API directly"
+    )
+    parser.add_argument(
+        "--searxng-url", dest="searxng_url", default=SEARXNG_URL,
+        help="Base URL of the SearxNG instance"
+    )
+    parser.add_argument(
+        "--ats", nargs="+", choices=sorted(JOB_URL_PATTERNS), default=["greenhouse"],
+        help="Applicant tracking systems whose job URLs the direct search backend keeps"
+    )
+    parser.add_argument(
+        "--seen-index", dest="seen_index_path",
+        help="File of job keys screened in earlier runs; those jobs are skipped in search results (not --urls) and new ones are added"
+    )
+    parser.add_argument(
+        "--cache", dest="cache_path", default=DEFAULT_CACHE_PATH,
+        help="SQLite file caching screening results across runs"
+    )
+    parser.add_argument(
+        "--no-cache", dest="cache_path", action="store_const", const=None,
+        help="Bypass the screening result cache"
+    )
+    parser.add_argument(
+        "--refresh-cache", dest="refresh_cache", action="store_true",
+        help="Ignore cached results but store the fresh ones"
+    )
+    parser.add_argument(
+        "--cache-ttl-days", dest="cache_ttl_days", type=float, default=7,
+        help="Days before a cached screening result expires"
+    )
+    parser.add_argument(
+        "--archive", dest="archive_path", default=DEFAULT_ARCHIVE_PATH,
+        help="Compressed file that extracted job descriptions are appended to"
+    )
+    parser.add_argument(
+        "--no-archive", dest="archive_path", action="store_const", const=None,
+        help="Do not archive extracted job descriptions"
+    )
+    parser.add_argument(
+        "--archive-snapshots", dest="archive_snapshots", action="store_true",
+        help="Also archive the page snapshot each description was extracted from"
+    )
+    parser.add_argument(
+        "--rescreen-archive", dest="rescreen_archive_path",
+        help="Skip search, browsing and extraction; re-screen the job descriptions in this archive"
+    )
+    parser.add_argument(
+        "--extract-mode", dest="extract_mode", choices=["agent", "html"], default="agent",
+        help="Extract job descriptions with the browser agents, or parse the page HTML first and fall back to the browser"
+    )
+    parser.add_argument(
+        "--combined-extract", dest="combined_extract", action="store_true",
+        help="Inspect and extract the page in a single navigation turn instead of two agents"
+    )
+    parser.add_argument(
+        "--no-profile", dest="use_profile", action="store_false",
+        help="Screen against the raw resume and preferences instead of the condensed candidate profile"
+    )
+    parser.add_argument(
+        "--profile-dir", dest="profile_dir", default=DEFAULT_PROFILE_DIR,
+        help="Directory caching candidate profiles by resume and preferences hash"
+    )
+    parser.add_argument(
+        "--prescreen", dest="prescreen", action="store_true",
+        help="Score extracted jobs locally and give a low fit score without the screener model to jobs that fail"
+    )
+    parser.add_argument(
+        "--prescreen-threshold", dest="prescreen_threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="Minimum share (0-1) of the job's term weight found in the resume for a job to pass the local pre-screen"
+    )
+    parser.add_argument(
+        "--no-prioritize", dest="prioritize", action="store_false",
+        help="Screen searched URLs in search order instead of ranking them by title and snippet"
+    )
+    parser.add_argument(
+        "--screen-mode", dest="screen_mode", choices=["single", "batch"], default="single",
+        help="Score each job in its own screener call, or several extracted jobs together in one call"
+    )
+    parser.add_argument(
+        "--screen-batch-tokens", dest="screen_batch_tokens", type=int, default=8000,
+        help="Send a screening batch once its job descriptions reach this many estimated tokens"
+    )
+    parser.add_argument(
+        "--screen-batch-wait", dest="screen_batch_wait", type=float, default=3.0,
+        help="Send a screening batch at most this many seconds after its first job arrives"
+    )
+    parser.add_argument(
+        "--screen-models", dest="screen_models", nargs="+", default=["gpt-4.1"],
+        help="Screener models from cheapest to strongest; borderline scores escalate to the next model"
+    )
+    parser.add_argument(
+        "--escalate-scores", dest="escalate_scores", nargs="+", type=int, default=[2, 3, 4],
+        help="Fit scores that are re-scored by the next screener model"
+    )
+    parser.add_argument(
+        "--escalate-confidence", dest="escalate_confidence", type=float, default=0.7,
+        help="Scores with a confidence (0-1) below this are re-scored by the next screener model"
+    )
+    parser.add_argument(
+        "--rate-limit", dest="rate_limits", nargs="+", metavar="MODEL=RPM:TPM",
+        help="Requests and tokens per minute for a model, replacing its default budget"
+    )
+    parser.add_argument(
+        "--no-rate-limit", dest="rate_limit", action="store_false",
+        help="Send model calls without waiting on the per-model request and token budgets"
+    )
+    parser.add_argument(
+        "--stage-timeout", dest="stage_timeouts", nargs="+", metavar="STAGE=SECONDS",
+        help=f"Deadline for a pipeline stage ({', '.join(STAGES)}); defaults: "
+             + ", ".join(f"{stage}={seconds}" for stage, seconds in DEFAULT_STAGE_TIMEOUTS.items())
+    )
+    parser.add_argument(
+        "--stage-retries", dest="stage_retries", type=int, default=2,
+        help="Retries of a job after a transient failure (timeout, 5xx, rate limit), resuming at the failed stage"
+    )
+    parser.add_argument(
+        "--retry-delay", dest="retry_base_delay", type=float, default=2.0,
+        help="Base delay in seconds before the first retry, doubled for each further retry"
+    )
+    args = parser.parse_args()
+    try:
+        args.stage_timeouts = parse_stage_timeouts(args.stage_timeouts)
+        args.rate_limits = parse_rate_limits(args)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def parse_rate_limits(args: argparse.Namespace) -> dict:
+    """Merge MODEL=RPM:TPM overrides into the default per-model budgets, raising ValueError on a bad one."""
+    if not args.rate_limit:
+        return {}
+    limits = dict(DEFAULT_LIMITS)
+    for spec in args.rate_limits or []:
+        model, _, budget = spec.partition("=")
+        rpm, _, tpm = budget.partition(":")
+        if not (model and rpm.isdigit() and tpm.isdigit() and int(rpm) > 0 and int(tpm) > 0):
+            raise ValueError(f"Invalid --rate-limit '{spec}', expected MODEL=RPM:TPM with positive whole numbers")
+        limits[model] = (int(rpm), int(tpm))
+    return limits
 
 
 async def main():
@@ -76,7 +281,48 @@ async def main():
         preferences_path=args.preferences_path,
         urls=args.urls,
         desired_count=args.desired_count,
-        search_only=args.search_only
+        search_only=args.search_only,
+        batch_size=args.batch_size,
+        adaptive_concurrency=args.adaptive_concurrency,
+        min_concurrency=args.min_concurrency,
+        max_concurrency=args.max_concurrency,
+        pool_size=args.pool_size,
+        pool_max_uses=args.pool_max_uses,
+        pool_max_age=args.pool_max_age,
+        queue_size=args.queue_size,
+        queue_low_water=args.queue_low_water,
+        precheck_urls=args.precheck_urls,
+        check_mode=args.check_mode,
+        search_backend=args.search_backend,
+        searxng_url=args.searxng_url,
+        ats=args.ats,
+        seen_index_path=args.seen_index_path,
+        cache_path=args.cache_path,
+        cache_ttl_days=args.cache_ttl_days,
+        refresh_cache=args.refresh_cache,
+        archive_path=args.archive_path,
+        archive_snapshots=args.archive_snapshots,
+        rescreen_archive_path=args.rescreen_archive_path,
+        extract_mode=args.extract_mode,
+        combined_extract=args.combined_extract,
+        use_profile=args.use_profile,
+        profile_dir=args.profile_dir,
+        prescreen=args.prescreen,
+        prescreen_threshold=args.prescreen_threshold,
+        prioritize=args.prioritize,
+        screen_mode=args.screen_mode,
+        screen_batch_tokens=args.screen_batch_tokens,
+        screen_batch_wait=args.screen_batch_wait,
+        screen_models=args.screen_models,
+        escalate_scores=args.escalate_scores,
+        escalate_confidence=args.escalate_confidence,
+        rate_limits=args.rate_limits,
+        domain_max_per_host=args.domain_max_per_host,
+        domain_min_interval=args.domain_min_interval,
+        stage_timeouts=args.stage_timeouts,
+        stage_retries=args.stage_retries,
+        retry_base_delay=args.retry_base_delay,
+        metrics_path=args.metrics_path or str(Path(args.output_path).with_suffix(".metrics.json")),
     )
     try:
         results = await manager.run()
@@ -3,34 +3,40 @@ Manager script orchestrating the job search and screening pipeline.
 """
 import argparse
 import asyncio
+import json
 import logging
-from typing import List, Optional, Dict, Any
+import time
+from typing import List, Optional, Dict, Any, Set, Tuple
 from pathlib import Path
-from agents import Runner, handoff, HandoffInputData, RunConfig
+from contextlib import nullcontext
+from agents import Runner, RunContextWrapper
 from agents.mcp.server import MCPServerStdio
-from scripts.screening_pipeline_demo import PlaywrightServer
-from agents.extensions import handoff_filters
-from urllib.parse import urlparse
-
-from job_agents.searcher import build_job_searcher_agent, SearchResults
-from job_agents.checker import get_url_checker_agent
-from job_agents.inspector import get_page_inspector_agent
-from job_agents.extractor import get_extract_description_agent
-from job_agents.screener import get_job_screen_agent
-from job_agents.summarizer import get_summary_agent
+
+from job_agents.browser import PlaywrightPool, readiness_stats
+from job_agents.snapshot import snapshot_stats
+from job_agents.url_queue import UrlQueue
+from job_agents.identity import job_key, SeenIndex
+from job_agents.cache import ResultCache, content_hash, DEFAULT_CACHE_PATH
+from job_agents.archive import DescriptionArchive, ArchivedJob, DEFAULT_ARCHIVE_PATH
+from job_agents.searcher import build_job_searcher_agent, normalize_job_url, SearchResults, SearxngSearcher, SEARXNG_URL
+from job_agents.checker import get_reachability_checker, UrlVetterOutput
+from job_agents.html_extractor import extract_job_html
+from job_agents.pipeline import ScreeningPipeline, ScreenDeferred
+from job_agents.profile import load_candidate_profile, DEFAULT_PROFILE_DIR
+from job_agents.prescreen import PreScreener, DEFAULT_THRESHOLD
+from job_agents.batch_screener import BatchScreener
+from job_agents.screener import screen_stats
+from job_agents.rate_limiter import configure_rate_limiter, get_rate_limiter, limited_run_config, DEFAULT_LIMITS
+from job_agents.concurrency import ConcurrencyController
+from job_agents.metrics import run_metrics, TimingHooks
+from job_agents.stages import is_transient, backoff_delay
+from job_agents.domains import url_host, get_domain_limiter, configure_domain_limiter
 from job_agents.context import (JobScreenContext,
-                                ErrorMessage,
                                 UrlResult,
-                                InspectionResult,
                                 JobDescription,
-                                FitScore,
                                 SummaryAgentOutput,
-                                record_error_on_handoff,
                                 record_url,
-                                record_inspection,
-                                record_job_description,
-                                record_fit_score)
-
+                                record_job_description)
 
 class JobSearchManager:
     """Orchestrates the job search and screening workflow."""
@@ -41,7 +47,47 @@ class JobSearchManager:
                  urls: Optional[List[str]] = None,
                  desired_count: Optional[int] = None,
                  search_only: bool = False,
-                 batch_size: int = 5):
+                 batch_size: int = 5,
+                 adaptive_concurrency: bool = False,
+                 min_concurrency: int = 1,
+                 max_concurrency: Optional[int] = None,
+                 pool_size: Optional[int] = None,
+                 pool_max_uses: int = 20,
+                 pool_max_age: float = 600,
+                 queue_size: int = 50,
+                 queue_low_water: int = 10,
+                 precheck_urls: bool = True,
+                 check_mode: str = "agent",
+                 search_backend: str = "agent",
+                 searxng_url: str = SEARXNG_URL,
+                 ats: Optional[List[str]] = None,
+                 seen_index_path: Optional[str] = None,
+                 cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+                 cache_ttl_days: float = 7,
+                 refresh_cache: bool = False,
+                 archive_path: Optional[str] = DEFAULT_ARCHIVE_PATH,
+                 archive_snapshots: bool = False,
+                 rescreen_archive_path: Optional[str] = None,
+                 extract_mode: str = "agent",
+                 combined_extract: bool = False,
+                 use_profile: bool = True,
+                 profile_dir: Optional[str] = DEFAULT_PROFILE_DIR,
+                 prescreen: bool = False,
+                 prescreen_threshold: float = DEFAULT_THRESHOLD,
+                 prioritize: bool = True,
+                 screen_mode: str = "single",
+                 screen_batch_tokens: int = 8000,
+                 screen_batch_wait: float = 3.0,
+                 screen_models: Optional[List[str]] = None,
+                 escalate_scores: Optional[List[int]] = None,
+                 escalate_confidence: float = 0.7,
+                 rate_limits: Optional[Dict[str, Tuple[int, int]]] = None,
+                 domain_max_per_host: int = 2,
+                 domain_min_interval: float = 0.5,
+                 stage_timeouts: Optional[Dict[str, float]] = None,
+                 stage_retries: int = 2,
+                 retry_base_delay: float = 2.0,
+                 metrics_path: Optional[str] = None):
         self.job_title = job_title
         self.resume_path = resume_path
         self.preferences_path = preferences_path
@@ -49,124 +95,440 @@ class JobSearchManager:
         self.desired_count = desired_count
         self.search_only = search_only
         self.batch_size = batch_size
+        # batch_size is the starting number of in-flight screens; without adaptive concurrency it stays fixed
+        self.max_concurrency = (max_concurrency or 2 * batch_size) if adaptive_concurrency else batch_size
+        self.concurrency = ConcurrencyController(initial=batch_size,
+                                                 minimum=min_concurrency if adaptive_concurrency else batch_size,
+                                                 maximum=self.max_concurrency)
+        self.queue_size = queue_size
+        self.queue_low_water = queue_low_water
+        self.precheck_urls = precheck_urls
+        self.precheck_failures: List[SummaryAgentOutput] = []
+        self.check_mode = check_mode
+        self.search_backend = search_backend
+        self.searxng_url = searxng_url
+        self.seen_index = SeenIndex(seen_index_path) if seen_index_path else None
+        self._queued_keys: Set[str] = set()
+        self._deferred = 0
+        """Screens waiting on a batch, which do not count against the concurrency limit"""
+        self._slot_freed = asyncio.Event()
+        self.cache = ResultCache(cache_path, ttl_seconds=cache_ttl_days * 24 * 3600) if cache_path else None
+        self.refresh_cache = refresh_cache
+        self.archive = DescriptionArchive(archive_path) if archive_path else None
+        self.archive_snapshots = archive_snapshots
+        self.extract_mode = extract_mode
+        self.combined_extract = combined_extract
+        self.use_profile = use_profile
+        self.profile_dir = profile_dir
+        self.prescreen = prescreen
+        self.prescreen_threshold = prescreen_threshold
+        self.prioritize = prioritize
+        self.ranker: Optional[PreScreener] = None
+        self.screen_mode = screen_mode
+        self.screen_batch_tokens = screen_batch_tokens
+        self.screen_batch_wait = screen_batch_wait
+        self.screen_models = screen_models or ["gpt-4.1"]
+        self.escalate_scores = escalate_scores or [2, 3, 4]
+        self.escalate_confidence = escalate_confidence
+        self.stage_timeouts = stage_timeouts
+        self.stage_retries = stage_retries
+        self.retry_base_delay = retry_base_delay
+        self.metrics_path = metrics_path
+        # Every agent call in the process shares one request and token budget per model
+        configure_rate_limiter(DEFAULT_LIMITS if rate_limits is None else rate_limits)
+        # Reachability checks and browser navigations share per-host caps and spacing
+        configure_domain_limiter(max_per_host=domain_max_per_host, min_interval=domain_min_interval)
+        self.pipeline: Optional[ScreeningPipeline] = None
+        self.archived_jobs: Dict[str, ArchivedJob] = (
+            DescriptionArchive(rescreen_archive_path).latest() if rescreen_archive_path else {})
+        self.searcher = (SearxngSearcher(searxng_url, patterns=ats or ["greenhouse"])
+                         if search_backend == "direct" else None)
+        # One warm browser session per concurrent screen unless told otherwise
+        self.pool = PlaywrightPool(size=pool_size or self.max_concurrency,
+                                   max_uses=pool_max_uses,
+                                   max_age_seconds=pool_max_age)
+        self.pool.resize(self.concurrency.limit)
 
-    def _message_filter(self, handoff_message_data: HandoffInputData) -> HandoffInputData:
-        """Filter handoff messages to remove tool content and keep only recent history."""
-        handoff_message_data = handoff_filters.remove_all_tools(handoff_message_data)
-
-        history = (
-            tuple(handoff_message_data.input_history[-1:])
-            if isinstance(handoff_message_data.input_history, tuple)
-            else handoff_message_data.input_history
+    def _unreachable_output(self, url: str, check: UrlVetterOutput) -> SummaryAgentOutput:
+        """Build the failed result for a URL that did not pass the reachability check."""
+        error_message = check.error_message or f"Status code: {check.status_code}"
+        logging.warning(f"Unable to screen job posting: {url} is not reachable ({error_message})")
+        return SummaryAgentOutput(
+            url=url,
+            company="",
+            title="",
+            fit_score=0,
+            reason="URL is not reachable",
+            failed=True,
+            error_message=error_message
         )
 
-        return HandoffInputData(
-            input_history=history,
-            pre_handoff_items=tuple(handoff_message_data.pre_handoff_items),
-            new_items=tuple(handoff_message_data.new_items),
-        )
+    def _archive_description(self, url: str, context: JobScreenContext, snapshot: Optional[str] = None) -> None:
+        """Append the job description recorded in the context to the archive."""
+        if self.archive is None:
+            return
+        self.archive.append(job_key(url), url, JobDescription(
+            company=context.company or "",
+            title=context.title or "",
+            job_description=context.job_description),
+            snapshot if self.archive_snapshots else None)
+
+    def _screener_hash(self) -> str:
+        """Hash of the settings that decide a screen's verdict, so a run with another screener misses the cache."""
+        cascade = len(self.screen_models) > 1
+        return content_hash(json.dumps({
+            "prescreen_threshold": self.prescreen_threshold if self.prescreen else None,
+            "screen_mode": self.screen_mode,
+            "screen_models": self.screen_models,
+            "escalate_scores": sorted(self.escalate_scores) if cascade else None,
+            "escalate_confidence": self.escalate_confidence if cascade else None,
+            "profile": self.use_profile,
+        }, sort_keys=True))
 
     async def _screen_single_job(self, url: str) -> SummaryAgentOutput:
         """Screen a single job URL through the full pipeline."""
-        async with PlaywrightServer(
-            params={"command": "npx", "args": ["@playwright/mcp@latest", "--config", "playwright_config/config.json"]},
-            client_session_timeout_seconds=60,
-        ) as server:
+        start = time.monotonic()
+        # Create the context object with the resume and preferences read at the start of the run
+        context = self.pipeline.new_context()
+
+        # Re-screening from the archive starts with the job description already extracted
+        archived = self.archived_jobs.get(job_key(url))
+        if archived is not None:
+            context.url = url
+            await record_job_description(RunContextWrapper(context), archived.to_job_description())
+        description_hash = content_hash(context.job_description) if archived is not None else None
+
+        # Return a cached screen of the same job, resume, preferences and screener before launching anything
+        cache_key = (job_key(url), content_hash(context.resume), content_hash(context.preferences), self._screener_hash())
+        if self.cache is not None and not self.refresh_cache:
+            cached = self.cache.get(*cache_key, description_hash)
+            if cached is not None:
+                logging.info(f"Using cached screening result for {url}")
+                return cached
+
+        output = await self._screen_with_retries(url, context)
+
+        logging.info(f"Screened {url} in {time.monotonic() - start:.1f}s ({self.check_mode} check)")
+        if self.cache is not None and isinstance(output, SummaryAgentOutput) and not output.failed:
+            self.cache.put(*cache_key, content_hash(context.job_description), output)
+        return output
+
+    async def _run_stages(self, url: str, context: JobScreenContext) -> SummaryAgentOutput:
+        """Run the stages the context has not completed, in a pooled browser session if the page still needs one."""
+        if not context.url and not context.job_description and self.check_mode == "direct":
+            # Check reachability in Python instead of spending a UrlChecker model turn
+            context.stage = "check"
+            start = time.monotonic()
+            check = await get_reachability_checker().check(url)
+            run_metrics.record("stage", "check", time.monotonic() - start)
+            if not check.reachable:
+                return self._unreachable_output(url, check)
+            await record_url(RunContextWrapper(context), UrlResult(url=url))
+
+        if not context.job_description and self.extract_mode == "html":
+            # Parse server-rendered ATS pages directly and only fall back to the browser agents
+            context.stage = "extract"
+            start = time.monotonic()
+            description = await extract_job_html(url)
+            run_metrics.record("stage", "extract", time.monotonic() - start)
+            if description is not None:
+                logging.info(f"Extracted {url} from HTML without a browser")
+                context.url = url
+                await record_job_description(RunContextWrapper(context), description)
+                self._archive_description(url, context)
+
+        if context.job_description:
+            try:
+                return await self.pipeline.run(url, context)
+            except ScreenDeferred:
+                return await self._batch_screen(url, context)
+        # An error leaving this block retires the session, so a retry gets a fresh browser
+        async with self.pool.session() as server:
             try:
-                # Create the context object
-                context = JobScreenContext()
-                # Load resume and preferences into context
-                context.resume = Path(self.resume_path).read_text(encoding='utf-8')
-                context.preferences = Path(self.preferences_path).read_text(encoding='utf-8')
-
-                # Create the agents
-                url_checker_agent = get_url_checker_agent()
-                page_inspector_agent = get_page_inspector_agent(server)
-                job_extractor_agent = get_extract_description_agent(server)
-                screener_agent = get_job_screen_agent()
-                summary_agent = get_summary_agent()
-
-                # Define handoffs between agents
-                failed_summary_handoff = handoff(agent=summary_agent, on_handoff=record_error_on_handoff, input_type=ErrorMessage)
-                url_checker_handoff = handoff(agent=page_inspector_agent, on_handoff=record_url, input_type=UrlResult)
-                page_inspector_handoff = handoff(agent=job_extractor_agent, on_handoff=record_inspection, input_type=InspectionResult)
-                extractor_handoff = handoff(agent=screener_agent, on_handoff=record_job_description, input_type=JobDescription)
-                screener_handoff = handoff(agent=summary_agent, on_handoff=record_fit_score, input_type=FitScore)
-
-                # Add handoffs to agents
-                url_checker_agent.handoffs = [url_checker_handoff, failed_summary_handoff]
-                page_inspector_agent.handoffs = [page_inspector_handoff, failed_summary_handoff]
-                job_extractor_agent.handoffs = [extractor_handoff]
-                screener_agent.handoffs = [screener_handoff]
-
-                # Start the handoff chain
-                domain_name = urlparse(url).netloc.replace("www.", "").split(".")[-2] # domain name before .com/org/etc
-                workflow_name = f"{domain_name} job screen"
-                logging.info(f"Starting handoff chain for {workflow_name}...")
-                run_config = RunConfig(handoff_input_filter=self._message_filter, workflow_name=workflow_name)            
-                result = await Runner.run(url_checker_agent, input=url, context=context, run_config=run_config)
-
-                return result.final_output
+                return await self.pipeline.run(url, context, server)
+            except ScreenDeferred:
+                pass
+        # The browser session is back in the pool before the job waits for its batch
+        return await self._batch_screen(url, context)
+
+    async def _batch_screen(self, url: str, context: JobScreenContext) -> SummaryAgentOutput:
+        """Wait for the job's batch without holding a screening slot, so the next jobs can start and fill the batch."""
+        self._deferred += 1
+        self._slot_freed.set()
+        try:
+            return await self.pipeline.batch_screen(url, context)
+        finally:
+            self._deferred -= 1
+
+    async def _screen_with_retries(self, url: str, context: JobScreenContext) -> SummaryAgentOutput:
+        """
+        Run the stages, retrying transient failures with backoff and jitter. The context keeps
+        what the earlier stages recorded, so a retry starts again at the stage that failed.
+        """
+        for attempt in range(self.stage_retries + 1):
+            start = time.monotonic()
+            try:
+                output = await self._run_stages(url, context)
+                error = output.error_message if output.failed else None
             except Exception as e:
-                return SummaryAgentOutput(
-                    url=url,
-                    company="",
-                    title="",
-                    fit_score=0,
-                    reason=f"Processing failed: {e}",
-                    failed=True,
-                    error_message=str(e)
-                )
+                output, error = self._failed_output(url, e), e
+            if error is None or attempt == self.stage_retries or not is_transient(error):
+                return output
+            # The window only sees the final result, so report the 429 or timeout a retry absorbs here
+            self.concurrency.record(time.monotonic() - start, True, output.error_message)
+            delay = backoff_delay(attempt, self.retry_base_delay)
+            logging.warning(f"Transient failure in the {context.stage or 'check'} stage of {url}, "
+                            f"retrying in {delay:.1f}s: {output.error_message}")
+            context.failed, context.error_message = False, None
+            await asyncio.sleep(delay)
+
+    def _failed_output(self, url: str, error: Any) -> SummaryAgentOutput:
+        """Wrap an unexpected output or exception as a failed SummaryAgentOutput."""
+        return SummaryAgentOutput(
+            url=url,
+            company="",
+            title="",
+            fit_score=0,
+            reason=f"Processing failed: {error}",
+            failed=True,
+            error_message=str(error) or type(error).__name__
+        )
+
+    def _collect_result(self, url: str, task: asyncio.Task) -> SummaryAgentOutput:
+        """Return the result of a finished screening task, continuing on individual errors."""
+        error = task.exception()
+        result = error if error is not None else task.result()
+        if isinstance(result, Exception) or not isinstance(result, SummaryAgentOutput):
+            logging.error(f"Error screening {url}: {result}", exc_info=error)
+            return self._failed_output(url, result)
+        return result
+
+    async def _cancel_in_flight(self, in_flight: Dict[asyncio.Task, str]) -> None:
+        """Cancel screens that are still running and wait for them to release their sessions."""
+        if in_flight:
+            logging.info(f"Cancelling {len(in_flight)} in-flight job screens")
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+        in_flight.clear()
+
+    async def _screen_window(self, queue: UrlQueue) -> List[SummaryAgentOutput]:
+        """
+        Keep up to the concurrency controller's limit of screens in flight, starting the next
+        queued URL as soon as any slot frees up and feeding each finished screen back to the controller.
+        Screens waiting on a batch free their slot.
+
+        Screens until the queue is closed and drained. When desired_count successes have
+        arrived the remaining in-flight screens are cancelled.
+        """
+        results: List[SummaryAgentOutput] = []
+        in_flight: Dict[asyncio.Task, str] = {}
+        started: Dict[asyncio.Task, float] = {}
+        getter: Optional[asyncio.Task] = None
+        waker: Optional[asyncio.Task] = None
+        successful = 0
+        exhausted = False
+        try:
+            while True:
+                if self.desired_count is not None:
+                    await queue.set_wanted(self.desired_count - successful - len(in_flight))
+                if getter is None and not exhausted:
+                    self.concurrency.check_memory()
+                # Browser sessions follow the limit, so backing off on memory pressure closes Chromium instances
+                self.pool.resize(self.concurrency.limit)
+                if getter is None and not exhausted and len(in_flight) - self._deferred < self.concurrency.limit:
+                    # Prefer a URL on a domain no in-flight screen is using, so one host is not burst
+                    getter = asyncio.create_task(queue.get(
+                        lambda url: url_host(url) in {url_host(u) for u in in_flight.values()}))
+                waiting = set(in_flight) | ({getter} if getter else set())
+                if not waiting:
+                    break
+                if waker is None:
+                    waker = asyncio.create_task(self._slot_freed.wait())
+                done, _ = await asyncio.wait(waiting | {waker}, return_when=asyncio.FIRST_COMPLETED)
+                if waker in done:
+                    self._slot_freed.clear()
+                    waker = None
+                if getter in done:
+                    url = getter.result()
+                    getter = None
+                    if url is None:
+                        exhausted = True
+                    else:
+                        task = asyncio.create_task(self._screen_single_job(url))
+                        in_flight[task] = url
+                        started[task] = time.monotonic()
+                        logging.info(f"Started screening {url} ({len(in_flight)} of {self.concurrency.limit} in flight)")
+                finished = [task for task in done if task in in_flight]
+                for task in finished:
+                    url = in_flight.pop(task)
+                    result = self._collect_result(url, task)
+                    latency = time.monotonic() - started.pop(task)
+                    self.concurrency.record(latency, result.failed, result.error_message)
+                    run_metrics.record_screen(latency, result.failed)
+                    results.append(result)
+                    if not result.failed:
+                        successful += 1
+                        if self.seen_index is not None:
+                            self.seen_index.add(job_key(url))
+                if finished:
+                    logging.info(f"Current successful job screens: {successful}")
+                if self.desired_count is not None and successful >= self.desired_count:
+                    break
+        finally:
+            if getter is not None:
+                getter.cancel()
+            if waker is not None:
+                waker.cancel()
+            await self._cancel_in_flight(in_flight)
+        return results
+
+    def _dedupe(self, urls: List[str], skip_seen: bool = True) -> List[str]:
+        """
+        Drop URLs whose job was already queued this run, and unless skip_seen is False,
+        those screened in an earlier run.
+        """
+        fresh: List[str] = []
+        for url in urls:
+            key = job_key(url)
+            if key in self._queued_keys:
+                continue
+            if skip_seen and self.seen_index is not None and key in self.seen_index:
+                continue
+            self._queued_keys.add(key)
+            fresh.append(url)
+        if len(fresh) < len(urls):
+            logging.info(f"Skipping {len(urls) - len(fresh)} duplicate or previously screened job URLs")
+        return fresh
+
+    async def _queue_urls(self, queue: UrlQueue, urls: List[str], priorities: Optional[Dict[str, float]] = None) -> None:
+        """
+        Put URLs on the queue with their priorities. With the precheck on, the URLs are checked
+        concurrently and each one is queued as soon as its own check passes, so screening
+        starts without waiting for the slowest check.
+        """
+        priorities = priorities or {}
+        if not self.precheck_urls:
+            for url in urls:
+                await queue.put(url, priorities.get(normalize_job_url(url), 0.0))
+            return
+        checker = get_reachability_checker()
+
+        async def check(url: str):
+            return url, await checker.check(url)
+
+        checks = [asyncio.create_task(check(url)) for url in urls]
+        try:
+            for next_check in asyncio.as_completed(checks):
+                url, result = await next_check
+                if result.reachable or is_transient(result.error_message or f"Status code: {result.status_code}"):
+                    # Transient failures go on to screening, which retries them
+                    await queue.put(url, priorities.get(normalize_job_url(url), 0.0))
+                else:
+                    self.precheck_failures.append(self._unreachable_output(url, result))
+        finally:
+            for task in checks:
+                task.cancel()
 
     async def screen_multiple_jobs(self, urls: List[str]) -> List[SummaryAgentOutput]:
-        """Run screening of multiple job URLs in parallel, continuing on individual errors."""
-        # Launch screening tasks concurrently, allowing individual failures to be caught
-        tasks = [asyncio.create_task(self._screen_single_job(url)) for url in urls]
-        raw_results = await asyncio.gather(*tasks, return_exceptions=True)
-        # Normalize results: wrap any unexpected outputs or exceptions as failed SummaryAgentOutput
-        final_results: List[SummaryAgentOutput] = []
-        for url, result in zip(urls, raw_results):
-            if isinstance(result, Exception) or not isinstance(result, SummaryAgentOutput):
-                logging.error(f"Error screening {url}: {result}", exc_info=True)
-                final_results.append(SummaryAgentOutput(
-                    url=url,
-                    company="",
-                    title="",
-                    fit_score=0,
-                    reason=f"Processing failed: {result}",
-                    failed=True,
-                    error_message=str(result)
-                ))
-            else:
-                final_results.append(result)
-        return final_results
-
-    async def screen_jobs_in_batches(self, urls: List[str]) -> List[SummaryAgentOutput]:
-        """Screen URLs in batches respecting the batch_size setting."""
-        all_results: List[SummaryAgentOutput] = []
-        for i in range(0, len(urls), self.batch_size):
-            batch_number = i // self.batch_size + 1
-            batch = urls[i : i + self.batch_size]
-            logging.info(f"Starting batch {batch_number} of parallel screening of {len(batch)} job postings")
-            successful_count = len([r for r in all_results if not getattr(r, 'failed', False)])
-            logging.info(f"Current successful job screens: {successful_count}")
-            batch_results = await self.screen_multiple_jobs(batch)
-            all_results.extend(batch_results)
-            if self.desired_count is not None:
-                successful = [r for r in all_results if not getattr(r, 'failed', False)]
-                if len(successful) >= self.desired_count:
+        """
+        Screen a list of job URLs with a sliding window of batch_size concurrent screens.
+        The URLs were asked for explicitly, so ones in the seen index are screened again.
+        """
+        urls = self._dedupe(urls, skip_seen=False)
+        # precheck_failures accumulates over the run, so return only this call's failures
+        failures_before = len(self.precheck_failures)
+        queue = UrlQueue(maxsize=max(len(urls), 1))
+
+        async def fill() -> None:
+            try:
+                await self._queue_urls(queue, urls)
+            finally:
+                await queue.close()
+
+        producer = asyncio.create_task(fill())
+        try:
+            results = await self._screen_window(queue)
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+        return results + self.precheck_failures[failures_before:]
+
+    async def _search_page_with_retries(self, server, pageno: int) -> SearchResults:
+        """Fetch a search page, retrying transient failures with backoff and jitter like a screen."""
+        for attempt in range(self.stage_retries + 1):
+            try:
+                return await self.search_page(server, pageno)
+            except Exception as e:
+                if attempt == self.stage_retries or not is_transient(e):
+                    raise
+                delay = backoff_delay(attempt, self.retry_base_delay)
+                logging.warning(f"Transient failure searching page {pageno}, retrying in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+
+    async def _search_producer(self, server, queue: UrlQueue) -> None:
+        """
+        Page through search results ahead of the screeners until search runs dry, a page fails
+        permanently or a transient failure outlasts the retries.
+        """
+        page = 1
+        try:
+            while True:
+                await queue.wait_for_demand()
+                if queue.closed:
+                    break
+                search_results = await self._search_page_with_retries(server, page)
+                new_urls = search_results.job_urls
+                logging.info(f"Found {len(new_urls)} job URLs")
+                if not new_urls:
                     break
-        return all_results
+                page += 1
+                # The queue hands out the most promising jobs first so desired_count is reached with fewer screens
+                await self._queue_urls(queue, self._dedupe(new_urls), self._priorities(search_results))
+        except Exception as e:
+            logging.error(f"Job search failed on page {page}: {e}", exc_info=True)
+        finally:
+            await queue.close()
 
-    async def search_jobs(self, server, pageno: int = 1) -> List[str]:
-        """Run the search agent for a given page number."""
-        agent = build_job_searcher_agent(self.job_title, pageno)
+    def _search_server(self):
+        """Return the SearxNG MCP server for the search agent, or a no-op context for direct search."""
+        if self.search_backend == "direct":
+            return nullcontext()
+        return MCPServerStdio(
+            params={
+                "command": "mcp-searxng",
+                "env": {"SEARXNG_URL": self.searxng_url, "SEARXNG_MCP_TIMEOUT": "240"},
+                "client_session_timeout_seconds": 240,
+            }
+        )
+
+    async def search_page(self, server, pageno: int = 1) -> SearchResults:
+        """Run the search agent (or the direct SearxNG client) for a given page number."""
+        if self.search_backend == "direct":
+            logging.info(f"Searching SearxNG directly for jobs (page {pageno})...")
+            return await self.searcher.search(self.job_title, pageno)
+        agent = build_job_searcher_agent(self.job_title, pageno, hits=self.prioritize)
         agent.mcp_servers = [server]
         logging.info(f"Searching for jobs (page {pageno})...")
-        result = await Runner.run(agent, self.job_title, run_config=RunConfig(workflow_name=f"search page {pageno}"))
-        search_results: SearchResults = result.final_output
+        result = await Runner.run(agent, self.job_title, run_config=limited_run_config(workflow_name=f"search page {pageno}"),
+                                  hooks=TimingHooks())
+        return result.final_output
+
+    async def search_jobs(self, server, pageno: int = 1) -> List[str]:
+        """Return the job URLs on a given search page."""
+        search_results = await self._search_page_with_retries(server, pageno)
         return search_results.job_urls
 
+    def _priorities(self, search_results: SearchResults) -> Dict[str, float]:
+        """Score each job URL's search title and snippet against the resume and preferences."""
+        if self.ranker is None:
+            return {}
+        priorities = {normalize_job_url(hit.url): self.ranker.priority(f"{hit.title}\n{hit.snippet}", job_key(hit.url))
+                      for hit in search_results.hits}
+        for url, priority in sorted(priorities.items(), key=lambda item: item[1], reverse=True):
+            logging.info(f"Search priority {priority:.3f}: {url}")
+        return priorities
+
     def compile_report(self, raw_results: Dict[str, Any]) -> str:
         """Return a short summary report of the screening results."""
         successful = [r for r in raw_results if not getattr(r, "failed", False)]
@@ -201,6 +563,8 @@ class JobSearchManager:
             "=" * 60,
             "JOB SCREENING REPORT",
             "=" * 60,
+            *run_metrics.report_lines(),
+            "-" * 60,
             f"Total jobs processed:    {total}",
             f"Successful screenings:   {success}",
             f"Failed screenings:       {failed}",
@@ -209,17 +573,117 @@ class JobSearchManager:
             f"Medium fit jobs (2-3):   {medium}",
             f"Low fit jobs (1-2):      {low}",
         ]
+        if self.cache is not None:
+            lines.append(f"Cache hits / misses:     {self.cache.hits} / {self.cache.misses}")
+        for mode, stats in screen_stats.summary().items():
+            lines.append(f"Screen tokens/job ({mode}): {stats['tokens_per_job']} over {stats['calls']} calls")
+        failing = sorted(((stats["failures"], host) for host, stats in get_domain_limiter().summary().items()
+                          if stats["failures"]), reverse=True)
+        if failing:
+            lines.append("Failing domains:         " + ", ".join(f"{host} ({count})" for count, host in failing[:5]))
+        if self.concurrency.adaptive:
+            lines.append(f"Concurrency (final/max): {self.concurrency.limit} / {self.max_concurrency}, "
+                         f"{len(self.concurrency.changes)} changes")
+        if len(self.screen_models) > 1:
+            lines.extend(self._cascade_lines(raw_results))
+        if self.prescreen:
+            prescreened = [r for r in raw_results if (getattr(r, "reason", None) or "").startswith("Pre-screen:")]
+            lines.append(f"Pre-screen rejections:   {len(prescreened)}")
         return "\n".join(lines)
 
+    def _cascade_lines(self, raw_results: List[SummaryAgentOutput]) -> List[str]:
+        """Report lines on which tier settled each screen and the savings against screening every job with the last tier."""
+        tiers = [getattr(r, "tier", None) for r in raw_results]
+        settled = list(self.screen_models)
+        if self.screen_mode == "batch":
+            settled.insert(0, f"batch {self.screen_models[0]}")
+        lines = [f"{'Settled by ' + tier + ':':<25}{tiers.count(tier)}" for tier in settled]
+        stats = screen_stats.summary()
+        last = stats.get(f"single {self.screen_models[-1]}")
+        if not last:
+            lines.append(f"Cascade savings:         n/a, no job reached {self.screen_models[-1]}")
+            return lines
+        jobs = sum(tiers.count(tier) for tier in settled)
+        spent = [stats[key] for key in [*(f"single {model}" for model in self.screen_models),
+                                        f"batch {self.screen_models[0]}"] if key in stats]
+        saved_tokens = jobs * last["tokens_per_job"] - sum(s["tokens"] for s in spent)
+        saved_seconds = jobs * last["seconds_per_job"] - sum(s["seconds"] for s in spent)
+        lines.append(f"Cascade savings:         ~{saved_tokens} tokens, ~{saved_seconds:.1f}s of screening time")
+        return lines
+
+    async def _build_pipeline(self) -> ScreeningPipeline:
+        """Read the resume and preferences once and build the agent graph shared by every job in the run."""
+        resume = Path(self.resume_path).read_text(encoding='utf-8')
+        preferences = Path(self.preferences_path).read_text(encoding='utf-8')
+        profile = None
+        if self.use_profile:
+            try:
+                profile = await load_candidate_profile(resume, preferences, self.profile_dir)
+            except Exception as e:
+                logging.warning(f"Unable to build candidate profile, screening with the raw resume and preferences: {e}")
+        prescreener = PreScreener(resume, preferences, self.prescreen_threshold) if self.prescreen else None
+        batcher = None
+        if self.screen_mode == "batch":
+            batcher = BatchScreener(resume,
+                                    preferences,
+                                    profile=profile,
+                                    max_tokens=self.screen_batch_tokens,
+                                    max_wait=self.screen_batch_wait,
+                                    max_jobs=self.max_concurrency,
+                                    model=self.screen_models[0])
+        return ScreeningPipeline(resume,
+                                 preferences,
+                                 profile=profile,
+                                 prescreener=prescreener,
+                                 batcher=batcher,
+                                 screen_models=self.screen_models,
+                                 escalate_scores=self.escalate_scores,
+                                 escalate_confidence=self.escalate_confidence,
+                                 combined_extract=self.combined_extract,
+                                 stage_timeouts=self.stage_timeouts,
+                                 on_description=lambda context, snapshot: self._archive_description(
+                                     context.url, context, snapshot))
+
     async def run(self) -> Dict[str, Any]:
         """Main entrypoint for running the manager."""
-        async with MCPServerStdio(
-            params={
-                "command": "mcp-searxng",
-                "env": {"SEARXNG_URL": "http://localhost:8080/", "SEARXNG_MCP_TIMEOUT": "240"},
-                "client_session_timeout_seconds": 240,
-            }
-        ) as searxng_server:
+        self.precheck_failures = []
+        self._queued_keys = set()
+        # The stats are process-wide, so a second run in the same process starts from zero
+        for stats in (run_metrics, readiness_stats, snapshot_stats, screen_stats, get_domain_limiter()):
+            stats.reset()
+        if not self.search_only:
+            self.pipeline = await self._build_pipeline()
+            if self.prioritize:
+                # Separate from the pre-screen so snippets do not skew its description statistics
+                self.ranker = PreScreener(self.pipeline.resume, self.pipeline.preferences)
+        try:
+            return await self._run()
+        finally:
+            await get_reachability_checker().aclose()
+            readiness_stats.log_summary()
+            snapshot_stats.log_summary()
+            screen_stats.log_summary()
+            self.concurrency.log_summary()
+            get_domain_limiter().log_summary()
+            get_rate_limiter().log_stats()
+            if self.metrics_path:
+                run_metrics.write(self.metrics_path)
+            if self.cache is not None:
+                self.cache.log_stats()
+            if self.searcher is not None:
+                await self.searcher.aclose()
+
+    async def _run(self) -> Dict[str, Any]:
+        """Search and screen jobs inside the MCP server sessions."""
+        if self.archived_jobs:
+            # No search, browser or extraction needed: only the screener and summary agents run
+            logging.info(f"Re-screening {len(self.archived_jobs)} archived job descriptions")
+            results = await self._screen_window(
+                await UrlQueue.from_urls([job.url for job in self.archived_jobs.values()]))
+            logging.info("Job Search Completed")
+            return results
+
+        async with self._search_server() as searxng_server:
             if self.urls:
                 logging.info("Manual override: using provided URLs and skipping search agent")
                 urls = self.urls
@@ -229,45 +693,38 @@ class JobSearchManager:
                         logging.info(url)
                     logging.info("Job Search Completed")
                     return {"urls": urls}
-                results = await self.screen_jobs_in_batches(urls)
+                async with self.pool:
+                    results = await self.screen_multiple_jobs(urls)
                 logging.info("Job Search Completed")
                 return results
 
             # Automatic search mode
             page = 1
-            pending_urls: List[str] = []
-            results: List[SummaryAgentOutput] = []
-            successful = 0
-            batch_number = 0
-
-            while True:
-                if not pending_urls:
+            if self.search_only:
+                urls: List[str] = []
+                while self.desired_count is None or len(urls) < self.desired_count:
                     new_urls = await self.search_jobs(searxng_server, page)
                     logging.info(f"Found {len(new_urls)} job URLs")
                     if not new_urls:
                         break
-                    pending_urls.extend(new_urls)
+                    urls.extend(new_urls)
                     page += 1
-
-                batch = pending_urls[: self.batch_size]
-                pending_urls = pending_urls[self.batch_size:]
-                batch_number += 1
-                logging.info(f"Starting batch {batch_number} of parallel screening of {len(batch)} job postings")
-                logging.info(f"Current successful job screens: {successful}")
-                batch_results = await self.screen_multiple_jobs(batch)
-                results.extend(batch_results)
-                successful += len([r for r in batch_results if not getattr(r, 'failed', False)])
-
-                if self.search_only:
-                    continue
-                if self.desired_count is not None and successful >= self.desired_count:
-                    break
-
-            if self.search_only:
                 logging.info("Search only mode: found URLs:")
-                for url in [r.url for r in results]:
+                for url in urls:
                     logging.info(url)
                 logging.info("Job Search Completed")
-                return {"urls": [r.url for r in results]}
+                return {"urls": urls}
+
+            # Search runs as its own task so the next page is fetched while screening continues
+            queue = UrlQueue(maxsize=self.queue_size, low_water=self.queue_low_water)
+            producer = asyncio.create_task(self._search_producer(searxng_server, queue))
+            try:
+                async with self.pool:
+                    results = await self._screen_window(queue)
+            finally:
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+            results += self.precheck_failures
+
             logging.info("Job Search Completed")
             return results
@@ -0,0 +1,317 @@
+"""
+Offline fakes for the pipeline benchmark: a scripted model that drives the handoff chain,
+and stub web_search and Playwright MCP servers, each with configurable latency, failures
+and payload sizes.
+
+The stub servers run as stdio MCP servers like the real ones:
+
+$ python -m scripts.benchmark_fakes playwright
+$ python -m scripts.benchmark_fakes search
+
+with their settings passed as JSON in the BENCHMARK_FAKES environment variable.
+"""
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import List, Optional
+
+from agents.items import ModelResponse
+from agents.models.interface import Model, ModelProvider
+from agents.usage import Usage
+from openai.types.responses import (Response,
+                                    ResponseCompletedEvent,
+                                    ResponseFunctionToolCall,
+                                    ResponseOutputMessage,
+                                    ResponseOutputText,
+                                    ResponseUsage)
+
+from job_agents.snapshot import estimate_tokens
+
+
+ENV_VAR = "BENCHMARK_FAKES"
+
+URL = re.compile(r"https?://[^\s\"'<>\\]+")
+
+FILLER = (
+    "We are looking for an engineer to build and operate distributed data pipelines in Python, "
+    "design APIs, mentor teammates and work closely with product and research. "
+)
+
+
+@dataclass
+class Latency:
+    """Log-normal latency in seconds with the given median; sigma sets how heavy the tail is."""
+    median: float
+    sigma: float = 0.5
+
+    def sample(self) -> float:
+        return random.lognormvariate(0, self.sigma) * self.median if self.median > 0 else 0.0
+
+
+@dataclass
+class FakeSettings:
+    """Latency, failure rates and payload sizes shared by the fake model and the stub servers."""
+    model_latency: Latency = field(default_factory=lambda: Latency(0.8))
+    model_error_rate: float = 0.0
+    """Share of model calls that fail with a 429 or 500"""
+    page_latency: Latency = field(default_factory=lambda: Latency(1.5))
+    page_error_rate: float = 0.0
+    """Share of navigations that fail with a connection error"""
+    page_hang_rate: float = 0.0
+    """Share of navigations that never return, to exercise the stage deadlines"""
+    page_chars: int = 20_000
+    """Size of each page snapshot"""
+    unreachable_rate: float = 0.0
+    """Share of URLs the UrlChecker reports as unreachable"""
+    reject_rate: float = 0.0
+    """Share of pages the inspector rejects as not a single job"""
+    search_latency: Latency = field(default_factory=lambda: Latency(2.0))
+    results_per_page: int = 20
+    domains: int = 5
+    """Number of job board hosts the search results are spread over"""
+
+    def to_env(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_env(cls) -> "FakeSettings":
+        data = json.loads(os.environ.get(ENV_VAR, "{}"))
+        for name in ("model_latency", "page_latency", "search_latency"):
+            if name in data:
+                data[name] = Latency(**data[name])
+        return cls(**data)
+
+
+def stub_params(kind: str, settings: FakeSettings) -> dict:
+    """Stdio parameters that launch a stub MCP server of the given kind with the settings."""
+    return {
+        "command": sys.executable,
+        "args": ["-m", "scripts.benchmark_fakes", kind],
+        "env": {**os.environ, ENV_VAR: settings.to_env()},
+    }
+
+
+# Scripted model
+
+
+class FakeAPIError(Exception):
+    """Model API failure with a status code, as the OpenAI client raises."""
+    def __init__(self, status_code: int):
+        super().__init__(f"Error code: {status_code} (fake)")
+        self.status_code = status_code
+
+
+def _call(name: str, arguments: dict) -> ResponseFunctionToolCall:
+    return ResponseFunctionToolCall(type="function_call", call_id=f"call_{random.getrandbits(48):x}",
+                                    name=name, arguments=json.dumps(arguments), id="fc")
+
+
+def _message(text: str) -> ResponseOutputMessage:
+    return ResponseOutputMessage(id="msg", role="assistant", status="completed", type="message",
+                                 content=[ResponseOutputText(type="output_text", text=text, annotations=[])])
+
+
+def _items(input) -> List[dict]:
+    return [{"role": "user", "content": input}] if isinstance(input, str) else list(input)
+
+
+def _example(schema: dict, defs: Optional[dict] = None):
+    """A plausible value for a JSON schema, for structured outputs the script has no special case for."""
+    defs = defs or schema.get("$defs", {})
+    if "$ref" in schema:
+        return _example(defs[schema["$ref"].split("/")[-1]], defs)
+    if "anyOf" in schema:
+        return _example(schema["anyOf"][0], defs)
+    if "enum" in schema:
+        return random.choice(schema["enum"])
+    kind = schema.get("type")
+    if kind == "object":
+        return {name: _example(prop, defs) for name, prop in schema.get("properties", {}).items()}
+    if kind == "array":
+        return [_example(schema.get("items", {}), defs) for _ in range(3)]
+    if kind == "integer":
+        return random.randint(1, 10)
+    if kind == "number":
+        return round(random.random(), 2)
+    if kind == "boolean":
+        return True
+    return "python distributed systems"
+
+
+class ScriptedModel(Model):
+    """
+    Plays each agent in the pipeline from its tools, handoffs and output schema: call the
+    agent's tool once, then hand off or answer using what the tool returned.
+    """
+    def __init__(self, settings: FakeSettings):
+        self.settings = settings
+
+    async def get_response(self, system_instructions, input, model_settings, tools, output_schema, handoffs, tracing,
+                           *args, **kwargs):
+        await asyncio.sleep(self.settings.model_latency.sample())
+        if random.random() < self.settings.model_error_rate:
+            raise FakeAPIError(random.choice([429, 500]))
+        items = _items(input)
+        output = self._respond(system_instructions or "", items, tools, output_schema, handoffs)
+        prompt = (system_instructions or "") + json.dumps(items, default=str)
+        out_tokens = estimate_tokens(output.model_dump_json())
+        usage = Usage(requests=1, input_tokens=estimate_tokens(prompt), output_tokens=out_tokens,
+                      total_tokens=estimate_tokens(prompt) + out_tokens)
+        return ModelResponse(output=[output], usage=usage, response_id=None)
+
+    async def stream_response(self, system_instructions, input, model_settings, tools, output_schema, handoffs, tracing,
+                              *args, **kwargs):
+        """Stream the scripted response as a single completed-response event."""
+        response = await self.get_response(system_instructions, input, model_settings, tools, output_schema, handoffs,
+                                           tracing, *args, **kwargs)
+        usage = ResponseUsage(input_tokens=response.usage.input_tokens,
+                              input_tokens_details=response.usage.input_tokens_details,
+                              output_tokens=response.usage.output_tokens,
+                              output_tokens_details=response.usage.output_tokens_details,
+                              total_tokens=response.usage.total_tokens)
+        yield ResponseCompletedEvent(type="response.completed", sequence_number=0, response=Response(
+            id=f"resp_{random.getrandbits(48):x}", created_at=time.time(), model="scripted", object="response",
+            output=response.output, parallel_tool_calls=False, tool_choice="auto", tools=[], usage=usage))
+
+    def _respond(self, instructions: str, items: List[dict], tools, output_schema, handoffs):
+        names = [tool.name for tool in tools]
+        outputs = [str(item.get("output", "")) for item in items if item.get("type") == "function_call_output"]
+        text = " ".join(str(item.get("content", "")) for item in items if "content" in item)
+        urls = URL.findall(text)
+        url = urls[0] if urls else ""
+
+        if "check_url_reachability" in names:
+            if random.random() < self.settings.unreachable_rate:
+                return self._handoff(handoffs[1], message="Status code: 404")
+            return self._handoff(handoffs[0], url=url)
+        if "browser_navigate" in names:
+            if not outputs:
+                return _call("browser_navigate", {"url": url})
+            inspecting = any("page_is_single_job" in json.dumps(h.input_json_schema) for h in handoffs)
+            if inspecting and random.random() < self.settings.reject_rate:
+                # The PageInspector's failure handoff, or the PageExtractor's rejection handoff
+                return self._handoff(handoffs[1], page_is_single_job=False,
+                                     message="The page is not a single job posting",
+                                     inspection_reason="The page is not a single job posting")
+            return self._handoff(handoffs[0], page_is_single_job=True, inspection_reason="A single job posting",
+                                 job_description=outputs[-1][:self.settings.page_chars])
+        if "fetch_job_screen_result" in names:
+            return _call("fetch_job_screen_result", {})
+        fetch = next((name for name in names if name.startswith("fetch_job")), None)
+        if fetch:
+            if not outputs:
+                return _call(fetch, {})
+            return self._handoff(handoffs[0], fit_score=random.randint(1, 5), reason="Scripted fit score",
+                                 confidence=round(random.random(), 2))
+        search = next((name for name in names if "search" in name), None)
+        if search:
+            if not outputs:
+                page = re.search(r"pageno=(\d+)", instructions)
+                return _call(search, {"query": text, "pageno": int(page.group(1)) if page else 1, "language": "en"})
+            return _message(json.dumps(self._search_results(outputs[-1], text)))
+        schema = output_schema.json_schema() if output_schema is not None else {}
+        if "scores" in schema.get("properties", {}):
+            jobs = len(re.findall(r"^Job \d+$", text, re.MULTILINE))
+            return _message(json.dumps({"scores": [
+                {"job_id": i, "fit_score": random.randint(1, 5), "reason": "Scripted fit score"} for i in range(jobs)]}))
+        return _message(json.dumps(_example(schema)))
+
+    def _handoff(self, handoff, **values):
+        properties = handoff.input_json_schema.get("properties", {})
+        arguments = {name: values.get(name, _example(prop)) for name, prop in properties.items()}
+        for name in ("company", "title"):
+            if name in arguments:
+                arguments[name] = f"Fake {name}"
+        return _call(handoff.tool_name, arguments)
+
+    @staticmethod
+    def _search_results(output: str, query: str) -> dict:
+        hits = [{"url": u, "title": "Software Engineer", "snippet": "Python distributed systems role"}
+                for u in dict.fromkeys(URL.findall(output))]
+        return {"retrieved_date": "2025-01-01", "pageno": 1, "query": query,
+                "job_urls": [hit["url"] for hit in hits], "hits": hits}
+
+
+class ScriptedProvider(ModelProvider):
+    """Model provider serving the scripted model for every model name."""
+    def __init__(self, settings: FakeSettings):
+        self.settings = settings
+
+    def get_model(self, model_name: Optional[str]) -> Model:
+        return ScriptedModel(self.settings)
+
+
+# Stub MCP servers
+
+
+def _page(url: str, settings: FakeSettings) -> str:
+    """A page snapshot of the configured size with the section headings the readiness check looks for."""
+    body = (FILLER * (settings.page_chars // len(FILLER) + 1))[:settings.page_chars]
+    return (f"- Page URL: {url}\n- Page Title: Software Engineer\n- Page Snapshot:\n"
+            f"About the role\nResponsibilities\n{body}\nQualifications\nApply for this job\n")
+
+
+def serve_playwright(settings: FakeSettings) -> None:
+    mcp = FastMCP("playwright")
+    state = {"url": "about:blank"}
+
+    @mcp.tool()
+    async def browser_navigate(url: str) -> str:
+        """Navigate to a URL"""
+        if random.random() < settings.page_hang_rate:
+            await asyncio.sleep(3600)
+        await asyncio.sleep(settings.page_latency.sample())
+        if random.random() < settings.page_error_rate:
+            raise RuntimeError(f"net::ERR_CONNECTION_RESET at {url}")
+        state["url"] = url
+        return _page(url, settings)
+
+    @mcp.tool()
+    async def browser_wait_for(time: Optional[float] = None, text: Optional[str] = None) -> str:
+        """Wait for text to appear or a time to pass"""
+        await asyncio.sleep(min(time or 0, 0.1))
+        return _page(state["url"], settings)
+
+    @mcp.tool()
+    async def browser_snapshot() -> str:
+        """Capture an accessibility snapshot of the current page"""
+        return _page(state["url"], settings)
+
+    @mcp.tool()
+    async def browser_close() -> str:
+        """Close the page"""
+        state["url"] = "about:blank"
+        return "Closed"
+
+    mcp.run()
+
+
+def serve_search(settings: FakeSettings) -> None:
+    mcp = FastMCP("searxng")
+
+    @mcp.tool()
+    async def web_search(query: str, pageno: int = 1, language: str = "en") -> str:
+        """Search the web"""
+        await asyncio.sleep(settings.search_latency.sample())
+        first = (pageno - 1) * settings.results_per_page
+        results = [{"url": f"https://careers{job % settings.domains}.example.com/jobs/{job}?gh_jid={job}",
+                    "title": f"Software Engineer {job}",
+                    "content": "Python distributed systems role"}
+                   for job in range(first, first + settings.results_per_page)]
+        return json.dumps({"results": results})
+
+    mcp.run()
+
+
+if __name__ == "__main__":
+    try:
+        from mcp.server.fastmcp import FastMCP
+    except ImportError:
+        # mcp 2.x renamed FastMCP
+        from mcp.server.mcpserver import MCPServer as FastMCP
+    {"playwright": serve_playwright, "search": serve_search}[sys.argv[1]](FakeSettings.from_env())
@@ -0,0 +1,217 @@
+"""
+This script benchmarks JobSearchManager end to end offline, with the scripted model and the
+stub web_search and Playwright MCP servers from scripts/benchmark_fakes.py in place of OpenAI,
+SearxNG and Playwright.
+
+Each concurrency setting runs in a fresh process and reports throughput, screen latency
+percentiles and the peak memory of the process and its MCP server children. Run from the
+repository root:
+
+$ python -m scripts.pipeline_benchmark --jobs 40 --concurrency 1 5 10 --page-latency 1.5 --model-latency 0.8
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from agents import set_tracing_disabled
+from agents.mcp.server import MCPServerStdio
+
+from manager import JobSearchManager
+from job_agents.browser import PlaywrightPool
+from job_agents.metrics import run_metrics
+from job_agents.rate_limiter import configure_rate_limiter, DEFAULT_LIMITS
+from job_agents.stages import parse_stage_timeouts
+from scripts.benchmark_fakes import FakeSettings, Latency, ScriptedProvider, stub_params
+
+
+RESUME_PATH = "example/resume.txt.sample"
+PREFERENCES_PATH = "example/preferences.txt.sample"
+
+
+def _rss_kb(pid: str) -> int:
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def tree_rss_mb(root: int) -> float:
+    """Resident memory of a process and all its descendants, from /proc."""
+    children: Dict[str, list] = {}
+    for pid in filter(str.isdigit, os.listdir("/proc")):
+        try:
+            with open(f"/proc/{pid}/stat", encoding="utf-8") as f:
+                ppid = f.read().rsplit(")", 1)[1].split()[1]
+        except (OSError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(pid)
+    total, stack = 0, [str(root)]
+    while stack:
+        pid = stack.pop()
+        total += _rss_kb(pid)
+        stack.extend(children.get(pid, []))
+    return total / 1024
+
+
+async def sample_peak_memory(peak: dict, interval: float = 0.25) -> None:
+    """Keep the highest memory of this process tree seen so far in peak["mb"]."""
+    while True:
+        peak["mb"] = max(peak["mb"], tree_rss_mb(os.getpid()))
+        await asyncio.sleep(interval)
+
+
+class OfflineManager(JobSearchManager):
+    """JobSearchManager wired to the scripted model and the stub MCP servers."""
+    def __init__(self, settings: FakeSettings, rate_limited: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.settings = settings
+        configure_rate_limiter(DEFAULT_LIMITS if rate_limited else {}, provider=ScriptedProvider(settings))
+        self.pool = PlaywrightPool(size=self.pool.size,
+                                   max_uses=self.pool.max_uses,
+                                   max_age_seconds=self.pool.max_age_seconds,
+                                   params=stub_params("playwright", settings))
+
+    def _search_server(self):
+        return MCPServerStdio(params=stub_params("search", self.settings), client_session_timeout_seconds=60)
+
+
+def run_setting(settings: FakeSettings, options: dict, results: multiprocessing.Queue) -> None:
+    """Run one benchmark setting in this (fresh) process and put its summary on the queue."""
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(levelname)s - %(message)s")
+    set_tracing_disabled(True)
+    rate_limited = options.pop("rate_limited")
+
+    async def run() -> dict:
+        peak = {"mb": 0.0}
+        sampler = asyncio.create_task(sample_peak_memory(peak))
+        manager = OfflineManager(settings,
+                                 rate_limited=rate_limited,
+                                 job_title="software engineer",
+                                 resume_path=RESUME_PATH,
+                                 preferences_path=PREFERENCES_PATH,
+                                 precheck_urls=False,
+                                 seen_index_path=None,
+                                 cache_path=None,
+                                 archive_path=None,
+                                 profile_dir=None,
+                                 **options)
+        start = time.monotonic()
+        try:
+            screens = await manager.run()
+        finally:
+            sampler.cancel()
+        summary = run_metrics.summary()
+        latency = summary["screen_latency"] or {}
+        return {
+            "batch_size": options["batch_size"],
+            "adaptive": options["adaptive_concurrency"],
+            "final_concurrency": manager.concurrency.limit,
+            "screens": len(screens),
+            "successful": sum(1 for s in screens if not s.failed),
+            "wall_seconds": round(time.monotonic() - start, 1),
+            "screens_per_minute": summary["screens_per_minute"],
+            "p50": latency.get("p50"),
+            "p95": latency.get("p95"),
+            "p99": latency.get("p99"),
+            "peak_rss_mb": round(peak["mb"], 1),
+            "stage_p95": {stage: stats["p95"] for stage, stats in summary["stage"].items()},
+        }
+
+    results.put(asyncio.run(run()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the screening pipeline offline against fakes")
+    parser.add_argument("--jobs", type=int, default=30, help="Successful screens per run (the desired count)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 5, 10], help="Batch sizes to compare")
+    parser.add_argument("--adaptive", action="store_true", help="Run with adaptive concurrency starting at each batch size")
+    parser.add_argument("--max-concurrency", type=int, help="Upper bound with --adaptive")
+    parser.add_argument("--screen-mode", choices=["single", "batch"], default="single")
+    parser.add_argument("--model-latency", type=float, default=0.8, help="Median seconds per model call")
+    parser.add_argument("--page-latency", type=float, default=1.5, help="Median seconds per browser_navigate")
+    parser.add_argument("--search-latency", type=float, default=2.0, help="Median seconds per web_search")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Log-normal sigma of every latency (tail weight)")
+    parser.add_argument("--model-error-rate", type=float, default=0.0, help="Share of model calls failing with 429/500")
+    parser.add_argument("--page-error-rate", type=float, default=0.0, help="Share of navigations failing")
+    parser.add_argument("--page-hang-rate", type=float, default=0.0, help="Share of navigations that never return")
+    parser.add_argument("--unreachable-rate", type=float, default=0.0, help="Share of URLs reported unreachable")
+    parser.add_argument("--reject-rate", type=float, default=0.0, help="Share of pages rejected as not a single job")
+    parser.add_argument("--page-chars", type=int, default=20_000, help="Size of each page snapshot")
+    parser.add_argument("--results-per-page", type=int, default=20, help="Search results per page")
+    parser.add_argument("--domains", type=int, default=5, help="Job board hosts the results are spread over")
+    parser.add_argument("--domain-min-interval", type=float, default=0.5,
+                        help="Minimum seconds between requests to one domain")
+    parser.add_argument("--stage-timeout", dest="stage_timeouts", nargs="+", metavar="STAGE=SECONDS",
+                        help="Stage deadline overrides, as in main.py")
+    parser.add_argument("--rate-limits", action="store_true", help="Keep the default per-model rate limits")
+    parser.add_argument("--output", help="File path to write the results as JSON")
+    args = parser.parse_args()
+    try:
+        stage_timeouts = parse_stage_timeouts(args.stage_timeouts)
+    except ValueError as e:
+        parser.error(str(e))
+
+    sigma = args.latency_sigma
+    settings = FakeSettings(
+        model_latency=Latency(args.model_latency, sigma),
+        model_error_rate=args.model_error_rate,
+        page_latency=Latency(args.page_latency, sigma),
+        page_error_rate=args.page_error_rate,
+        page_hang_rate=args.page_hang_rate,
+        page_chars=args.page_chars,
+        unreachable_rate=args.unreachable_rate,
+        reject_rate=args.reject_rate,
+        search_latency=Latency(args.search_latency, sigma),
+        results_per_page=args.results_per_page,
+        domains=args.domains,
+    )
+    for path in (RESUME_PATH, PREFERENCES_PATH):
+        if not Path(path).exists():
+            parser.error(f"{path} not found; run from the repository root")
+
+    # spawn gives every setting a fresh interpreter, so its peak memory is not inflated by the settings before it
+    context = multiprocessing.get_context("spawn")
+    rows = []
+    for batch_size in args.concurrency:
+        options = {
+            "desired_count": args.jobs,
+            "batch_size": batch_size,
+            "adaptive_concurrency": args.adaptive,
+            "max_concurrency": args.max_concurrency,
+            "screen_mode": args.screen_mode,
+            "domain_min_interval": args.domain_min_interval,
+            "stage_timeouts": stage_timeouts,
+            "retry_base_delay": 0.5,
+            "rate_limited": args.rate_limits,
+        }
+        queue = context.Queue()
+        process = context.Process(target=run_setting, args=(settings, options, queue))
+        process.start()
+        row: Optional[dict] = queue.get()
+        process.join()
+        rows.append(row)
+        print(f"batch size {batch_size}: {row['screens_per_minute']} screens/min, p95 {row['p95']}s, "
+              f"peak {row['peak_rss_mb']} MB")
+
+    print(f"\n{'batch':>5} {'final':>5} {'screens':>7} {'ok':>4} {'wall s':>7} {'per min':>8} "
+          f"{'p50 s':>6} {'p95 s':>6} {'p99 s':>6} {'peak MB':>8}")
+    for row in rows:
+        print(f"{row['batch_size']:>5} {row['final_concurrency']:>5} {row['screens']:>7} {row['successful']:>4} "
+              f"{row['wall_seconds']:>7} {row['screens_per_minute']:>8} {row['p50'] or 0:>6.1f} {row['p95'] or 0:>6.1f} "
+              f"{row['p99'] or 0:>6.1f} {row['peak_rss_mb']:>8}")
+    if args.output:
+        Path(args.output).write_text(json.dumps({"settings": settings.to_env(), "runs": rows}, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+This script benchmarks the local pre-screen on a directory of saved job descriptions.
+
+Each .txt file is one job description. Each .json file is a saved JobDescription or
+archived job record. Run from the repository root:
+
+$ python -m scripts.prescreen_benchmark --resume resume.txt --preferences preferences.txt --descriptions saved_jobs/
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+from job_agents.prescreen import PreScreener, DEFAULT_THRESHOLD
+
+
+def load_descriptions(directory: str) -> dict:
+    """Return the job description text of every .txt and .json file in the directory, keyed by file name."""
+    descriptions = {}
+    for path in sorted(Path(directory).iterdir()):
+        if path.suffix == ".txt":
+            descriptions[path.name] = path.read_text(encoding="utf-8")
+        elif path.suffix == ".json":
+            data = json.loads(path.read_text(encoding="utf-8"))
+            descriptions[path.name] = f"{data.get('title', '')}\n{data['job_description']}"
+    return descriptions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the local pre-screen")
+    parser.add_argument("--resume", required=True, help="File path to resume")
+    parser.add_argument("--preferences", required=True, help="File path to preferences")
+    parser.add_argument("--descriptions", required=True, help="Directory of saved job descriptions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Minimum resume similarity to pass")
+    args = parser.parse_args()
+
+    descriptions = load_descriptions(args.descriptions)
+    if not descriptions:
+        print(f"No .txt or .json job descriptions found in {args.descriptions}")
+        return
+    screener = PreScreener(Path(args.resume).read_text(encoding="utf-8"),
+                           Path(args.preferences).read_text(encoding="utf-8"),
+                           threshold=args.threshold)
+    print(f"Parsed rules: {screener.rules}")
+
+    start = time.perf_counter()
+    results = {name: screener.screen(text) for name, text in descriptions.items()}
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{'='*60}")
+    for name, result in sorted(results.items(), key=lambda item: item[1].score, reverse=True):
+        status = "PASS" if result.passed else "REJECT"
+        print(f"{result.score:.3f}  {status:6}  {name}: {result.reason}")
+    print('='*60)
+
+    passed = sum(r.passed for r in results.values())
+    print(f"Jobs screened:    {len(results)}")
+    print(f"Passed:           {passed}")
+    print(f"Rejected:         {len(results) - passed}")
+    print(f"Time per job:     {elapsed / len(results) * 1000:.2f} ms")
+
+    # Pass counts at other thresholds, for tuning
+    rule_passes = [result.score for name, result in results.items()
+                   if screener.rules.violation(descriptions[name]) is None]
+    print("\nThreshold sweep (jobs passing the rules and threshold):")
+    for threshold in (0.02, 0.05, 0.1, 0.15, 0.2, 0.3):
+        print(f"    {threshold:.2f}: {sum(score >= threshold for score in rule_passes)}")
+
+
+if __name__ == "__main__":
+    main()
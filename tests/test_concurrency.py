@@ -0,0 +1,85 @@
+import asyncio
+
+from job_agents.concurrency import ConcurrencyController
+from job_agents.context import JobScreenContext, SummaryAgentOutput
+from job_agents.stages import StageTimeout
+from manager import JobSearchManager
+
+
+def test_limit_grows_after_a_healthy_streak():
+    controller = ConcurrencyController(initial=3, maximum=5)
+    for _ in range(3):
+        controller.record(10, False)
+    assert controller.limit == 4
+    assert controller.changes[0][:2] == (3, 4)
+
+
+def test_slow_and_instant_screens_do_not_grow_limit():
+    controller = ConcurrencyController(initial=2, maximum=5)
+    controller.record(10, False)
+    controller.record(30, False)
+    controller.record(0.1, False)
+    assert controller.limit == 2
+
+
+def test_rate_limit_halves_limit_once_per_cooldown():
+    controller = ConcurrencyController(initial=8, maximum=10, cooldown=30)
+    controller.record(5, True, "Error code: 429 - Rate limit reached")
+    controller.record(5, True, "Error code: 429 - Rate limit reached")
+    assert controller.limit == 4
+    assert controller.changes == [(8, 4, "rate limited (429)")]
+
+
+def test_limit_stays_within_bounds():
+    controller = ConcurrencyController(initial=2, minimum=2, maximum=3, cooldown=0)
+    controller.record(5, True, "TimeoutError")
+    assert controller.limit == 2
+    for _ in range(10):
+        controller.record(10, False)
+    assert controller.limit == 3
+
+
+def test_other_failures_and_fixed_limit_leave_limit():
+    controller = ConcurrencyController(initial=8, maximum=10)
+    controller.record(5, True, "404 Not Found")
+    assert controller.limit == 8
+    fixed = ConcurrencyController(initial=5, minimum=5, maximum=5)
+    fixed.record(5, True, "Error code: 429")
+    assert fixed.limit == 5
+
+
+def test_browser_stage_timeout_lowers_limit():
+    controller = ConcurrencyController(initial=8, maximum=10)
+    controller.record(45, True, str(StageTimeout("inspect", 45)))
+    assert controller.limit == 4
+
+
+def test_screen_stage_timeout_leaves_limit():
+    controller = ConcurrencyController(initial=8, maximum=10)
+    controller.record(60, True, str(StageTimeout("screen", 60)))
+    assert controller.limit == 8
+
+
+def test_retried_stage_timeout_lowers_limit():
+    manager = JobSearchManager(job_title="software engineer",
+                               resume_path="example/resume.txt.sample",
+                               preferences_path="example/preferences.txt.sample",
+                               batch_size=8,
+                               adaptive_concurrency=True,
+                               cache_path=None,
+                               archive_path=None,
+                               retry_base_delay=0)
+    url = "https://boards.greenhouse.io/example/jobs/1"
+    attempts = []
+
+    async def run_stages(url, context):
+        attempts.append(url)
+        if len(attempts) == 1:
+            raise StageTimeout("extract", 60)
+        return SummaryAgentOutput(url=url, company="Example", title="Engineer", fit_score=4, reason="Good fit")
+
+    manager._run_stages = run_stages
+    output = asyncio.run(manager._screen_with_retries(url, JobScreenContext()))
+    assert not output.failed
+    assert len(attempts) == 2
+    assert manager.concurrency.limit == 4
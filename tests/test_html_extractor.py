@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from job_agents.html_extractor import parse_job_html, _job_posting_from_json_ld
+
+
+PAGES = Path(__file__).parent / "pages"
+
+
+def parse(name: str, url: str):
+    return parse_job_html((PAGES / name).read_text(encoding="utf-8"), url)
+
+
+def test_greenhouse_layout():
+    job = parse("greenhouse.html", "https://job-boards.greenhouse.io/acmerobotics/jobs/4012345?gh_jid=4012345")
+    assert (job.company, job.title) == ("Acme Robotics", "Senior Backend Engineer")
+    assert "Own the job scheduling API end to end" in job.job_description
+    assert "Experience with PostgreSQL, Kafka and Kubernetes" in job.job_description
+    assert "equal opportunity" not in job.job_description
+    assert "Submit application" not in job.job_description
+
+
+def test_lever_json_ld_with_list_type():
+    job = parse("lever.html", "https://jobs.lever.co/globex/0b1e2c3d-4e5f-6a7b-8c9d-0e1f2a3b4c5d")
+    assert (job.company, job.title) == ("Globex", "Machine Learning Engineer")
+    assert "Build feature pipelines on Spark and Airflow" in job.job_description
+    assert "<li>" not in job.job_description
+
+
+def test_ashby_layout_without_job_posting_json_ld():
+    job = parse("ashby.html", "https://jobs.ashbyhq.com/initech/0b1e2c3d-4e5f-6a7b-8c9d-0e1f2a3b4c5d")
+    assert (job.company, job.title) == ("Initech", "Data Platform Engineer")
+    assert "Own data quality checks, lineage and the on-call rotation" in job.job_description
+    assert "reasonable accommodation" not in job.job_description
+
+
+def test_non_object_json_ld_is_skipped():
+    assert _job_posting_from_json_ld(['"a string"', "42", "null", '{"@graph": {"@type": "JobPosting"}}']) == {
+        "@type": "JobPosting"}
+
+
+def test_javascript_shell_returns_none():
+    shell = '<html><head><title>Jobs</title></head><body><div id="root"></div><script>render()</script></body></html>'
+    assert parse_job_html(shell, "https://jobs.ashbyhq.com/initech/0b1e2c3d-4e5f-6a7b-8c9d-0e1f2a3b4c5d") is None
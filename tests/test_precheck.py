@@ -0,0 +1,42 @@
+import asyncio
+
+import httpx
+
+from job_agents.checker import configure_reachability_checker
+from job_agents.url_queue import UrlQueue
+from manager import JobSearchManager
+
+
+FAST = "https://fast.example.com/jobs/1"
+SLOW = "https://slow.example.com/jobs/2"
+GONE = "https://gone.example.com/jobs/3"
+
+
+async def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.host == "slow.example.com":
+        await asyncio.sleep(1)
+    return httpx.Response(404 if request.url.host == "gone.example.com" else 200)
+
+
+def test_urls_are_queued_as_their_checks_pass():
+    manager = JobSearchManager(job_title="software engineer",
+                               resume_path="example/resume.txt.sample",
+                               preferences_path="example/preferences.txt.sample",
+                               cache_path=None,
+                               archive_path=None,
+                               domain_min_interval=0)
+    checker = configure_reachability_checker()
+    checker._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def run():
+        queue = UrlQueue()
+        filling = asyncio.create_task(manager._queue_urls(queue, [SLOW, FAST, GONE]))
+        first = await asyncio.wait_for(queue.get(), timeout=0.5)
+        assert not filling.done()
+        await filling
+        await checker.aclose()
+        return first, await queue.get()
+
+    first, second = asyncio.run(run())
+    assert (first, second) == (FAST, SLOW)
+    assert [failure.url for failure in manager.precheck_failures] == [GONE]
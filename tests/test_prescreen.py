@@ -0,0 +1,26 @@
+from job_agents.prescreen import PreScreener
+
+
+RESUME = "Python engineer building data pipelines with Spark and Airflow"
+DESCRIPTION = "We need a Python engineer to own our Spark data pipelines and on-call rotation"
+
+
+def test_resume_is_not_in_the_corpus():
+    screener = PreScreener(RESUME, "")
+    assert screener.docs == 0
+    assert screener.df.sum() == 0
+    screener.screen(DESCRIPTION)
+    assert screener.docs == 1
+    assert screener.df.max() == 1
+
+
+def test_rescreening_a_job_counts_it_once():
+    screener = PreScreener(RESUME, "")
+    first = screener.screen(DESCRIPTION, "greenhouse:1")
+    df = screener.df.copy()
+    second = screener.screen(DESCRIPTION, "greenhouse:1")
+    assert screener.docs == 1
+    assert (screener.df == df).all()
+    assert second.score == first.score
+    screener.screen(DESCRIPTION, "greenhouse:2")
+    assert screener.docs == 2
@@ -0,0 +1,44 @@
+import argparse
+import asyncio
+
+import pytest
+from agents import Agent, Runner, set_tracing_disabled
+from pydantic import BaseModel
+
+from job_agents.rate_limiter import configure_rate_limiter, limited_run_config
+from main import parse_rate_limits
+from scripts.benchmark_fakes import FakeSettings, Latency, ScriptedProvider
+
+
+class Answer(BaseModel):
+    name: str
+
+
+def test_streamed_call_settles_reported_usage():
+    set_tracing_disabled(True)
+    limiter = configure_rate_limiter({"gpt-4.1": (500, 30_000)},
+                                     provider=ScriptedProvider(FakeSettings(model_latency=Latency(0.01))))
+    agent = Agent(name="Streamer", instructions="Answer.", output_type=Answer, model="gpt-4.1")
+
+    async def run():
+        result = Runner.run_streamed(agent, "go", run_config=limited_run_config())
+        async for _ in result.stream_events():
+            pass
+        return result
+
+    result = asyncio.run(run())
+    budget = limiter.budgets["gpt-4.1"]
+    assert budget.actual_tokens == result.raw_responses[0].usage.total_tokens
+    assert budget.actual_tokens < budget.estimated_tokens
+    configure_rate_limiter()
+
+
+@pytest.mark.parametrize("spec", ["gpt-4.1=500", "gpt-4.1=abc:1", "=500:1000", "gpt-4.1=0:1000"])
+def test_malformed_rate_limit_is_rejected(spec):
+    with pytest.raises(ValueError):
+        parse_rate_limits(argparse.Namespace(rate_limit=True, rate_limits=[spec]))
+
+
+def test_rate_limit_overrides_default():
+    limits = parse_rate_limits(argparse.Namespace(rate_limit=True, rate_limits=["gpt-4.1=500:1000"]))
+    assert limits["gpt-4.1"] == (500, 1000)
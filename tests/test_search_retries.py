@@ -0,0 +1,71 @@
+import asyncio
+
+from job_agents.searcher import SearchResults
+from job_agents.url_queue import UrlQueue
+from manager import JobSearchManager
+
+
+def make_manager() -> JobSearchManager:
+    return JobSearchManager(job_title="software engineer",
+                            resume_path="example/resume.txt.sample",
+                            preferences_path="example/preferences.txt.sample",
+                            cache_path=None,
+                            archive_path=None,
+                            seen_index_path=None,
+                            precheck_urls=False,
+                            retry_base_delay=0)
+
+
+def page_of(pageno: int, urls):
+    return SearchResults(retrieved_date="2026-01-01", pageno=pageno, query="software engineer", job_urls=urls)
+
+
+async def drain(queue: UrlQueue):
+    urls = []
+    while (url := await queue.get()) is not None:
+        urls.append(url)
+    return urls
+
+
+def test_transient_search_failure_is_retried():
+    manager = make_manager()
+    calls = []
+
+    async def search_page(server, pageno=1):
+        calls.append(pageno)
+        if calls == [1]:
+            raise RuntimeError("Error code: 503 - Service Unavailable")
+        if pageno == 1:
+            return page_of(1, ["https://boards.greenhouse.io/acme/jobs/1?gh_jid=1"])
+        return page_of(pageno, [])
+
+    manager.search_page = search_page
+
+    async def run():
+        queue = UrlQueue()
+        producer = asyncio.create_task(manager._search_producer(None, queue))
+        urls = await drain(queue)
+        await producer
+        return urls
+
+    assert asyncio.run(run()) == ["https://boards.greenhouse.io/acme/jobs/1?gh_jid=1"]
+    assert calls == [1, 1, 2]
+
+
+def test_permanent_search_failure_closes_queue():
+    manager = make_manager()
+    calls = []
+
+    async def search_page(server, pageno=1):
+        calls.append(pageno)
+        raise RuntimeError("Error code: 404 - Not Found")
+
+    manager.search_page = search_page
+
+    async def run():
+        queue = UrlQueue()
+        await manager._search_producer(None, queue)
+        return queue.closed
+
+    assert asyncio.run(run())
+    assert calls == [1]
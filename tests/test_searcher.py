@@ -0,0 +1,66 @@
+import asyncio
+import json
+
+import httpx
+
+from job_agents.searcher import JOB_URL_PATTERNS, SearxngSearcher, filter_job_urls, normalize_job_url
+
+
+GREENHOUSE = "https://boards.greenhouse.io/acme/jobs/123?gh_jid=123"
+LEVER = "https://jobs.lever.co/acme/0b1e2c3d-4e5f-6a7b-8c9d-0e1f2a3b4c5d"
+ASHBY = "https://jobs.ashbyhq.com/acme/0b1e2c3d-4e5f-6a7b-8c9d-0e1f2a3b4c5d"
+WORKDAY = "https://acme.wd5.myworkdayjobs.com/en-US/Careers/job/Remote/Software-Engineer_R123"
+
+
+def test_normalize_drops_fragment_and_tracking():
+    assert normalize_job_url(f" {GREENHOUSE}&utm_source=x&gh_src=abc#apply ") == GREENHOUSE
+    assert normalize_job_url(f"{LEVER}?lever-source=LinkedIn") == LEVER
+    assert normalize_job_url(f"{WORKDAY}?source=LinkedIn") == WORKDAY
+
+
+def test_filter_per_ats_pattern():
+    urls = [GREENHOUSE, LEVER, ASHBY, WORKDAY,
+            "https://boards.greenhouse.io/acme",
+            "https://jobs.lever.co/acme",
+            "https://acme.wd5.myworkdayjobs.com/en-US/Careers"]
+    for name, expected in [("greenhouse", GREENHOUSE), ("lever", LEVER), ("ashby", ASHBY), ("workday", WORKDAY)]:
+        assert filter_job_urls(urls, [JOB_URL_PATTERNS[name]]) == [expected]
+
+
+def test_filter_dedupes_tracking_variants_in_order():
+    urls = [f"{LEVER}?lever-source=LinkedIn", f"{WORKDAY}?source=Indeed", LEVER, f"{WORKDAY}#top"]
+    patterns = [JOB_URL_PATTERNS["lever"], JOB_URL_PATTERNS["workday"]]
+    assert filter_job_urls(urls, patterns) == [LEVER, WORKDAY]
+
+
+def test_search_against_stub_searxng():
+    requests = []
+    results = {
+        "gh_jid": [{"url": f"{GREENHOUSE}&utm_medium=search", "title": "Engineer", "content": "Python"},
+                   {"url": "https://example.com/blog", "title": "Blog", "content": ""}],
+        "site:jobs.lever.co": [{"url": f"{LEVER}?lever-source=LinkedIn", "title": "Backend", "content": "Go"},
+                               {"url": LEVER, "title": "Backend (dupe)", "content": ""},
+                               {"title": "No URL"}],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/search"
+        assert request.url.params["format"] == "json"
+        requests.append(request.url.params["q"])
+        term = request.url.params["q"].removeprefix("software engineer ")
+        return httpx.Response(200, text=json.dumps({"results": results[term]}))
+
+    async def search():
+        searcher = SearxngSearcher("http://searxng.test/", patterns=["greenhouse", "lever"],
+                                   transport=httpx.MockTransport(handler))
+        try:
+            return await searcher.search("software engineer", pageno=2)
+        finally:
+            await searcher.aclose()
+
+    found = asyncio.run(search())
+    assert sorted(requests) == ["software engineer gh_jid", "software engineer site:jobs.lever.co"]
+    assert found.pageno == 2
+    assert found.job_urls == [GREENHOUSE, LEVER]
+    assert [(hit.url, hit.title, hit.snippet) for hit in found.hits] == [
+        (GREENHOUSE, "Engineer", "Python"), (LEVER, "Backend", "Go")]
@@ -0,0 +1,31 @@
+from job_agents.snapshot import shrink_snapshot
+
+
+SNAPSHOT = """\
+- banner [ref=e1]:
+  - link "Careers" [ref=e2]
+- main [ref=e3]:
+  - link "Apply now" [ref=e4]
+  - heading "Responsibilities" [level=2] [ref=e5]
+  - list [ref=e6]:
+    - listitem [ref=e7]: Write production Python every day
+    - listitem [ref=e8]: Review pull requests
+    - listitem [ref=e9]: Review pull requests
+  - heading "Requirements" [level=2] [ref=e10]
+  - list [ref=e11]:
+    - listitem [ref=e12]: Write production Python every day
+  - link "Apply now" [ref=e13]
+"""
+
+
+def test_bullet_under_two_headings_is_kept():
+    shrunk = shrink_snapshot(SNAPSHOT)
+    assert shrunk.count("Write production Python every day") == 2
+    assert shrunk.count("Review pull requests") == 1
+
+
+def test_repeated_links_and_pruned_roles_are_dropped():
+    shrunk = shrink_snapshot(SNAPSHOT)
+    assert shrunk.count('link "Apply now"') == 1
+    assert "Careers" not in shrunk
+    assert "[ref=" not in shrunk
@@ -0,0 +1,38 @@
+import httpx
+import pytest
+
+from job_agents.stages import StageTimeout, is_transient
+
+
+@pytest.mark.parametrize("error", [
+    "Error code: 503 - Service Unavailable",
+    "Error code: 429 - Rate limit reached for gpt-4.1",
+    "Status code: 502",
+    "status_code=500",
+    "Server error '504 Gateway Timeout' for url 'https://boards.greenhouse.io/acme'",
+    "HTTP 500",
+    "Connection reset by peer",
+    "Page timed out at https://example.com/jobs/404/",
+    StageTimeout("extract", 60),
+])
+def test_transient(error):
+    assert is_transient(error)
+
+
+@pytest.mark.parametrize("error", [
+    "Unable to parse https://boards.greenhouse.io/acme/jobs/512/ as a job posting",
+    "Unexpected page at https://jobs.example.com/careers?gh_jid=503",
+    "Status code: 404",
+    "Client error '410 Gone' for url 'https://jobs.lever.co/acme/1'",
+    "The page is not a single job posting",
+    None,
+])
+def test_permanent(error):
+    assert not is_transient(error)
+
+
+def test_status_code_attribute():
+    request = httpx.Request("GET", "https://example.com/jobs/404")
+    error = httpx.HTTPStatusError("failed", request=request, response=httpx.Response(503, request=request))
+    error.status_code = 503
+    assert is_transient(error)